@@ -0,0 +1,208 @@
+# benchmark.py
+# 맵 크기/식물 밀도/계절별 시나리오로 cycle당 비용을 재현 가능하게 측정하고 결과를 JSON으로 출력하는 벤치마크
+# 사용 예: python -m benchmark --output bench.json
+#         python -m benchmark --suite full --scenario large_summer
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # 렌더링 단계 측정용 (창을 띄우지 않음)
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import platform
+import random
+import subprocess
+import sys
+import time
+
+try:
+    import resource # 최대 메모리 사용량 측정 (Unix 전용)
+except ImportError:
+    resource = None
+
+import numpy as np
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE
+from map_manager import MapManager
+from plant import Plant
+from profiler import RENDER_PHASES
+from simulation import CYCLE_PHASES, create_simulation, perform_simulation_cycle
+from simulation_config import SimulationConfig
+from time_manager import Season
+
+
+# 시나리오: 맵 크기, 초기 식물 밀도, 측정 시작 계절(해당 계절 첫날까지 미리 진행), 측정 cycle 수, 엔진, 렌더링 측정 여부
+# density가 None이면 config.py의 INITIAL_PLANT_DENSITY를 사용
+SCENARIOS = {
+    "default_summer": dict(width=100, height=81, density=None, season="SUMMER", cycles=200, engines=("sprite", "vectorized"), render=True),
+    "default_winter": dict(width=100, height=81, density=None, season="WINTER", cycles=200, engines=("sprite", "vectorized"), render=True),
+    "default_dense_summer": dict(width=100, height=81, density=0.2, season="SUMMER", cycles=100, engines=("sprite", "vectorized"), render=True),
+    "medium_summer": dict(width=500, height=400, density=None, season="SUMMER", cycles=50, engines=("sprite", "vectorized"), render=False),
+    "medium_dense_summer": dict(width=500, height=400, density=0.2, season="SUMMER", cycles=20, engines=("vectorized",), render=False),
+    "large_summer": dict(width=1000, height=1000, density=0.005, season="SUMMER", cycles=20, engines=("vectorized",), render=False),
+    "large_winter": dict(width=1000, height=1000, density=0.005, season="WINTER", cycles=20, engines=("vectorized",), render=False),
+    "huge_summer": dict(width=2000, height=2000, density=0.002, season="SUMMER", cycles=10, engines=("vectorized",), render=False),
+}
+SUITES = {
+    "quick": ("default_summer", "default_winter", "default_dense_summer"),
+    "full": tuple(SCENARIOS),
+}
+DEFAULT_SEED = 12345
+
+def scenario_cases(names, engines=None):
+    """(시나리오 이름, 엔진) 측정 목록을 반환합니다. engines를 주면 그 엔진만 측정합니다."""
+    cases = []
+    for name in names:
+        for engine in SCENARIOS[name]["engines"]:
+            if engines is None or engine in engines:
+                cases.append((name, engine))
+    return cases
+
+def _warm_up_to_season(time_manager, climate_manager, map_manager, plants, season):
+    """측정 시작 계절의 첫날이 될 때까지 시뮬레이션을 진행하고 진행한 cycle 수를 반환합니다."""
+    warmup_cycles = 0
+    while time_manager.current_season != season or time_manager.current_year != 1:
+        perform_simulation_cycle(time_manager, climate_manager, map_manager, plants)
+        warmup_cycles += 1
+    return warmup_cycles
+
+def _peak_memory_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # macOS는 바이트, Linux는 KB
+
+def run_case(name, engine, seed=DEFAULT_SEED, cycles=None):
+    """한 시나리오를 주어진 엔진으로 측정하고 결과 사전을 반환합니다. 같은 시드에서는 항상 같은 시뮬레이션을 진행합니다."""
+    scenario = SCENARIOS[name]
+    cycles = cycles if cycles is not None else scenario["cycles"]
+    overrides = {} if scenario["density"] is None else {"INITIAL_PLANT_DENSITY": scenario["density"]}
+
+    random.seed(seed)
+    np.random.seed(seed)
+    render = scenario["render"] and engine == "sprite" # 화면 그리기는 sprite 엔진 경로만 존재
+    Plant.visuals_enabled = render
+    MapManager.terrain_cache_dir = None # 설정 시간에 지형 생성 비용이 항상 포함되도록
+
+    setup_start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr): # 맵 초기화 메시지가 JSON 출력에 섞이지 않도록
+        time_manager, climate_manager, map_manager, plants = create_simulation(
+            scenario["width"], scenario["height"], engine=engine, sim_config=SimulationConfig(overrides))
+    setup_seconds = time.perf_counter() - setup_start
+
+    warmup_start = time.perf_counter()
+    warmup_cycles = _warm_up_to_season(time_manager, climate_manager, map_manager, plants, Season[scenario["season"]])
+    warmup_seconds = time.perf_counter() - warmup_start
+
+    if render:
+        from visualization import draw_grid, draw_plants, draw_info_panel
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        game_surface = pygame.Surface((scenario["width"] * GRID_SIZE, scenario["height"] * GRID_SIZE))
+
+    plants_at_start = map_manager.stats.total_plants
+    timings = {phase: 0.0 for phase in CYCLE_PHASES + (RENDER_PHASES if render else ())}
+    run_start = time.perf_counter()
+    for _ in range(cycles):
+        perform_simulation_cycle(time_manager, climate_manager, map_manager, plants, timings)
+        if render:
+            phase_start = time.perf_counter()
+            draw_grid(game_surface, map_manager)
+            now = time.perf_counter(); timings["draw_grid"] += now - phase_start; phase_start = now
+            draw_plants(game_surface, plants)
+            screen.blit(game_surface, (0, 0))
+            now = time.perf_counter(); timings["draw_plants"] += now - phase_start; phase_start = now
+            draw_info_panel(screen, time_manager, climate_manager, plants, map_manager)
+            timings["draw_info_panel"] += time.perf_counter() - phase_start
+    run_seconds = time.perf_counter() - run_start
+
+    stats = map_manager.stats
+    return {
+        "scenario": name,
+        "engine": engine,
+        "seed": seed,
+        "width": scenario["width"],
+        "height": scenario["height"],
+        "cells": scenario["width"] * scenario["height"],
+        "density": scenario["density"],
+        "season": scenario["season"],
+        "cycles": cycles,
+        "setup_seconds": setup_seconds,
+        "warmup_cycles": warmup_cycles,
+        "warmup_seconds": warmup_seconds,
+        "run_seconds": run_seconds,
+        "cycles_per_second": cycles / run_seconds if run_seconds > 0 else None,
+        "phases_ms_per_cycle": {phase: seconds * 1000.0 / cycles for phase, seconds in timings.items()} if cycles else {},
+        "peak_memory_mb": _peak_memory_mb(),
+        "plants_at_start": plants_at_start,
+        # 버전 간 비교 시 결과가 같은지(동작이 바뀌지 않았는지) 확인용
+        "result": {
+            "date": time_manager.get_current_date_str(),
+            "total_plants": stats.total_plants,
+            "plant_counts": {state.value: count for state, count in stats.plant_counts.items()},
+            "biomass": stats.biomass,
+            "avg_soil_water": stats.average_soil_water_level(),
+        },
+    }
+
+def environment_info():
+    """결과 비교를 위해 실행 환경(파이썬/라이브러리 버전, 커밋)을 기록합니다."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+def run_benchmarks(cases, seed=DEFAULT_SEED, cycles=None, isolate=True, progress=True):
+    """측정 목록을 차례로 실행합니다. isolate이면 시나리오마다 새 프로세스에서 실행하여
+       캐시/메모리 사용량이 서로 섞이지 않게 합니다 (최대 메모리는 프로세스 단위로 측정).
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for name, engine in cases:
+        if isolate:
+            with context.Pool(1) as pool:
+                result = pool.apply(run_case, (name, engine, seed, cycles))
+        else:
+            result = run_case(name, engine, seed, cycles)
+        results.append(result)
+        if progress:
+            phases = ", ".join(f"{phase}={ms:.2f}" for phase, ms in result["phases_ms_per_cycle"].items())
+            print(f"{name} [{engine}]: {result['cycles_per_second']:.1f} cycles/s (ms/cycle: {phases}), "
+                  f"setup {result['setup_seconds']:.2f}s, peak {result['peak_memory_mb'] or 0:.0f}MB", file=sys.stderr)
+    return {"environment": environment_info(), "seed": seed, "results": results}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark per-cycle simulation cost across map sizes and densities")
+    parser.add_argument("--suite", choices=tuple(SUITES), default="quick", help="실행할 시나리오 묶음")
+    parser.add_argument("--scenario", action="append", choices=tuple(SCENARIOS), help="특정 시나리오만 실행 (여러 번 지정 가능)")
+    parser.add_argument("--engine", action="append", help="특정 엔진만 측정 (sprite, vectorized)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="난수 시드 (모든 시나리오에 동일하게 적용)")
+    parser.add_argument("--cycles", type=int, default=None, help="측정 cycle 수 (기본: 시나리오별 값)")
+    parser.add_argument("--no-isolate", action="store_true", help="시나리오를 별도 프로세스 없이 현재 프로세스에서 실행")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = scenario_cases(args.scenario or SUITES[args.suite], args.engine)
+    report = run_benchmarks(cases, seed=args.seed, cycles=args.cycles, isolate=not args.no_isolate)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Wrote {len(report['results'])} results to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main()
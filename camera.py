@@ -0,0 +1,74 @@
+# camera.py
+# 화면보다 큰 맵을 보기 위한 뷰포트 카메라: 보이는 셀 범위 계산, 화면 <-> 셀 좌표 변환, 이동과 확대/축소
+import math
+
+from config import CAMERA_ZOOM_LEVELS, GRID_SIZE
+
+class Camera:
+    """맵의 (x, y) 셀(실수, 왼쪽 위)부터 view_width x view_height 픽셀 영역에 셀당 cell_pixels 픽셀로 보여 줍니다.
+       cell_pixels가 1보다 작으면 block x block 셀을 한 픽셀로 묶어 그립니다 (block = 1 / cell_pixels).
+    """
+    def __init__(self, world_width, world_height, view_width, view_height, cell_pixels=GRID_SIZE):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.view_width = view_width
+        self.view_height = view_height
+        self.zoom_index = CAMERA_ZOOM_LEVELS.index(cell_pixels)
+        self.x = 0.0
+        self.y = 0.0
+
+    @property
+    def cell_pixels(self):
+        return CAMERA_ZOOM_LEVELS[self.zoom_index]
+
+    @property
+    def block(self):
+        """한 픽셀로 묶어 그리는 셀 수 (가로/세로, 확대 배율이 1 이상이면 1)."""
+        return max(1, round(1 / self.cell_pixels))
+
+    def visible_cells(self):
+        """화면에 보이는 셀 범위 (x0, y0, x1, y1, block)를 반환합니다 (x1, y1 제외, 맵 경계로 잘림).
+           block > 1이면 x0, y0는 block 배수로 내림합니다 (묶음 경계가 카메라 이동에 따라 흔들리지 않도록).
+        """
+        block = self.block
+        x0 = int(self.x) // block * block
+        y0 = int(self.y) // block * block
+        x1 = min(self.world_width, math.ceil(self.x + self.view_width / self.cell_pixels))
+        y1 = min(self.world_height, math.ceil(self.y + self.view_height / self.cell_pixels))
+        return x0, y0, x1, y1, block
+
+    def screen_to_cell(self, px, py):
+        """화면 좌표(뷰 영역 기준)의 셀 좌표를 반환합니다 (맵 밖이면 None)."""
+        cell_x = math.floor(self.x + px / self.cell_pixels)
+        cell_y = math.floor(self.y + py / self.cell_pixels)
+        if 0 <= cell_x < self.world_width and 0 <= cell_y < self.world_height:
+            return cell_x, cell_y
+        return None
+
+    def cell_to_screen(self, cell_x, cell_y):
+        """셀 왼쪽 위 모서리의 화면 좌표(실수)를 반환합니다."""
+        return (cell_x - self.x) * self.cell_pixels, (cell_y - self.y) * self.cell_pixels
+
+    def pan(self, dx, dy):
+        """화면 픽셀 단위로 (dx, dy)만큼 끌어 옮깁니다 (끄는 방향으로 맵이 움직임)."""
+        self.x -= dx / self.cell_pixels
+        self.y -= dy / self.cell_pixels
+        self._clamp()
+
+    def zoom(self, steps, anchor=None):
+        """확대 단계를 steps만큼 바꿉니다. anchor(화면 좌표) 아래의 지점은 그대로 유지합니다."""
+        zoom_index = min(max(self.zoom_index + steps, 0), len(CAMERA_ZOOM_LEVELS) - 1)
+        if zoom_index == self.zoom_index:
+            return
+        anchor_x, anchor_y = anchor if anchor else (self.view_width / 2, self.view_height / 2)
+        world_x = self.x + anchor_x / self.cell_pixels
+        world_y = self.y + anchor_y / self.cell_pixels
+        self.zoom_index = zoom_index
+        self.x = world_x - anchor_x / self.cell_pixels
+        self.y = world_y - anchor_y / self.cell_pixels
+        self._clamp()
+
+    def _clamp(self):
+        """맵 밖을 너무 많이 보여 주지 않도록 위치를 제한합니다 (맵이 화면보다 작으면 왼쪽 위에 붙임)."""
+        self.x = min(max(self.x, 0.0), max(0.0, self.world_width - self.view_width / self.cell_pixels))
+        self.y = min(max(self.y, 0.0), max(0.0, self.world_height - self.view_height / self.cell_pixels))
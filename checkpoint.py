@@ -0,0 +1,198 @@
+# checkpoint.py
+# 시뮬레이션 전체 상태를 디렉터리 하나에 열(column) 단위 .npy 배열 + meta.json으로 저장하고 복원합니다.
+# 격자/식물 배열은 메모리 매핑(copy-on-write)으로 열기 때문에 큰 맵도 읽기 비용 없이 바로 복원됩니다.
+#
+# 체크포인트 디렉터리 구성
+#   meta.json            형식 버전, 맵 크기, 엔진, 시간/기후/통계 값, 실행 설정, 종 특성, 난수 상태 일부
+#   grid_<이름>.npy       SoilField 배열 (SOIL_FIELD_ARRAYS) + SOIL/WATER 셀 인덱스 + 잠든 청크 묶음/묶음 변환
+#   plants_<이름>.npy     식물 열 배열 (PLANT_FIELDS, 행 순서 = 갱신 순서)
+#   rng_state.npy        random 모듈 Mersenne Twister 내부 상태 (uint32)
+#   climate_<이름>.npy    기후 일정표 배열 (SCHEDULE_ARRAYS, 일정표를 쓰는 실행만)
+import ast
+import json
+import os
+import random
+import shutil
+
+import numpy as np
+import pygame
+
+from climate import ClimateManager
+from climate_schedule import ClimateSchedule, SCHEDULE_ARRAYS
+from map_manager import MapManager
+from plant import Plant, PlantState, DeathCause
+from plant_population import PlantPopulation, PLANT_FIELDS, PLANT_STATES_BY_CODE, PLANT_STATE_CODES
+from simulation_config import SimulationConfig
+from soil import SoilField, SOIL_FIELD_ARRAYS
+from time_manager import TimeManager
+
+CHECKPOINT_FORMAT_VERSION = 3
+TIME_MANAGER_FIELDS = ("current_cycle_in_day", "current_day_in_season", "current_season_index", "current_year", "total_cycles_elapsed")
+CLIMATE_MANAGER_FIELDS = ("current_yearly_temp_offset", "current_yearly_rainfall_multiplier", "current_daily_temperature",
+                          "current_daily_rain", "last_rainfall_info")
+GRID_INDEX_ARRAYS = ("soil_cell_index", "water_cell_index")
+GRID_SLEEP_ARRAYS = ("chunk_group", "group_transform")
+
+def _sprite_plant_columns(plant_group, map_manager):
+    """Plant sprite 그룹을 PLANT_FIELDS 열 배열로 바꿉니다. plant_id는 그룹 순서대로 1부터 다시 매깁니다."""
+    plants = plant_group.sprites()
+    species_list, species_index = [], {}
+    current_cycle = map_manager.current_cycle()
+    for plant in plants:
+        plant.sync_dormant_state(current_cycle) # 잠든 씨앗의 나이와 건강/자원을 저장 시점으로 맞춤
+        if id(plant.species_data) not in species_index:
+            species_index[id(plant.species_data)] = len(species_list)
+            species_list.append(plant.species_data)
+    values = {
+        "plant_id": range(1, len(plants) + 1),
+        "grid_x": [plant.grid_x for plant in plants],
+        "grid_y": [plant.grid_y for plant in plants],
+        "species": [species_index[id(plant.species_data)] for plant in plants],
+        "state": [PLANT_STATE_CODES[plant.current_state] for plant in plants],
+        "age": [plant.age for plant in plants],
+        "health": [plant.health for plant in plants],
+        "size": [plant.current_size for plant in plants],
+        "adult_max_size": [plant.adult_max_size_actual for plant in plants],
+        "energy": [plant.current_energy for plant in plants],
+        "max_energy": [plant.max_energy_capacity for plant in plants],
+        "water": [plant.current_water for plant in plants],
+        "max_water": [plant.max_water_capacity for plant in plants],
+        "cooldown": [plant.reproduction_cooldown for plant in plants],
+        "death_cycle": [plant.death_cycle for plant in plants],
+    }
+    columns = {name: np.fromiter(values[name], dtype=dtype, count=len(plants)) for name, dtype in PLANT_FIELDS}
+    # 격자의 plant_id는 sprite에서는 id(plant)이므로 새 번호로 바꿔서 저장
+    plant_id_grid = np.zeros_like(map_manager.soil_field.plant_id)
+    plant_id_grid[columns["grid_y"], columns["grid_x"]] = columns["plant_id"]
+    return columns, species_list, len(plants) + 1, plant_id_grid
+
+def save_checkpoint(path, time_manager, climate_manager, map_manager, plants):
+    """현재 시뮬레이션 상태를 path 디렉터리에 저장합니다 (기존 체크포인트는 저장이 끝난 뒤 교체)."""
+    field = map_manager.soil_field # 잠든 청크는 깨우지 않고 묶음 상태째 저장 (저장해도 이후 결과가 바뀌지 않음)
+    if isinstance(plants, PlantPopulation):
+        engine = "vectorized"
+        count = plants.count
+        columns = {name: getattr(plants, name)[:count] for name, _dtype in PLANT_FIELDS}
+        species_list, next_plant_id, plant_id_grid = plants.species_list, plants._next_plant_id, field.plant_id
+    else:
+        engine = "sprite"
+        columns, species_list, next_plant_id, plant_id_grid = _sprite_plant_columns(plants, map_manager)
+
+    rng_version, rng_internal_state, rng_gauss_next = random.getstate()
+    stats = map_manager.stats
+    meta = {
+        "format_version": CHECKPOINT_FORMAT_VERSION,
+        "width": map_manager.width,
+        "height": map_manager.height,
+        "engine": engine,
+        "time_manager": {name: getattr(time_manager, name) for name in TIME_MANAGER_FIELDS},
+        "climate_manager": {name: getattr(climate_manager, name) for name in CLIMATE_MANAGER_FIELDS},
+        "soil_field": {"version": field.version, "soil_water_total": field.soil_water_base_total, "max_water_level": field.max_water_level},
+        "stats": {"plant_counts": {state.value: count for state, count in stats.plant_counts.items()},
+                  "total_plants": stats.total_plants, "biomass": stats.biomass, "births": stats.births,
+                  "deaths_by_cause": {cause.value: count for cause, count in stats.deaths_by_cause.items()}},
+        "next_plant_id": next_plant_id,
+        # 튜플/사전이 섞인 파이썬 리터럴이므로 repr로 저장해 타입과 실수 값을 그대로 복원
+        "config": repr(map_manager.config.as_dict()),
+        "species": [repr(species_data) for species_data in species_list],
+        "rng": {"version": rng_version, "gauss_next": rng_gauss_next},
+        "climate_schedule": climate_manager.schedule is not None,
+        "climate_schedule_seed": climate_manager.schedule.seed if climate_manager.schedule is not None else None,
+    }
+
+    tmp_path = path.rstrip("/\\") + ".tmp"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+    for name in SOIL_FIELD_ARRAYS:
+        np.save(os.path.join(tmp_path, f"grid_{name}.npy"), plant_id_grid if name == "plant_id" else getattr(field, name))
+    for name in GRID_INDEX_ARRAYS:
+        np.save(os.path.join(tmp_path, f"grid_{name}.npy"), getattr(field, name))
+    for name, array in zip(GRID_SLEEP_ARRAYS, field.sleep_state()):
+        np.save(os.path.join(tmp_path, f"grid_{name}.npy"), array)
+    for name, _dtype in PLANT_FIELDS:
+        np.save(os.path.join(tmp_path, f"plants_{name}.npy"), columns[name])
+    np.save(os.path.join(tmp_path, "rng_state.npy"), np.array(rng_internal_state, dtype=np.uint32))
+    if climate_manager.schedule is not None:
+        for name in SCHEDULE_ARRAYS:
+            np.save(os.path.join(tmp_path, f"climate_{name}.npy"), getattr(climate_manager.schedule, name))
+    with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+
+def load_checkpoint(path, engine=None):
+    """체크포인트를 복원해 (time_manager, climate_manager, map_manager, plants)를 반환합니다.
+       engine을 주면 저장할 때와 다른 엔진으로 복원할 수 있습니다. 난수 상태도 저장 시점으로 되돌리므로
+       이어서 진행한 결과는 중단 없이 진행한 결과와 같습니다.
+    """
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta["format_version"] != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format version: {meta['format_version']}")
+    engine = engine or meta["engine"]
+
+    def load(name):
+        return np.load(os.path.join(path, f"{name}.npy"), mmap_mode="c") # copy-on-write: 수정해도 파일은 그대로
+
+    sim_config = SimulationConfig(ast.literal_eval(meta["config"]))
+    species_list = []
+    for species_repr in meta["species"]:
+        species_data = ast.literal_eval(species_repr)
+        # 기본 종과 같은 특성이면 설정 객체의 사전을 그대로 써서 새로 배치되는 식물과 같은 종으로 취급
+        species_list.append(sim_config.STRONG_PLANT_SPECIES if species_data == sim_config.STRONG_PLANT_SPECIES else species_data)
+
+    time_manager = TimeManager(sim_config=sim_config)
+    for name, value in meta["time_manager"].items():
+        setattr(time_manager, name, value)
+    time_manager.current_season = time_manager.seasons_order[time_manager.current_season_index]
+
+    climate_schedule = None
+    if meta.get("climate_schedule"):
+        climate_schedule = ClimateSchedule(**{name: load(f"climate_{name}") for name in SCHEDULE_ARRAYS},
+                                           seed=meta["climate_schedule_seed"])
+    climate_manager = ClimateManager(time_manager_ref=time_manager, sim_config=sim_config, # 생성 중 쓴 난수는 마지막에 되돌림
+                                     schedule=climate_schedule)
+    for name, value in meta["climate_manager"].items():
+        setattr(climate_manager, name, value)
+    climate_manager.refresh_environment()
+
+    soil_meta = meta["soil_field"]
+    soil_field = SoilField.from_arrays({name: load(f"grid_{name}") for name in SOIL_FIELD_ARRAYS},
+                                       soil_meta["max_water_level"], soil_meta["soil_water_total"], soil_meta["version"],
+                                       *(load(f"grid_{name}") for name in GRID_INDEX_ARRAYS),
+                                       *(np.load(os.path.join(path, f"grid_{name}.npy")) for name in GRID_SLEEP_ARRAYS))
+    plant_group = pygame.sprite.Group()
+    map_manager = MapManager(width=meta["width"], height=meta["height"], climate_manager_ref=climate_manager,
+                             plant_group_ref=plant_group, sim_config=sim_config, soil_field=soil_field,
+                             engine=engine)
+
+    columns = {name: load(f"plants_{name}") for name, _dtype in PLANT_FIELDS}
+    if engine == "vectorized":
+        plants = PlantPopulation(map_manager_ref=map_manager)
+        plants.restore(columns, species_list, meta["next_plant_id"])
+        map_manager.plant_population = plants
+    else:
+        plants = plant_group
+        rows = {name: columns[name].tolist() for name, _dtype in PLANT_FIELDS} # 파이썬 int/float로 변환 (sprite 경로와 같은 타입)
+        for row in range(len(rows["plant_id"])):
+            fields = {name: rows[name][row] for name, _dtype in PLANT_FIELDS}
+            fields["state"] = PLANT_STATES_BY_CODE[fields["state"]]
+            plant = Plant.restore(fields, species_list[fields["species"]], map_manager)
+            plant_group.add(plant)
+            map_manager.sprite_schedule.add(plant, time_manager.total_cycles_elapsed)
+            map_manager.plant_index[plant.grid_y, plant.grid_x] = plant
+            soil_field.plant_id[plant.grid_y, plant.grid_x] = id(plant)
+
+    stats_meta = meta["stats"]
+    map_manager.stats.plant_counts = {PlantState(state): count for state, count in stats_meta["plant_counts"].items()}
+    map_manager.stats.total_plants = stats_meta["total_plants"]
+    map_manager.stats.biomass = stats_meta["biomass"]
+    map_manager.stats.births = stats_meta["births"]
+    map_manager.stats.deaths_by_cause = {DeathCause(cause): count for cause, count in stats_meta["deaths_by_cause"].items()}
+
+    rng_meta = meta["rng"]
+    random.setstate((rng_meta["version"], tuple(load("rng_state").tolist()), rng_meta["gauss_next"]))
+    return time_manager, climate_manager, map_manager, plants
@@ -1,38 +1,62 @@
 # climate.py
 import random
-from config import (SEASON_AVG_TEMPS, SEASON_TEMP_VARIATION, YEARLY_AVG_TEMP_FLUCTUATION_RANGE,
-                    SEASON_RAINFALL_PATTERNS, YEARLY_RAINFALL_FLUCTUATION_RANGE, DAY_LENGTH_RATIOS, DEBUG_MODE)
+from environment_context import EnvironmentContext
+from simulation_config import DEFAULT_SIMULATION_CONFIG
 from time_manager import Season
+from tracelog import TRACE
 
 class ClimateManager:
-    def __init__(self, time_manager_ref):
+    def __init__(self, time_manager_ref, sim_config=None, schedule=None):
         self.time_manager = time_manager_ref
+        self.config = sim_config if sim_config else DEFAULT_SIMULATION_CONFIG
+        self.schedule = schedule # ClimateSchedule을 주면 기후를 계산하지 않고 미리 생성한 배열에서 조회 (전역 random 미사용)
         self.current_yearly_temp_offset = 0.0
         self.current_yearly_rainfall_multiplier = 1.0
         self.current_daily_temperature = 0.0
+        self.current_daily_rain = 0.0 # 오늘 내린 비의 양 (mm)
         self.last_rainfall_info = {"occurred": False, "amount": 0.0, "day": 0, "season": ""}
+        self.environment = EnvironmentContext() # 오늘 기온/낮 길이와 종별 반응 (update_daily_climate마다 갱신)
 
         self.apply_yearly_fluctuations() # 초기 연간 변동성 적용
         self.update_daily_climate()     # 초기 일일 기후 설정
 
     def apply_yearly_fluctuations(self):
         """매년 시작 시 호출되어 연간 평균 기온 및 강수량 변동성을 적용합니다."""
-        self.current_yearly_temp_offset = random.uniform(*YEARLY_AVG_TEMP_FLUCTUATION_RANGE)
-        self.current_yearly_rainfall_multiplier = 1.0 + random.uniform(*YEARLY_RAINFALL_FLUCTUATION_RANGE)
-        if DEBUG_MODE:
-            print(f"Year {self.time_manager.current_year}: Temp Offset: {self.current_yearly_temp_offset:.2f}C, Rainfall Multiplier: {self.current_yearly_rainfall_multiplier:.2f}x")
+        if self.schedule is not None:
+            year_index = self.time_manager.current_year - 1
+            self.current_yearly_temp_offset = float(self.schedule.yearly_temp_offset[year_index])
+            self.current_yearly_rainfall_multiplier = float(self.schedule.yearly_rainfall_multiplier[year_index])
+            return
+        self.current_yearly_temp_offset = random.uniform(*self.config.YEARLY_AVG_TEMP_FLUCTUATION_RANGE)
+        self.current_yearly_rainfall_multiplier = 1.0 + random.uniform(*self.config.YEARLY_RAINFALL_FLUCTUATION_RANGE)
+        if TRACE.enabled:
+            TRACE.emit("climate.year", "Year {}: Temp Offset: {:.2f}C, Rainfall Multiplier: {:.2f}x",
+                       self.time_manager.current_year, self.current_yearly_temp_offset, self.current_yearly_rainfall_multiplier)
 
 
     def update_daily_climate(self):
         """매일(cycle) 호출되어 해당 일의 기온을 계산하고, 토양 객체에 적용합니다.
-           강수 이벤트도 처리합니다.
+           강수 이벤트도 처리하며, 식물 갱신이 쓰는 환경 정보(self.environment)도 오늘 값으로 갱신합니다.
         """
+        if self.schedule is not None:
+            result = self._update_daily_climate_from_schedule()
+        else:
+            result = self._update_daily_climate_random()
+        self.refresh_environment()
+        return result
+
+    def refresh_environment(self):
+        """self.environment를 현재 기온과 계절의 낮 길이로 갱신합니다 (체크포인트 복원 후에도 호출)."""
+        self.environment.begin_cycle(self.current_daily_temperature, self.get_day_length_ratio(self.time_manager.current_season))
+
+    def _update_daily_climate_random(self):
+        """전역 random으로 오늘의 기온과 강수량을 정합니다."""
         current_season_enum = self.time_manager.current_season
         current_season_str = current_season_enum.value # Enum 값을 문자열로 사용
 
         # 1. 일일 온도 계산
-        base_avg_temp = SEASON_AVG_TEMPS[current_season_str]
-        temp_variation_min, temp_variation_max = SEASON_TEMP_VARIATION[current_season_str]
+        base_avg_temp = self.config.SEASON_AVG_TEMPS[current_season_str]
+        temp_variation_min, temp_variation_max = self.config.SEASON_TEMP_VARIATION[current_season_str]
         
         # 계절 내 날짜 진행에 따른 온도 변화 (사인파 유사 패턴 - 단순화)
         # 봄/가을: 중간에서 시작하여 최고/최저점 찍고 다시 중간으로
@@ -45,7 +69,7 @@ class ClimateManager:
         
         # 2. 강수 이벤트 처리
         self.last_rainfall_info["occurred"] = False # 기본적으로 비 안옴
-        rainfall_pattern = SEASON_RAINFALL_PATTERNS[current_season_str]
+        rainfall_pattern = self.config.SEASON_RAINFALL_PATTERNS[current_season_str]
         daily_rain_chance, avg_rain_amount, daily_heavy_rain_chance, heavy_rain_extra = rainfall_pattern
 
         rain_amount_today = 0
@@ -57,6 +81,7 @@ class ClimateManager:
             rain_amount_today *= self.current_yearly_rainfall_multiplier # 최종 강수량에도 연간 변동 적용
             rain_amount_today = max(0, rain_amount_today) # 음수 방지
 
+        self.current_daily_rain = rain_amount_today
         if rain_amount_today > 0:
             self.last_rainfall_info = {
                 "occurred": True,
@@ -64,15 +89,34 @@ class ClimateManager:
                 "day": self.time_manager.current_day_in_season,
                 "season": current_season_str
             }
-            if DEBUG_MODE:
-                print(f"Rainfall: {rain_amount_today:.2f}mm on Year {self.time_manager.current_year}, {current_season_str}, Day {self.time_manager.current_day_in_season}")
+            if TRACE.enabled:
+                TRACE.emit("climate.rain", "Rainfall: {:.2f}mm on Year {}, {}, Day {}",
+                           rain_amount_today, self.time_manager.current_year, current_season_str, self.time_manager.current_day_in_season)
         
         return self.current_daily_temperature, rain_amount_today
 
+    def _update_daily_climate_from_schedule(self):
+        """기후 일정표에서 현재 cycle의 기온과 강수량을 조회합니다."""
+        index = self.time_manager.total_cycles_elapsed
+        if index >= len(self.schedule):
+            raise IndexError(f"Climate schedule covers {len(self.schedule) - 1} cycles, cycle {index} requested")
+        self.current_daily_temperature = float(self.schedule.temperature[index])
+        rain_amount_today = float(self.schedule.rain[index])
+        self.current_daily_rain = rain_amount_today
+        self.last_rainfall_info["occurred"] = False
+        if rain_amount_today > 0:
+            self.last_rainfall_info = {
+                "occurred": True,
+                "amount": rain_amount_today,
+                "day": self.time_manager.current_day_in_season,
+                "season": self.time_manager.current_season.value
+            }
+        return self.current_daily_temperature, rain_amount_today
+
 
     def get_day_length_ratio(self, season_enum):
         """현재 계절의 낮 길이 비율을 반환합니다."""
-        return DAY_LENGTH_RATIOS[season_enum.value]
+        return self.config.DAY_LENGTH_RATIOS[season_enum.value]
 
     def get_last_rainfall_info_str(self):
         if self.last_rainfall_info["occurred"] and self.last_rainfall_info["day"] == self.time_manager.current_day_in_season:
@@ -0,0 +1,84 @@
+# climate_schedule.py
+# 실행 전체의 기후(일일 기온, 강수량, 낮 길이 비율)를 한 번에 배열로 미리 생성해 두는 기후 일정표
+# ClimateManager에 넘기면 매 cycle 기후 계산 대신 배열 조회만 하며, 같은 일정표를 여러 실행이 공유/재생할 수 있습니다.
+import numpy as np
+
+from simulation_config import DEFAULT_SIMULATION_CONFIG
+from time_manager import Season
+
+SEASONS_ORDER = (Season.SPRING, Season.SUMMER, Season.AUTUMN, Season.WINTER) # TimeManager.seasons_order와 같은 순서
+SCHEDULE_ARRAYS = ("temperature", "rain", "day_length_ratio", "season_index", "year",
+                   "yearly_temp_offset", "yearly_rainfall_multiplier")
+
+class ClimateSchedule:
+    """cycle 번호(TimeManager.total_cycles_elapsed)로 조회하는 기후 배열 묶음입니다.
+       i번째 값은 i cycle이 지난 시점(0은 시뮬레이션 생성 직후)의 기후이고, 연간 변동 값은 (연도 - 1)로 조회합니다.
+    """
+    def __init__(self, temperature, rain, day_length_ratio, season_index, year,
+                 yearly_temp_offset, yearly_rainfall_multiplier, seed=None):
+        self.temperature = temperature
+        self.rain = rain
+        self.day_length_ratio = day_length_ratio
+        self.season_index = season_index
+        self.year = year
+        self.yearly_temp_offset = yearly_temp_offset
+        self.yearly_rainfall_multiplier = yearly_rainfall_multiplier
+        self.seed = seed # 생성에 쓴 시드 (같은 시드로 더 긴 일정표를 만들면 앞부분은 그대로 유지됨)
+
+    def __len__(self):
+        return len(self.temperature)
+
+    @classmethod
+    def generate(cls, cycles, seed=None, sim_config=None):
+        """0 ~ cycles 번째 cycle의 기후를 생성합니다. ClimateManager.update_daily_climate와 같은 분포를 따르지만
+           전역 random 대신 seed로 만든 numpy 난수 생성기를 쓰므로 식물 쪽 난수 흐름과 무관하게 재현됩니다.
+           난수는 1년 단위 배열로 차례로 뽑으므로 같은 시드면 cycles가 달라도 겹치는 구간의 기후는 같습니다.
+        """
+        config = sim_config if sim_config else DEFAULT_SIMULATION_CONFIG
+        rng = np.random.default_rng(seed)
+        count = cycles + 1
+        year_length = config.year_length_days
+        year_count = (count + year_length - 1) // year_length
+
+        # TimeManager.update와 같은 날짜 계산: cycle마다 하루, 계절은 DAYS_PER_SEASON일, 새해는 봄에 시작
+        season_index = (np.arange(year_length) // config.DAYS_PER_SEASON).astype(np.int8)
+        def season_table(values):
+            return np.array([values[season.value] for season in SEASONS_ORDER], dtype=np.float64)[season_index]
+        base_temperature = season_table(config.SEASON_AVG_TEMPS)
+        variation = np.array([config.SEASON_TEMP_VARIATION[season.value] for season in SEASONS_ORDER], dtype=np.float64)[season_index]
+        pattern = np.array([config.SEASON_RAINFALL_PATTERNS[season.value] for season in SEASONS_ORDER], dtype=np.float64)[season_index]
+        rain_chance, avg_rain_amount, heavy_rain_chance, heavy_rain_extra = pattern.T
+
+        yearly_temp_offset = np.empty(year_count)
+        yearly_rainfall_multiplier = np.empty(year_count)
+        temperature = np.empty((year_count, year_length))
+        rain = np.empty((year_count, year_length))
+        for year_index in range(year_count):
+            yearly_temp_offset[year_index] = rng.uniform(*config.YEARLY_AVG_TEMP_FLUCTUATION_RANGE)
+            multiplier = 1.0 + rng.uniform(*config.YEARLY_RAINFALL_FLUCTUATION_RANGE)
+            yearly_rainfall_multiplier[year_index] = multiplier
+            temperature[year_index] = (base_temperature + yearly_temp_offset[year_index]
+                                       + rng.uniform(variation[:, 0] / 2, variation[:, 1] / 2))
+            rained = rng.random(year_length) < rain_chance * multiplier
+            heavy = rng.random(year_length) < heavy_rain_chance
+            amount = rng.uniform(avg_rain_amount * 0.5, avg_rain_amount * 1.5)
+            amount += np.where(heavy, rng.uniform(heavy_rain_extra * 0.5, heavy_rain_extra * 1.5), 0.0)
+            rain[year_index] = np.where(rained, np.maximum(0.0, amount * multiplier), 0.0)
+
+        return cls(temperature.ravel()[:count], rain.ravel()[:count],
+                   np.tile(season_table(config.DAY_LENGTH_RATIOS), year_count)[:count],
+                   np.tile(season_index, year_count)[:count],
+                   np.repeat(np.arange(1, year_count + 1, dtype=np.int32), year_length)[:count],
+                   yearly_temp_offset, yearly_rainfall_multiplier, seed)
+
+    def save(self, path):
+        """일정표를 .npz 파일로 저장합니다."""
+        np.savez(path, seed=np.array(-1 if self.seed is None else self.seed),
+                 **{name: getattr(self, name) for name in SCHEDULE_ARRAYS})
+
+    @classmethod
+    def load(cls, path):
+        """save()로 저장한 일정표를 읽습니다."""
+        with np.load(path) as data:
+            seed = int(data["seed"]) if "seed" in data and int(data["seed"]) >= 0 else None
+            return cls(**{name: data[name] for name in SCHEDULE_ARRAYS}, seed=seed)
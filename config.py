@@ -6,13 +6,25 @@ SCREEN_HEIGHT = 800  # 화면 높이
 GRID_SIZE = 8       # 각 셀의 크기 (픽셀)
 INFO_PANEL_HEIGHT = 150 # 정보 패널 높이
 GAME_AREA_HEIGHT = SCREEN_HEIGHT - INFO_PANEL_HEIGHT # 실제 게임 영역 높이
+GAME_VIEW_WIDTH = 800 # 맵을 보여 주는 뷰포트 너비 (오른쪽은 디버그 정보 영역)
 
-# 맵 크기 (셀 단위)
+# 맵 크기 (셀 단위, 기본값은 기본 확대 배율에서 뷰포트를 채우는 크기 - 더 크면 카메라로 이동하며 봄)
 MAP_WIDTH = 100
-MAP_HEIGHT = int(GAME_AREA_HEIGHT / GRID_SIZE) # 화면에 맞게 맵 높이 조정
+MAP_HEIGHT = 81
+
+# 뷰포트 카메라 (마우스 휠/+- 키: 확대·축소, 오른쪽 버튼 끌기: 이동)
+CAMERA_ZOOM_LEVELS = (0.125, 0.25, 0.5, 1, 2, 4, 8, 16) # 셀당 픽셀 수 (1 미만이면 여러 셀을 한 픽셀로 묶어 평균)
+CAMERA_SPRITE_MIN_CELL_PIXELS = 4 # 셀당 픽셀이 이 이상일 때만 식물을 하나씩 그림 (그 아래는 묶음별 식물 밀도로 표시)
+CAMERA_DENSITY_COLOR = (40, 170, 40) # 식물 밀도 표시 색 (밀도만큼 지형 색과 섞음)
+CAMERA_DENSITY_BLEND = 0.8 # 밀도 1일 때 섞는 비율
 
 # 시뮬레이션 시간 설정
 SIMULATION_CYCLES_PER_SECOND = 10  # 1초에 진행될 시뮬레이션 cycle 수
+TARGET_FPS = 60 # 화면 갱신 최대 프레임 수
+MAX_CATCHUP_CYCLES_PER_FRAME = 20 # 밀렸을 때 한 프레임에 따라잡을 최대 cycle 수
+MAX_SPEED_RENDER_EVERY_N_CYCLES = 50 # 최고 속도 모드에서 화면을 갱신하는 cycle 간격
+MAX_SPEED_FRAME_BUDGET_SECONDS = 0.1 # 최고 속도 모드에서 한 프레임에 시뮬레이션에 쓰는 최대 시간 (입력 반응성 유지)
+SIMULATION_WORKER_IDLE_SECONDS = 0.005 # 시뮬레이션 작업 스레드가 진행할 cycle이 없을 때 명령을 기다리는 최대 시간
 CYCLES_PER_DAY = 1 # 1 cycle = 1일
 DAYS_PER_SEASON = 90 # 각 계절의 기본 지속 기간 (일)
 YEAR_LENGTH_DAYS = DAYS_PER_SEASON * 4 # 1년 (일)
@@ -22,10 +34,14 @@ TERRAIN_NOISE_SCALE = 0.1
 TERRAIN_NOISE_OCTAVES = 3
 TERRAIN_WATER_THRESHOLD = 0.3
 TERRAIN_ROCK_THRESHOLD = 0.8
+TERRAIN_CACHE_DIR = "terrain_cache" # 생성한 지형을 저장해 두는 디렉터리 (같은 시드/크기/파라미터면 재생성 생략)
+TERRAIN_CACHE_MIN_CELLS = 250_000 # 이 셀 수 이상인 맵만 캐시 (작은 맵은 생성이 더 빠름)
 
 # 토양 관련 파라미터
 MAX_SOIL_WATER_LEVEL = 100.0  # mm, 최대 토양 수분량
 INITIAL_SOIL_NUTRIENT_LEVEL = 50.0 # MVP에서는 고정값 또는 단순화
+SOIL_CHUNK_SIZE = 8 # 토양 갱신 청크 한 변의 셀 수 (식물이 있는 청크만 매 cycle 갱신)
+STATS_RESYNC_CYCLES = 360 # sprite 엔진에서 증분 갱신한 개체 수/생체량을 이 cycle마다 식물 그룹에서 다시 집계 (부동소수 누적 오차 제거)
 
 # 기후 파라미터
 # 계절별 평균 기온 (℃)
@@ -91,8 +107,10 @@ SOIL_COLOR_STEPS = 5 # 수분량에 따른 토양 색상 단계 수
 
 # 정보 패널 폰트
 INFO_FONT_SIZE = 18
+DEBUG_FONT_SIZE = INFO_FONT_SIZE - 2 # 디버그용 약간 작은 폰트
 INFO_FONT_COLOR = (255, 255, 255)
 INFO_LINE_SPACING = 20
+TEXT_CACHE_SIZE = 256 # 렌더링한 글자 Surface를 보관하는 최대 개수 (오래 안 쓴 것부터 버림)
 
 # 초기 식물 배치 시 최소 안전 거리 (셀 단위) - 군집화 방지
 MIN_INITIAL_PLANT_DISTANCE = 3
@@ -124,7 +142,7 @@ DEAD_PLANT_REMOVAL_CYCLES = 30 # 죽은 식물이 맵에서 사라지기까지
 GAUGE_BAR_WIDTH = 150  # 게이지바 너비
 GAUGE_BAR_HEIGHT = 18   # 게이지바 높이
 GAUGE_TEXT_OFFSET = 5 # 게이지바와 텍스트 사이 간격
-DEBUG_INFO_START_X = (MAP_WIDTH * GRID_SIZE) + 20 # 디버그 정보 표시 시작 X 위치
+DEBUG_INFO_START_X = GAME_VIEW_WIDTH + 20 # 디버그 정보 표시 시작 X 위치
 DEBUG_INFO_START_Y = 20                           # 디버그 정보 표시 시작 Y 위치
 DEBUG_INFO_LINE_SPACING = 25                     # 디버그 정보 줄 간격
 DEBUG_INFO_CATEGORY_SPACING = 10                 # 디버그 정보 카테고리 간 간격 (텍스트와 바 사이)
@@ -137,5 +155,15 @@ GAUGE_BAR_COLORS = {
     "BACKGROUND": (70, 70, 70)  # 어두운 회색
 }
 
-# 디버그 모드
-DEBUG_MODE = False
\ No newline at end of file
+# 텔레메트리 (cycle별 지표 기록)
+TELEMETRY_BATCH_SIZE = 4096 # 한 번에 파일에 쓰는 행(cycle) 수
+
+# 단계별 성능 계측 (프로파일러 오버레이: P 키)
+PROFILER_WINDOW_SAMPLES = 300 # 단계별로 보관하는 최근 표본 수 (p50/p95/max 계산 범위)
+PROFILER_OVERLAY_POSITION = (10, 10) # 오버레이 왼쪽 위 좌표
+PROFILER_OVERLAY_BACKGROUND = (0, 0, 0, 170) # 반투명 배경색 (RGBA)
+
+# 디버그 모드 (D 키: 디버그 화면과 추적 로그를 함께 켜고 끔)
+DEBUG_MODE = False
+TRACE_BUFFER_SIZE = 100000 # 추적 로그 원형 버퍼에 보관하는 최근 사건 수
+TRACE_DUMP_PATH = "trace.log" # T 키로 추적 로그를 저장하는 파일
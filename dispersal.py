@@ -0,0 +1,82 @@
+# dispersal.py
+# 씨앗 확산 커널: SEED_SPREAD_RADIUS_MIN~MAX 고리 안의 격자 오프셋과 선택 확률을 미리 계산해 두고,
+# SoilField.free_soil 비트맵에서 빈 칸만 골라 난수 하나로 목표 셀을 정합니다.
+import functools
+import math
+import random
+
+import numpy as np
+
+DISPERSAL_ANGLE_SAMPLES = 720 # 오프셋 확률 계산에 쓰는 각도 격자 수
+DISPERSAL_RADIUS_SAMPLES = 64 # 오프셋 확률 계산에 쓰는 반지름 격자 수
+
+class DispersalKernel:
+    """방향은 균등, 거리는 [radius_min, radius_max] 균등으로 뽑아 반올림한 격자 오프셋의 분포를 표로 보관합니다.
+       빈 칸이 없으면 곧바로 알 수 있고, 있으면 빈 칸들 사이에서 원래 분포의 비율대로 하나를 고릅니다.
+    """
+    def __init__(self, radius_min, radius_max):
+        self.radius_min = radius_min
+        self.radius_max = radius_max
+        angles = (np.arange(DISPERSAL_ANGLE_SAMPLES) + 0.5) * (2 * math.pi / DISPERSAL_ANGLE_SAMPLES)
+        radii = radius_min + (np.arange(DISPERSAL_RADIUS_SAMPLES) + 0.5) * ((radius_max - radius_min) / DISPERSAL_RADIUS_SAMPLES)
+        dx = np.rint(np.outer(radii, np.cos(angles))).astype(np.int64).ravel()
+        dy = np.rint(np.outer(radii, np.sin(angles))).astype(np.int64).ravel()
+        offsets, counts = np.unique(np.stack([dy, dx], axis=1), axis=0, return_counts=True) # 행 우선 순서로 정렬
+        self.dy = offsets[:, 0]
+        self.dx = offsets[:, 1]
+        self.weights = counts / counts.sum()
+
+    def __len__(self):
+        return len(self.weights)
+
+    def choose_targets(self, free_soil, xs, ys, draws):
+        """부모 위치 (xs[i], ys[i])마다 draws[i] (0 <= draw < 1) 하나로 빈 목표 셀을 고릅니다.
+           앞선 부모가 고른 셀은 뒤 부모에게 빈 칸이 아니므로, 결과는 하나씩 고르고 바로 심는 것과 같습니다.
+           (target_xs, target_ys)를 반환하며 빈 칸이 없던 항목은 -1입니다.
+        """
+        height, width = free_soil.shape
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        draws = np.asarray(draws, dtype=np.float64)
+        target_xs = xs[:, None] + self.dx
+        target_ys = ys[:, None] + self.dy
+        inside = (target_xs >= 0) & (target_xs < width) & (target_ys >= 0) & (target_ys < height)
+        free = np.zeros(inside.shape, dtype=bool)
+        free[inside] = free_soil[target_ys[inside], target_xs[inside]]
+        cumulative = np.cumsum(np.where(free, self.weights, 0.0), axis=1)
+        # draw * 합계가 반올림으로 합계와 같아지면 누적값이 그보다 큰 칸이 없으므로 마지막 빈 칸으로 제한
+        last_free = free.shape[1] - 1 - np.argmax(free[:, ::-1], axis=1)
+        choice = np.minimum((cumulative <= (draws * cumulative[:, -1])[:, None]).sum(axis=1), last_free)
+
+        chosen_xs = np.full(len(xs), -1, dtype=np.int64)
+        chosen_ys = np.full(len(xs), -1, dtype=np.int64)
+        taken = set()
+        for i in range(len(xs)):
+            if cumulative[i, -1] <= 0:
+                continue
+            j = int(choice[i])
+            cell = (int(target_xs[i, j]), int(target_ys[i, j]))
+            if cell in taken: # 같은 묶음의 앞선 부모가 이미 고른 셀: 그 셀들을 빼고 다시 고름
+                row_free = free[i].copy()
+                for k in np.flatnonzero(row_free):
+                    if (int(target_xs[i, k]), int(target_ys[i, k])) in taken:
+                        row_free[k] = False
+                row_cumulative = np.cumsum(np.where(row_free, self.weights, 0.0))
+                if row_cumulative[-1] <= 0:
+                    continue
+                j = min(int((row_cumulative <= draws[i] * row_cumulative[-1]).sum()), int(np.flatnonzero(row_free)[-1]))
+                cell = (int(target_xs[i, j]), int(target_ys[i, j]))
+            taken.add(cell)
+            chosen_xs[i], chosen_ys[i] = cell
+        return chosen_xs, chosen_ys
+
+@functools.lru_cache(maxsize=None)
+def dispersal_kernel(radius_min, radius_max):
+    """반지름 범위별 DispersalKernel을 한 번만 만들어 재사용합니다."""
+    return DispersalKernel(radius_min, radius_max)
+
+def draw_seed_targets(free_soil, x, y, seed_count, radius_min, radius_max):
+    """(x, y)의 부모가 만드는 씨앗 seed_count개의 목표 셀을 고릅니다. 씨앗마다 전역 random에서 난수 하나를 씁니다."""
+    draws = [random.random() for _ in range(seed_count)]
+    return dispersal_kernel(radius_min, radius_max).choose_targets(
+        free_soil, np.full(seed_count, x), np.full(seed_count, y), draws)
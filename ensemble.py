@@ -0,0 +1,134 @@
+# ensemble.py
+# 시드 x 파라미터 조합마다 헤드리스 시뮬레이션을 여러 프로세스에서 실행하고 시계열 결과를 하나의 표(CSV)로 모으는 실행기
+# 사용 예: python -m ensemble --cycles 720 --seeds 1 2 3 --param STRESS_DAMAGE_RATE=1.0,1.5,2.0 \
+#              --param STRONG_PLANT_SPECIES.max_lifespan_cycles=720,1080 --workers 4 --output ensemble.csv
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import ast
+import csv
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import MAP_WIDTH, MAP_HEIGHT, YEAR_LENGTH_DAYS
+from run import run_headless
+from climate_schedule import ClimateSchedule
+from simulation import ENGINES
+from simulation_config import SimulationConfig, DEFAULT_SIMULATION_CONFIG
+
+def parse_param_spec(spec):
+    """"이름=값1,값2,..." 형식을 (이름, [값, ...])으로 바꿉니다. 값은 파이썬 리터럴(숫자, 튜플 등)입니다."""
+    name, sep, values_text = spec.partition("=")
+    if not sep or not name:
+        raise ValueError(f"Parameter spec must look like NAME=V1,V2,...: {spec}")
+    values = ast.literal_eval(f"[{values_text}]")
+    if not values:
+        raise ValueError(f"No values given for parameter: {name}")
+    DEFAULT_SIMULATION_CONFIG.with_overrides({name: values[0]}) # 이름 검증 (없는 파라미터면 KeyError)
+    return name, values
+
+def build_run_specs(param_grid, seeds, cycles, width=MAP_WIDTH, height=MAP_HEIGHT, engine="sprite", sample_every=0,
+                    climate_seed=None):
+    """파라미터 값들의 모든 조합 x 시드마다 실행 명세(사전)를 만들어 목록으로 반환합니다.
+       climate_seed를 주면 모든 실행이 그 시드로 미리 생성한 같은 기후 일정표를 사용합니다.
+    """
+    names = list(param_grid)
+    specs = []
+    for values in itertools.product(*(param_grid[name] for name in names)):
+        overrides = dict(zip(names, values))
+        for seed in seeds:
+            specs.append({
+                "run_id": len(specs),
+                "seed": seed,
+                "overrides": overrides,
+                "cycles": cycles,
+                "width": width,
+                "height": height,
+                "engine": engine,
+                "sample_every": sample_every,
+                "climate_seed": climate_seed,
+            })
+    return specs
+
+def run_member(spec):
+    """한 실행을 수행하고 (실행 명세, 결과 요약)을 반환합니다. 작업 프로세스에서 호출됩니다."""
+    sim_config = SimulationConfig(spec["overrides"])
+    climate_schedule = None
+    if spec.get("climate_seed") is not None: # 기후 파라미터를 덮어쓴 실행도 있으므로 실행 설정으로 생성 (같은 설정이면 같은 일정표)
+        climate_schedule = ClimateSchedule.generate(spec["cycles"], seed=spec["climate_seed"], sim_config=sim_config)
+    summary = run_headless(spec["cycles"], seed=spec["seed"], width=spec["width"], height=spec["height"],
+                           engine=spec["engine"], sim_config=sim_config,
+                           sample_every=spec["sample_every"] or spec["cycles"], climate_schedule=climate_schedule)
+    return spec, summary
+
+def result_rows(spec, summary):
+    """한 실행의 시계열을 결과 표의 행 목록으로 바꿉니다 (실행 번호, 시드, 파라미터 값 열 포함)."""
+    base = {"run_id": spec["run_id"], "seed": spec["seed"]}
+    for name, value in spec["overrides"].items():
+        base[name] = value if isinstance(value, (int, float, str)) else repr(value)
+    return [{**base, **snapshot} for snapshot in summary["timeseries"]]
+
+def run_ensemble(specs, workers=None, progress=True):
+    """실행 명세들을 프로세스 풀에서 실행하고 모든 결과 행을 (run_id, cycle) 순서로 반환합니다.
+       workers가 1이면 풀 없이 현재 프로세스에서 순서대로 실행합니다.
+    """
+    rows_by_run = {}
+    start = time.perf_counter()
+
+    def collect(spec, summary):
+        rows_by_run[spec["run_id"]] = result_rows(spec, summary)
+        if progress:
+            final = summary["timeseries"][-1]
+            print(f"[{len(rows_by_run)}/{len(specs)}] run {spec['run_id']} seed={spec['seed']} {spec['overrides']} -> "
+                  f"plants={final['total_plants']} biomass={final['biomass']:.2f} ({summary['run_seconds']:.1f}s)")
+
+    if workers == 1:
+        for spec in specs:
+            collect(*run_member(spec))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_member, spec) for spec in specs]
+            for future in as_completed(futures):
+                collect(*future.result())
+
+    if progress:
+        print(f"Ensemble of {len(specs)} runs finished in {time.perf_counter() - start:.1f}s")
+    return [row for run_id in sorted(rows_by_run) for row in rows_by_run[run_id]]
+
+def write_table(rows, path):
+    """결과 행들을 CSV 파일로 저장합니다 (열 순서는 첫 행 기준)."""
+    if not rows:
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run an ensemble of headless simulations over seeds and parameter overrides")
+    parser.add_argument("--cycles", type=int, default=YEAR_LENGTH_DAYS, help="실행마다 진행할 시뮬레이션 cycle 수")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="난수 시드 목록")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2",
+                        help="덮어쓸 파라미터와 값 목록 (여러 번 지정 가능, 예: STRESS_DAMAGE_RATE=1.0,2.0 또는 STRONG_PLANT_SPECIES.max_lifespan_cycles=720,1080)")
+    parser.add_argument("--width", type=int, default=MAP_WIDTH, help="맵 너비 (셀)")
+    parser.add_argument("--height", type=int, default=MAP_HEIGHT, help="맵 높이 (셀)")
+    parser.add_argument("--engine", choices=ENGINES, default="vectorized", help="식물 갱신 엔진")
+    parser.add_argument("--sample-every", type=int, default=30, help="N cycle마다 시계열 한 행 기록 (0이면 시작/마지막 값만)")
+    parser.add_argument("--climate-seed", type=int, default=None, help="모든 실행이 이 시드로 생성한 같은 기후 일정표를 사용 (기본: 실행마다 기후도 시드에 따라 다름)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)")
+    parser.add_argument("--output", default="ensemble_results.csv", help="결과 CSV 파일 경로")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    param_grid = dict(parse_param_spec(spec) for spec in args.param)
+    specs = build_run_specs(param_grid, args.seeds, args.cycles, width=args.width, height=args.height,
+                            engine=args.engine, sample_every=args.sample_every, climate_seed=args.climate_seed)
+    rows = run_ensemble(specs, workers=args.workers)
+    write_table(rows, args.output)
+    print(f"Wrote {len(rows)} rows to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# environment_context.py
+# 한 cycle 동안 모든 타일의 기온과 낮 길이는 같으므로, 그에 대한 종별 반응(광합성 온도 효율, 온도 스트레스 등)을
+# 식물마다 다시 계산하지 않고 종마다 한 번만 계산해 식물 갱신(sprite/배열 엔진 모두)에서 재사용합니다.
+
+class SpeciesResponse:
+    """한 cycle의 기온에 대한 한 종(Species 레코드)의 반응 값.
+       - temp_efficiency: 광합성 온도 효율 (0 ~ 1)
+       - temp_stress: 환경 스트레스의 온도 항
+       - temp_extreme: 생존 온도 범위 밖이면 True (극한 온도로 죽음)
+       - temp_optimal: 최적 생장 온도 범위 안이면 True (번식 확률, 건강 회복 조건)
+       - germination_temp_ok: 씨앗 발아 최소 온도 이상이면 True
+       토양 수분 항은 식물마다 타일 수분이 달라 미리 계산할 수 없으므로, 종 특성만으로 정해지는 경계와 분모를 담습니다.
+       - dry_stress_range: 건조 스트레스 분모 (최적 수분 하한 - 생존 수분 + 1e-6)
+       - wet_stress_threshold, wet_stress_range: 과습 스트레스 기준 수분 (최적 상한의 180%)과 분모
+    """
+    __slots__ = ("species", "temp_efficiency", "temp_stress", "temp_extreme", "temp_optimal", "germination_temp_ok",
+                 "dry_stress_range", "wet_stress_threshold", "wet_stress_range")
+
+    def __init__(self, species, temp):
+        self.species = species
+        optimal_temp_min, optimal_temp_max = species.optimal_growth_temperature_min, species.optimal_growth_temperature_max
+        min_survival_temp, max_survival_temp = species.min_survival_temperature, species.max_survival_temperature
+
+        temp_efficiency = 0
+        if optimal_temp_min <= temp <= optimal_temp_max:
+            temp_efficiency = 1.0
+        elif temp < optimal_temp_min:
+            diff = optimal_temp_min - temp
+            range_ = optimal_temp_min - min_survival_temp
+            if range_ > 0: temp_efficiency = max(0, 1 - (diff / range_))
+        else:
+            diff = temp - optimal_temp_max
+            range_ = max_survival_temp - optimal_temp_max
+            if range_ > 0: temp_efficiency = max(0, 1 - (diff / range_))
+        self.temp_efficiency = temp_efficiency
+
+        temp_stress = 0
+        if temp < optimal_temp_min:
+            temp_stress = ((optimal_temp_min - temp) / (optimal_temp_min - min_survival_temp + 1e-6)) * 1.0 # 가중치 1.0
+        elif temp > optimal_temp_max:
+            temp_stress = ((temp - optimal_temp_max) / (max_survival_temp - optimal_temp_max + 1e-6)) * 1.0 # 가중치 1.0
+        self.temp_stress = temp_stress
+
+        self.temp_extreme = temp < min_survival_temp or temp > max_survival_temp
+        self.temp_optimal = optimal_temp_min <= temp <= optimal_temp_max
+        self.germination_temp_ok = temp >= species.min_temperature_for_germination
+
+        self.dry_stress_range = species.optimal_soil_water_level_min - species.min_survival_soil_water_level + 1e-6
+        self.wet_stress_threshold = species.optimal_soil_water_level_max * 1.8
+        self.wet_stress_range = species.optimal_soil_water_level_max * 0.8 + 1e-6
+
+
+class EnvironmentContext:
+    """한 cycle의 환경 값(기온, 낮 길이 비율)과 종별 반응(SpeciesResponse)을 보관합니다.
+       ClimateManager가 그날의 기후를 정한 직후 begin_cycle로 갱신하며, 종별 반응은 처음 요청될 때 계산해 그 cycle 동안 재사용합니다.
+    """
+    def __init__(self):
+        self.temperature = 0.0
+        self.day_length_ratio = 0.0
+        self._responses = {} # id(Species) -> SpeciesResponse (응답이 레코드를 붙잡고 있어 id가 재사용되지 않음)
+
+    def begin_cycle(self, temperature, day_length_ratio):
+        self.temperature = temperature
+        self.day_length_ratio = day_length_ratio
+        self._responses = {}
+
+    def response(self, species):
+        """이번 cycle 기온에 대한 species(Species 레코드)의 반응을 반환합니다."""
+        response = self._responses.get(id(species))
+        if response is None:
+            response = self._responses[id(species)] = SpeciesResponse(species, self.temperature)
+        return response
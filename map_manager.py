@@ -1,175 +1,185 @@
 # map_manager.py
 import random
-try:
-    import noise # Perlin noise
-except ImportError:
-    print("Warning: 'noise' library not found. Terrain generation will be random.")
-    noise = None
-
-# config에서 필요한 상수들을 가져옵니다.
-from config import (MAP_WIDTH, MAP_HEIGHT, TERRAIN_NOISE_SCALE, TERRAIN_NOISE_OCTAVES,
-                    TERRAIN_WATER_THRESHOLD, TERRAIN_ROCK_THRESHOLD, INITIAL_PLANT_DENSITY,
-                    DEBUG_MODE, MIN_INITIAL_PLANT_DISTANCE, MAX_SOIL_WATER_LEVEL) # MAX_SOIL_WATER_LEVEL 추가
-from terrain import TerrainType
-from soil import SoilTile
+import numpy as np
+
+# config에서 필요한 상수들을 가져옵니다. (시뮬레이션 파라미터는 SimulationConfig에서 읽음)
+from config import TERRAIN_CACHE_DIR, TERRAIN_CACHE_MIN_CELLS
+from simulation_config import DEFAULT_SIMULATION_CONFIG
+from terrain_generation import generate_terrain
+from placement import poisson_disk_sample
+from soil import SoilField
+from stats import SimulationStats
 from plant import Plant, PlantState
-from plant_species import STRONG_PLANT_SPECIES
+from plant_schedule import SpritePlantSchedule
+from tracelog import TRACE
 
 class MapManager:
-    def __init__(self, width, height, climate_manager_ref, plant_group_ref):
+    terrain_cache_dir = TERRAIN_CACHE_DIR # None이면 지형 캐시를 쓰지 않음 (벤치마크 등)
+    terrain_cache_min_cells = TERRAIN_CACHE_MIN_CELLS
+
+    def __init__(self, width, height, climate_manager_ref, plant_group_ref, sim_config=None, soil_field=None, engine="sprite"):
+        self.config = sim_config if sim_config else DEFAULT_SIMULATION_CONFIG
         self.width = width
         self.height = height
         self.climate_manager = climate_manager_ref
         self.plant_group = plant_group_ref # 식물 sprite 그룹 참조
-        self.game_map = [[None for _ in range(width)] for _ in range(height)]
+        self.plant_population = None # 배열 기반 개체군 엔진 사용 시 PlantPopulation (add_new_plant가 여기로 위임)
+        # 셀 -> Plant sprite 인덱스 ([y, x]). 셀마다 참조 한 칸(8바이트)을 쓰므로 sprite 엔진에서만 만듦
+        # (배열 엔진은 SoilField.plant_id와 PlantPopulation.row_of로 찾음)
+        self.plant_index = np.full((height, width), None, dtype=object) if engine == "sprite" else None
+        self.sprite_schedule = SpritePlantSchedule(self) # sprite 엔진에서 cycle마다 update할 식물 선택
+        if soil_field is not None: # 체크포인트 복원: 지형/토양 생성을 건너뜀
+            self.soil_field = soil_field
+            self.stats = SimulationStats(self.soil_field)
+            return
+        self.soil_field = SoilField(width, height, self.config.MAX_SOIL_WATER_LEVEL, self.config.INITIAL_SOIL_NUTRIENT_LEVEL)
+        self.stats = SimulationStats(self.soil_field)
         self._initialize_map()
         self._initialize_soil_conditions() # 초기 토양 상태 설정
 
     def _initialize_map(self):
-        """맵 데이터 구조를 생성하고 각 셀에 SoilTile 객체를 할당 및 지형을 생성합니다."""
+        """맵 전체의 지형을 한 번에 생성(또는 캐시에서 읽기)하여 SoilField의 지형 배열에 기록합니다."""
         print("Initializing map...")
-        for r in range(self.height):
-            for c in range(self.width):
-                terrain_type = self._generate_terrain_type(c, r)
-                self.game_map[r][c] = SoilTile(c, r, terrain_type)
+        terrain_seed = random.getrandbits(32) # 맵 하나에 시드 하나 (전역 난수에서 뽑으므로 시드를 고정하면 같은 지형)
+        self.soil_field.terrain[...] = generate_terrain(self.width, self.height, terrain_seed, self.config,
+                                                        cache_dir=self.terrain_cache_dir,
+                                                        cache_min_cells=self.terrain_cache_min_cells)
+        self.soil_field.refresh_terrain_masks()
         print("Map initialized.")
 
-    def _generate_terrain_type(self, x, y):
-        """주어진 좌표에 대한 지형 타입을 절차적으로 생성합니다."""
-        if noise:
-            # noise 라이브러리가 있을 경우 퍼린 노이즈 사용
-            value = noise.pnoise2(x * TERRAIN_NOISE_SCALE,
-                                  y * TERRAIN_NOISE_SCALE,
-                                  octaves=TERRAIN_NOISE_OCTAVES,
-                                  persistence=0.5,
-                                  lacunarity=2.0,
-                                  repeatx=self.width * TERRAIN_NOISE_SCALE * 2, 
-                                  repeaty=self.height * TERRAIN_NOISE_SCALE * 2,
-                                  base=random.randint(0, 100)) 
-            
-            normalized_value = (value + 0.7) / 1.4 
-            normalized_value = max(0, min(1, normalized_value))
-
-            if normalized_value < TERRAIN_WATER_THRESHOLD:
-                return TerrainType.WATER
-            elif normalized_value < TERRAIN_ROCK_THRESHOLD:
-                return TerrainType.SOIL
-            else:
-                return TerrainType.ROCK
-        else:
-            rand_val = random.random()
-            if rand_val < 0.15: 
-                return TerrainType.WATER
-            elif rand_val < 0.8: 
-                return TerrainType.SOIL
-            else: 
-                return TerrainType.ROCK
-
     def _initialize_soil_conditions(self):
         """모든 SOIL 타입 타일의 초기 온도와 수분량을 설정합니다."""
         initial_temp, _ = self.climate_manager.update_daily_climate() # 초기값 한번 업데이트
 
-        for r in range(self.height):
-            for c in range(self.width):
-                tile = self.game_map[r][c]
-                if tile.terrain_type == TerrainType.SOIL:
-                    tile.update_temperature(initial_temp)
-                    # MAX_SOIL_WATER_LEVEL이 이제 여기서 사용 가능합니다.
-                    tile.water_level = random.uniform(MAX_SOIL_WATER_LEVEL * 0.3, MAX_SOIL_WATER_LEVEL * 0.6)
-                elif tile.terrain_type == TerrainType.WATER:
-                    tile.water_level = MAX_SOIL_WATER_LEVEL 
-                    tile.update_temperature(initial_temp) 
-                else: # ROCK
-                    tile.update_temperature(initial_temp)
-                    tile.water_level = 0
+        field = self.soil_field
+        max_water_level = field.max_water_level
+        field.set_temperature(initial_temp)
+        field.water_level.fill(0)
+        flat_water = field.water_level.reshape(-1)
+        # 행 우선 순서로 SOIL 셀마다 난수를 뽑아 셀 단위 초기화와 같은 난수 순서를 유지
+        flat_water[field.soil_cell_index] = [random.uniform(max_water_level * 0.3, max_water_level * 0.6)
+                                             for _ in range(field.soil_cell_index.size)]
+        flat_water[field.water_cell_index] = max_water_level
+        field.recompute_soil_water_total()
 
 
     def initial_plant_placement(self):
-        """초기 식물을 맵에 배치합니다."""
-        soil_tiles_coords = []
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.game_map[r][c].terrain_type == TerrainType.SOIL:
-                    soil_tiles_coords.append((c, r))
-        
-        if not soil_tiles_coords:
+        """초기 식물을 Poisson-disk 표본 추출로 맵에 배치합니다 (서로 MIN_INITIAL_PLANT_DISTANCE 이상 떨어짐)."""
+        free_soil = self.soil_field.free_soil
+        soil_cell_count = int(self.soil_field.soil_cell_index.size)
+        if not soil_cell_count:
             print("Warning: No SOIL tiles found for plant placement.")
             return
 
-        num_initial_plants = int(len(soil_tiles_coords) * INITIAL_PLANT_DENSITY)
-        if DEBUG_MODE: print(f"Attempting to place {num_initial_plants} initial plants.")
-
-        placed_plants_coords = []
-        attempts = 0
-        max_attempts = num_initial_plants * 10 
-
-        while len(placed_plants_coords) < num_initial_plants and attempts < max_attempts:
-            attempts += 1
-            coord = random.choice(soil_tiles_coords)
-            x, y = coord
-            tile = self.get_tile(x,y)
-
-            if tile and tile.can_plant_grow_here():
-                too_close = False
-                for px, py in placed_plants_coords:
-                    distance_sq = (x - px)**2 + (y - py)**2
-                    if distance_sq < MIN_INITIAL_PLANT_DISTANCE**2:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    self.add_new_plant(x, y, PlantState.SEED, STRONG_PLANT_SPECIES)
-                    placed_plants_coords.append((x,y))
-        
-        if DEBUG_MODE: print(f"Placed {len(placed_plants_coords)} plants after {attempts} attempts.")
+        num_initial_plants = int(soil_cell_count * self.config.INITIAL_PLANT_DENSITY)
+        if TRACE.enabled: TRACE.emit("map.place", "Attempting to place {} initial plants.", num_initial_plants)
+
+        rng = np.random.default_rng(random.getrandbits(32)) # 배치 순서용 난수 (전역 난수에서 시드를 뽑아 재현 가능)
+        xs, ys = poisson_disk_sample(free_soil, num_initial_plants, self.config.MIN_INITIAL_PLANT_DISTANCE, rng)
+        if len(xs) < num_initial_plants: # 무작위 순서로는 자리가 모자라면 조밀한 격자 위치부터 채워서 다시 시도
+            lattice_xs, lattice_ys = poisson_disk_sample(free_soil, num_initial_plants, self.config.MIN_INITIAL_PLANT_DISTANCE,
+                                                         rng, lattice_first=True)
+            if len(lattice_xs) > len(xs):
+                xs, ys = lattice_xs, lattice_ys
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            self.add_new_plant(x, y, PlantState.SEED, self.config.STRONG_PLANT_SPECIES)
+
+        if len(xs) < num_initial_plants:
+            print(f"Warning: Placed {len(xs)} of {num_initial_plants} initial plants (no room left at MIN_INITIAL_PLANT_DISTANCE).")
+        elif TRACE.enabled:
+            TRACE.emit("map.place", "Placed {} plants.", len(xs))
 
 
     def add_new_plant(self, grid_x, grid_y, initial_state, species_data):
         """새로운 식물을 생성하고 맵과 그룹에 추가합니다."""
-        tile = self.get_tile(grid_x, grid_y)
-        if tile and tile.can_plant_grow_here():
+        if self.plant_population is not None:
+            return self.plant_population.spawn(grid_x, grid_y, initial_state, species_data)
+        if self.can_plant_grow_at(grid_x, grid_y):
             new_plant = Plant(grid_x, grid_y, species_data, initial_state, map_manager_ref=self)
             self.plant_group.add(new_plant)
-            tile.set_occupancy(True, id(new_plant)) 
-            if DEBUG_MODE and initial_state == PlantState.SEED : print(f"New seed placed at ({grid_x}, {grid_y}) by reproduction/initial.")
+            self.sprite_schedule.add(new_plant, self.current_cycle())
+            self.soil_field.set_occupancy(grid_x, grid_y, True, id(new_plant))
+            self.plant_index[grid_y, grid_x] = new_plant
+            self.stats.on_birth(initial_state, new_plant.current_size)
+            if TRACE.enabled and initial_state == PlantState.SEED and TRACE.watches(new_plant.plant_id, grid_x, grid_y):
+                TRACE.emit("seed.place", "New seed placed by reproduction/initial.", plant_id=new_plant.plant_id, x=grid_x, y=grid_y)
             return new_plant
         return None
 
+    def remove_plant(self, plant):
+        """식물을 맵에서 제거합니다 (타일 점유 해제, 인덱스 삭제, 그룹에서 제거)."""
+        if self.is_valid_tile(plant.grid_x, plant.grid_y):
+            self.soil_field.set_occupancy(plant.grid_x, plant.grid_y, False)
+        if self.plant_index[plant.grid_y, plant.grid_x] is plant:
+            self.plant_index[plant.grid_y, plant.grid_x] = None
+        if plant.alive():
+            self.stats.on_removal(plant.current_state, plant.current_size)
+        plant.kill()
+
+    def plant_at(self, x, y):
+        """(x, y) 셀에 있는 Plant sprite를 O(1)로 반환합니다. 없으면 None. (sprite 엔진 전용)"""
+        if not self.is_valid_tile(x, y):
+            return None
+        return self.plant_index[y, x]
+
+    def plant_row_at(self, x, y):
+        """(x, y) 셀에 있는 식물의 PlantPopulation 행 번호를 반환합니다. 없으면 None. (배열 엔진 전용)"""
+        if not self.is_valid_tile(x, y):
+            return None
+        return self.plant_population.row_of(self.soil_field.plant_id.item(y, x))
+
+    def occupied_cells_in_rect(self, x0, y0, x1, y1):
+        """[x0, x1) x [y0, y1) 범위(맵 경계로 잘림)에서 식물이 있는 셀의 (xs, ys) 배열을 반환합니다."""
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width, x1), min(self.height, y1)
+        if x0 >= x1 or y0 >= y1:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        ys, xs = np.nonzero(self.soil_field.occupied[y0:y1, x0:x1])
+        return xs + x0, ys + y0
+
+    def plants_in_rect(self, x0, y0, x1, y1):
+        """[x0, x1) x [y0, y1) 범위의 Plant sprite 목록을 행 우선 순서로 반환합니다. (sprite 엔진 전용)"""
+        xs, ys = self.occupied_cells_in_rect(x0, y0, x1, y1)
+        return self.plant_index[ys, xs].tolist()
+
+    def plant_rows_in_rect(self, x0, y0, x1, y1):
+        """[x0, x1) x [y0, y1) 범위 식물의 PlantPopulation 행 번호 목록을 행 우선 순서로 반환합니다. (배열 엔진 전용)"""
+        xs, ys = self.occupied_cells_in_rect(x0, y0, x1, y1)
+        return [self.plant_row_at(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+
+    def _occupied_cells_near(self, x, y, radius):
+        """(x, y)에서 유클리드 거리 radius 이내(중심 셀 제외)의 식물이 있는 셀의 (xs, ys) 배열을 반환합니다."""
+        xs, ys = self.occupied_cells_in_rect(x - radius, y - radius, x + radius + 1, y + radius + 1)
+        near = ((xs - x) ** 2 + (ys - y) ** 2 <= radius * radius) & ~((xs == x) & (ys == y))
+        return xs[near], ys[near]
+
+    def plants_near(self, x, y, radius):
+        """(x, y)에서 유클리드 거리 radius 이내(중심 셀 제외)의 Plant sprite 목록을 반환합니다. (sprite 엔진 전용)"""
+        xs, ys = self._occupied_cells_near(x, y, radius)
+        return self.plant_index[ys, xs].tolist()
+
+    def plant_rows_near(self, x, y, radius):
+        """(x, y)에서 유클리드 거리 radius 이내(중심 셀 제외) 식물의 PlantPopulation 행 번호 목록을 반환합니다. (배열 엔진 전용)"""
+        xs, ys = self._occupied_cells_near(x, y, radius)
+        return [self.plant_row_at(px, py) for px, py in zip(xs.tolist(), ys.tolist())]
+
+    def can_plant_grow_at(self, x, y):
+        """(x, y)가 맵 안의 비어 있는 SOIL 셀인지 타일 뷰를 만들지 않고 확인합니다."""
+        return 0 <= y < self.height and 0 <= x < self.width and self.soil_field.free_soil.item(y, x)
+
     def get_tile(self, x, y):
-        """주어진 격자 좌표의 SoilTile 객체를 반환합니다."""
+        """주어진 격자 좌표의 SoilTile 뷰를 반환합니다."""
         if 0 <= y < self.height and 0 <= x < self.width:
-            return self.game_map[y][x]
+            return self.soil_field.tile(x, y)
         return None
 
+    def current_cycle(self):
+        """지금까지 진행한 cycle 수를 반환합니다 (식물 사건 예약의 기준 시각)."""
+        return self.climate_manager.time_manager.total_cycles_elapsed
+
     def is_valid_tile(self, x, y):
         return 0 <= y < self.height and 0 <= x < self.width
 
     def update_map_environment(self, daily_temp, daily_rain_amount):
-        """맵 전체의 토양 온도와 수분량을 업데이트합니다."""
-        for r in range(self.height):
-            for c in range(self.width):
-                tile = self.game_map[r][c]
-                tile.update_temperature(daily_temp)
-                if tile.terrain_type == TerrainType.SOIL:
-                    if daily_rain_amount > 0:
-                        tile.add_water(daily_rain_amount) 
-                    
-                    evaporation_rate = 0.01 + (tile.temperature / 30.0) * 0.02 + (tile.water_level / MAX_SOIL_WATER_LEVEL) * 0.01
-                    evaporation_amount = tile.water_level * evaporation_rate
-                    tile.evaporate_water(max(0, evaporation_amount)) 
-                
-                elif tile.terrain_type == TerrainType.WATER:
-                    tile.water_level = MAX_SOIL_WATER_LEVEL
-
-
-    def get_average_soil_water_level(self):
-        """모든 SOIL 타일의 평균 수분량을 계산합니다."""
-        total_water = 0
-        soil_tile_count = 0
-        for r in range(self.height):
-            for c in range(self.width):
-                tile = self.game_map[r][c]
-                if tile.terrain_type == TerrainType.SOIL:
-                    total_water += tile.water_level
-                    soil_tile_count += 1
-        return total_water / soil_tile_count if soil_tile_count > 0 else 0
\ No newline at end of file
+        """맵 전체의 토양 온도와 수분량을 배열 연산으로 업데이트합니다."""
+        self.soil_field.update_environment(daily_temp, daily_rain_amount)
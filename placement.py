@@ -0,0 +1,86 @@
+# placement.py
+# 초기 식물 배치용 Poisson-disk 표본 추출: 후보 셀을 무작위 순서로 묶음 단위로 받아들이며,
+# 받아들인 점 주변 원판을 격자 비트맵에 막아 두어 거리 검사를 셀 수와 무관하게 상수 시간에 합니다.
+import math
+
+import numpy as np
+
+PLACEMENT_BATCH_SIZE = 4096 # 한 번에 검사하는 후보 셀 수
+
+def disk_offsets(min_distance):
+    """거리 제곱이 min_distance**2 미만인 격자 오프셋 (dx, dy) 배열을 반환합니다 ((0, 0) 포함)."""
+    reach = int(math.ceil(min_distance))
+    dy, dx = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+    inside = dx * dx + dy * dy < min_distance * min_distance
+    return dx[inside], dy[inside]
+
+def densest_lattice(min_distance, search_range=3):
+    """모든 점 사이 거리가 min_distance 이상인 정수 격자 중 밀도가 가장 높은 것의 기저 (a, 0), (b, c)를 찾습니다."""
+    a = max(1, int(math.ceil(min_distance)))
+    for c in range(1, a + 1):
+        for b in range(a):
+            shortest = min((i * a + j * b) ** 2 + (j * c) ** 2
+                           for i in range(-search_range, search_range + 1) for j in range(-search_range, search_range + 1)
+                           if i or j)
+            if shortest >= min_distance * min_distance:
+                return a, b, c
+    return a, 0, a
+
+def poisson_disk_sample(candidate_mask, count, min_distance, rng, lattice_first=False):
+    """candidate_mask(height x width bool)에서 서로 거리가 min_distance 이상인 셀을 최대 count개 고릅니다.
+       모든 후보 셀을 무작위 순서로 한 번씩 살펴보므로, count개를 채우지 못하면 남은 어느 후보 셀도
+       이미 고른 셀과 min_distance 이상 떨어져 있지 않은 상태(더 놓을 자리가 없음)입니다.
+       lattice_first이면 가장 조밀한 정수 격자 위의 셀을 먼저 살펴봅니다 (열린 땅에서 최대에 가까운 개수를 놓을 수 있음).
+       고른 순서대로 (xs, ys)를 반환합니다.
+    """
+    height, width = candidate_mask.shape
+    if count <= 0 or min_distance <= 0:
+        ys, xs = np.nonzero(candidate_mask)
+        order = rng.permutation(len(xs))[:max(count, 0)]
+        return xs[order], ys[order]
+
+    offset_xs, offset_ys = disk_offsets(min_distance)
+    pad = int(math.ceil(min_distance))
+    padded_width = width + 2 * pad
+    # 가장자리를 한 번에 처리하기 위해 pad만큼 넓힌 평면 배열 사용 (가장자리 바깥은 항상 막힘)
+    blocked = np.ones((height + 2 * pad) * padded_width, dtype=bool)
+    blocked.reshape(height + 2 * pad, padded_width)[pad:pad + height, pad:pad + width] = ~candidate_mask
+    flat_offsets = offset_ys * padded_width + offset_xs
+    neighbour_offsets = flat_offsets[flat_offsets != 0]
+    owner = np.full(blocked.size, np.iinfo(np.int64).max, dtype=np.int64) # 묶음 안 후보의 순번 (충돌 판정용)
+
+    ys, xs = np.nonzero(candidate_mask)
+    order = rng.permutation(len(xs))
+    if lattice_first:
+        a, b, c = densest_lattice(min_distance)
+        on_lattice = (ys % c == 0) & ((xs - (ys // c) * b) % a == 0)
+        order = order[np.argsort(~on_lattice[order], kind="stable")]
+    candidates = (ys[order] + pad) * padded_width + (xs[order] + pad)
+
+    chosen = []
+    chosen_count = 0
+    pending = np.zeros(0, dtype=np.int64) # 앞 묶음에서 충돌로 미뤄진 후보 (다시 검사)
+    position = 0
+    while chosen_count < count and (position < len(candidates) or len(pending)):
+        batch = np.concatenate([pending, candidates[position:position + PLACEMENT_BATCH_SIZE]])
+        position += PLACEMENT_BATCH_SIZE
+        batch = batch[~blocked[batch]]
+        if not len(batch):
+            pending = batch
+            continue
+        # 묶음 안에서 자기보다 앞선 후보가 거리 안에 있으면 이번에는 보류
+        rank = np.arange(len(batch))
+        owner[batch] = rank
+        conflict = np.zeros(len(batch), dtype=bool)
+        for offset in neighbour_offsets:
+            conflict |= owner[batch + offset] < rank
+        owner[batch] = np.iinfo(np.int64).max
+        accepted = batch[~conflict][:count - chosen_count]
+        for offset in flat_offsets:
+            blocked[accepted + offset] = True
+        chosen.append(accepted)
+        chosen_count += len(accepted)
+        pending = batch[conflict]
+
+    chosen = np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
+    return chosen % padded_width - pad, chosen // padded_width - pad
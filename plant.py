@@ -2,16 +2,15 @@
 import pygame
 import enum
 import random
-# DEBUG_MODE 및 필요한 설정값 가져오기
-from config import (PLANT_COLORS, GRID_SIZE, MIN_HEALTH_FOR_SURVIVAL,
-                    ENERGY_COST_FOR_MAINTENANCE_PER_CYCLE, WATER_COST_FOR_MAINTENANCE_PER_CYCLE,
-                    PHOTOSYNTHESIS_BASE_EFFICIENCY, WATER_ABSORPTION_RATE,
-                    STRESS_DAMAGE_RATE, HEALING_RATE_UNDER_OPTIMAL_CONDITIONS,
-                    SAPLING_TO_ADULT_GROWTH_PER_CYCLE, REPRODUCTION_ENERGY_THRESHOLD_FACTOR,
-                    REPRODUCTION_WATER_THRESHOLD_FACTOR, SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE,
-                    DEAD_PLANT_REMOVAL_CYCLES, DEBUG_MODE) # DEBUG_MODE 임포트
-from plant_species import STRONG_PLANT_SPECIES
+import time
+# 표시용 설정값 가져오기 (시뮬레이션 파라미터는 SimulationConfig에서 읽음)
+from config import PLANT_COLORS, GRID_SIZE
+from simulation_config import DEFAULT_SIMULATION_CONFIG
+from species_registry import SPECIES_REGISTRY
+from dispersal import draw_seed_targets
+from profiler import add_phase_time
 from terrain import TerrainType # TerrainType Enum 임포트 (지형 비교용)
+from tracelog import TRACE
 
 class PlantState(enum.Enum):
     SEED = "SEED"
@@ -19,11 +18,59 @@ class PlantState(enum.Enum):
     ADULT = "ADULT"
     DEAD = "DEAD"
 
+class DeathCause(enum.Enum):
+    OLD_AGE = "OLD_AGE"
+    EXTREME_TEMPERATURE = "EXTREME_TEMPERATURE"
+    LOW_HEALTH = "LOW_HEALTH"
+    SEED_FAILURE = "SEED_FAILURE" # 발아하지 못하고 죽음 (발아 가능 기간 종료 등)
+
+# (상태, 픽셀 크기, 색) -> 미리 그린 식물 이미지. 모든 식물이 같은 Surface를 공유
+_PLANT_IMAGE_CACHE = {}
+
+def get_plant_image(state, pixel_size, color):
+    """주어진 조합의 식물 이미지를 캐시에서 꺼내 반환합니다 (없으면 한 번만 그림)."""
+    key = (state, pixel_size, color)
+    image = _PLANT_IMAGE_CACHE.get(key)
+    if image is None:
+        image = pygame.Surface([pixel_size, pixel_size], pygame.SRCALPHA) 
+        pygame.draw.circle(image, color, (pixel_size // 2, pixel_size // 2), pixel_size // 2)
+        _PLANT_IMAGE_CACHE[key] = image
+    return image
+
+def plant_visual_key(state, size, adult_max_size):
+    """상태와 크기에 맞는 (상태, 픽셀 크기, 색) 조합을 반환합니다 (sprite/배열 엔진 공용)."""
+    pixel_size = 0
+    color = PLANT_COLORS["DEAD"]
+
+    if state == PlantState.SEED:
+        pixel_size = max(1, int(GRID_SIZE * 0.2))
+        color = PLANT_COLORS["SEED"]
+    elif state == PlantState.SAPLING:
+        pixel_size = max(2, int(GRID_SIZE * (0.2 + size * 2))) 
+        color = PLANT_COLORS["SAPLING"]
+    elif state == PlantState.ADULT:
+        size_ratio = size / adult_max_size if adult_max_size > 0 else 0
+        if size_ratio < 0.2: color = PLANT_COLORS["ADULT_STAGE_1"]
+        elif size_ratio < 0.4: color = PLANT_COLORS["ADULT_STAGE_2"]
+        elif size_ratio < 0.6: color = PLANT_COLORS["ADULT_STAGE_3"]
+        elif size_ratio < 0.8: color = PLANT_COLORS["ADULT_STAGE_4"]
+        else: color = PLANT_COLORS["ADULT_STAGE_5"]
+        pixel_size = max(3, int(GRID_SIZE * (0.3 + size * 0.6)))
+    elif state == PlantState.DEAD:
+        pixel_size = max(1, int(GRID_SIZE * 0.15))
+        color = PLANT_COLORS["DEAD"]
+    return state, pixel_size, color
+
 class Plant(pygame.sprite.Sprite):
+    # False이면 sprite 이미지를 만들지 않음 (헤드리스 실행용)
+    visuals_enabled = True
+
     def __init__(self, grid_x, grid_y, species_data=None, initial_state=PlantState.SEED, map_manager_ref=None):
         super().__init__()
-        self.species_data = species_data if species_data else STRONG_PLANT_SPECIES
         self.map_manager = map_manager_ref
+        self.config = map_manager_ref.config if map_manager_ref else DEFAULT_SIMULATION_CONFIG
+        self.species_data = species_data if species_data else self.config.STRONG_PLANT_SPECIES
+        self.species = SPECIES_REGISTRY.get(self.species_data) # 컴파일한 종 특성 (매번 사전을 찾지 않도록)
         self.plant_id = id(self) # 디버깅을 위한 고유 ID
 
         self.grid_x = grid_x
@@ -33,85 +80,144 @@ class Plant(pygame.sprite.Sprite):
         self.current_state = initial_state
         self.current_size = 0.01 if initial_state == PlantState.SEED else 0.05
         
-        self.target_size_for_adult = self.species_data["default_target_size_for_adult"]
-        adult_max_size_base = self.species_data["adult_max_size"]
+        self.target_size_for_adult = self.species.default_target_size_for_adult
+        adult_max_size_base = self.species.adult_max_size
         self.adult_max_size_actual = random.uniform(
             adult_max_size_base * (1 - 0.1),
             adult_max_size_base * (1 + 0.1)
         )
 
-        self.max_water_capacity = self.current_size * self.species_data["max_water_capacity_factor_size"]
+        self.max_water_capacity = self.current_size * self.species.max_water_capacity_factor_size
         self.current_water = self.max_water_capacity * 0.5
-        self.max_energy_capacity = self.current_size * self.species_data["max_energy_capacity_factor_size"]
+        self.max_energy_capacity = self.current_size * self.species.max_energy_capacity_factor_size
         self.current_energy = self.max_energy_capacity * 0.5
 
-        self.growth_rate_factor = self.species_data["base_growth_rate_factor"]
+        self.growth_rate_factor = self.species.base_growth_rate_factor
         self.reproduction_cooldown = 0
-        self.cycles_since_death = 0
+        current_cycle = map_manager_ref.current_cycle() if map_manager_ref else 0
+        self.death_cycle = 0
+        self.seed_birth_cycle = current_cycle # 씨앗은 잠든 동안 나이를 올리지 않고 이 cycle로부터 계산
+        self.seed_cohort = None # 잠든 동안 건강/자원을 함께 계산하는 DormantSeedCohort (SpritePlantSchedule이 지정)
+        self.spawn_order = 0 # 그룹(갱신) 순서, SpritePlantSchedule이 매김
+        self.traced = False # 이번 cycle에 추적 로그를 남기는지 (update 시작 시 TRACE 필터로 결정)
 
         self.image = None
         self.rect = None
+        self._current_visual_key = None
         self._update_visuals()
 
-        if DEBUG_MODE: print(f"Plant {self.plant_id} created at ({grid_x},{grid_y}), State: {initial_state}")
+        if TRACE.enabled and TRACE.watches(self.plant_id, grid_x, grid_y):
+            self._trace("plant.create", "State: {}", initial_state.value)
+
+    @classmethod
+    def restore(cls, fields, species_data, map_manager_ref):
+        """체크포인트에 저장된 값으로 식물을 다시 만듭니다. 생성자와 달리 난수를 쓰지 않습니다."""
+        plant = cls.__new__(cls)
+        pygame.sprite.Sprite.__init__(plant)
+        plant.map_manager = map_manager_ref
+        plant.config = map_manager_ref.config if map_manager_ref else DEFAULT_SIMULATION_CONFIG
+        plant.species_data = species_data
+        plant.species = SPECIES_REGISTRY.get(species_data)
+        plant.plant_id = id(plant)
+
+        plant.grid_x = fields["grid_x"]
+        plant.grid_y = fields["grid_y"]
+        plant.age = fields["age"]
+        plant.health = fields["health"]
+        plant.current_state = fields["state"]
+        plant.current_size = fields["size"]
+        plant.target_size_for_adult = plant.species.default_target_size_for_adult
+        plant.adult_max_size_actual = fields["adult_max_size"]
+        plant.max_water_capacity = fields["max_water"]
+        plant.current_water = fields["water"]
+        plant.max_energy_capacity = fields["max_energy"]
+        plant.current_energy = fields["energy"]
+        plant.growth_rate_factor = plant.species.base_growth_rate_factor
+        plant.reproduction_cooldown = fields["cooldown"]
+        plant.death_cycle = fields["death_cycle"]
+        plant.seed_birth_cycle = (map_manager_ref.current_cycle() if map_manager_ref else 0) - plant.age
+        plant.seed_cohort = None
+        plant.spawn_order = 0
+        plant.traced = False
+
+        plant.image = None
+        plant.rect = None
+        plant._current_visual_key = None
+        plant._update_visuals()
+        return plant
 
     def _update_visuals(self):
-        # ... (기존 _update_visuals 내용 동일)
-        pixel_size = 0
-        color = PLANT_COLORS["DEAD"]
+        if not Plant.visuals_enabled:
+            return
+        visual_key = self._visual_key()
+        if visual_key == self._current_visual_key:
+            return # 상태/크기 단계가 그대로면 이미지를 다시 고를 필요 없음
+        self._current_visual_key = visual_key
 
-        if self.current_state == PlantState.SEED:
-            pixel_size = max(1, int(GRID_SIZE * 0.2))
-            color = PLANT_COLORS["SEED"]
-        elif self.current_state == PlantState.SAPLING:
-            pixel_size = max(2, int(GRID_SIZE * (0.2 + self.current_size * 2))) 
-            color = PLANT_COLORS["SAPLING"]
-        elif self.current_state == PlantState.ADULT:
-            size_ratio = self.current_size / self.adult_max_size_actual if self.adult_max_size_actual > 0 else 0
-            if size_ratio < 0.2: color = PLANT_COLORS["ADULT_STAGE_1"]
-            elif size_ratio < 0.4: color = PLANT_COLORS["ADULT_STAGE_2"]
-            elif size_ratio < 0.6: color = PLANT_COLORS["ADULT_STAGE_3"]
-            elif size_ratio < 0.8: color = PLANT_COLORS["ADULT_STAGE_4"]
-            else: color = PLANT_COLORS["ADULT_STAGE_5"]
-            pixel_size = max(3, int(GRID_SIZE * (0.3 + self.current_size * 0.6)))
-        elif self.current_state == PlantState.DEAD:
-            pixel_size = max(1, int(GRID_SIZE * 0.15))
-            color = PLANT_COLORS["DEAD"]
-
-        self.image = pygame.Surface([pixel_size, pixel_size], pygame.SRCALPHA) 
-        pygame.draw.circle(self.image, color, (pixel_size // 2, pixel_size // 2), pixel_size // 2)
-        
+        self.image = get_plant_image(*visual_key)
         center_x = self.grid_x * GRID_SIZE + GRID_SIZE // 2
         center_y = self.grid_y * GRID_SIZE + GRID_SIZE // 2
         self.rect = self.image.get_rect(center=(center_x, center_y))
 
+    @property
+    def visual_key(self):
+        """화면에 그릴 (상태, 픽셀 크기, 색) 조합을 반환합니다 (이미지를 만들지 않는 경우에도 현재 값으로 계산)."""
+        if self._current_visual_key is not None:
+            return self._current_visual_key
+        return self._visual_key()
 
-    def update(self, current_soil_tile, climate_info, time_manager):
-        if self.current_state == PlantState.DEAD:
-            self.cycles_since_death += 1
-            if self.cycles_since_death > DEAD_PLANT_REMOVAL_CYCLES:
+    def _visual_key(self):
+        """현재 상태에 맞는 (상태, 픽셀 크기, 색) 조합을 반환합니다."""
+        return plant_visual_key(self.current_state, self.current_size, self.adult_max_size_actual)
+
+
+    def sync_dormant_state(self, current_cycle):
+        """잠든 씨앗은 매 cycle update하지 않으므로, 표시하거나 저장하기 전에 나이와 건강/자원을 current_cycle 기준으로 맞춥니다."""
+        if self.current_state == PlantState.SEED:
+            self.age = current_cycle - self.seed_birth_cycle
+            cohort = self.seed_cohort
+            if cohort is not None:
+                self.health, self.current_energy, self.current_water = cohort.health, cohort.energy, cohort.water
+
+    def _trace(self, event, message, *args):
+        """이 식물의 사건을 추적 로그에 남깁니다 (self.traced일 때만 호출)."""
+        TRACE.emit(event, message, *args, plant_id=self.plant_id, x=self.grid_x, y=self.grid_y)
+
+    def update(self, current_soil_tile, climate_info, time_manager, timings=None):
+        """한 cycle 동안 식물을 갱신합니다. timings 사전을 주면 세부 단계(profiler.PLANT_PHASES) 시간을 누적합니다."""
+        self.traced = TRACE.enabled and TRACE.watches(self.plant_id, self.grid_x, self.grid_y)
+        if self.current_state == PlantState.DEAD: # SpritePlantSchedule은 제거 예정 cycle에만 호출
+            if time_manager.total_cycles_elapsed - self.death_cycle > self.config.DEAD_PLANT_REMOVAL_CYCLES:
+                if self.traced: self._trace("plant.remove", "DEAD, removing from group.")
                 if self.map_manager:
-                    tile = self.map_manager.get_tile(self.grid_x, self.grid_y)
-                    if tile: tile.set_occupancy(False)
-                if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) DEAD, removing from group.")
-                self.kill()
+                    self.map_manager.remove_plant(self)
+                else:
+                    self.kill()
             return
 
-        if DEBUG_MODE:
-            print(f"--- Plant {self.plant_id} ({self.grid_x},{self.grid_y}) Update START --- Age: {self.age}, State: {self.current_state.value}, Size: {self.current_size:.3f}, Health: {self.health:.2f}, Energy: {self.current_energy:.3f}/{self.max_energy_capacity:.3f}, Water: {self.current_water:.3f}/{self.max_water_capacity:.3f}")
+        if self.traced:
+            self._trace("plant.update", "START Age: {}, State: {}, Size: {:.3f}, Health: {:.2f}, Energy: {:.3f}/{:.3f}, Water: {:.3f}/{:.3f}",
+                        self.age, self.current_state.value, self.current_size, self.health,
+                        self.current_energy, self.max_energy_capacity, self.current_water, self.max_water_capacity)
 
         self.age += 1
-        if self.age > self.species_data["max_lifespan_cycles"]:
-            self._die("Old age")
+        if self.age > self.species.max_lifespan_cycles:
+            self._die("Old age", DeathCause.OLD_AGE)
             return
 
+        if timings is not None: phase_start = time.perf_counter()
+        environment = climate_info.environment # 오늘 기온/낮 길이와 이 종의 반응 (종마다 cycle당 한 번 계산)
+        response = environment.response(self.species)
         self._absorb_water(current_soil_tile)
-        self._photosynthesize(climate_info, time_manager.current_season)
+        if timings is not None: phase_start = add_phase_time(timings, "plants.absorb", phase_start)
+        self._photosynthesize(environment, response)
+        if timings is not None: phase_start = add_phase_time(timings, "plants.photosynthesize", phase_start)
         self._consume_resources_for_life() # 생명 유지 자원 소모는 스트레스 체크 전에 수행
-        self._check_environmental_stress(current_soil_tile, climate_info) # 스트레스가 건강에 영향
+        self._check_environmental_stress(current_soil_tile, environment, response) # 스트레스가 건강에 영향
+        if timings is not None: phase_start = add_phase_time(timings, "plants.stress", phase_start)
 
-        if self.health <= MIN_HEALTH_FOR_SURVIVAL and self.current_state != PlantState.DEAD : # 이미 죽은 상태가 아니면
-            self._die("Low health")
+        if self.health <= self.config.MIN_HEALTH_FOR_SURVIVAL and self.current_state != PlantState.DEAD : # 이미 죽은 상태가 아니면
+            self._die("Low health", DeathCause.LOW_HEALTH)
             return
         
         if self.reproduction_cooldown > 0:
@@ -122,17 +228,35 @@ class Plant(pygame.sprite.Sprite):
         elif self.current_state == PlantState.SAPLING:
             self._handle_sapling_state()
         elif self.current_state == PlantState.ADULT:
-            self._handle_adult_state(current_soil_tile, climate_info)
+            self._handle_adult_state()
+            if self.age >= self.species.maturity_age_cycles and self.reproduction_cooldown == 0:
+                if timings is not None: phase_start = add_phase_time(timings, "plants.grow", phase_start)
+                self._reproduce(current_soil_tile, response)
+                if timings is not None: phase_start = add_phase_time(timings, "plants.reproduce", phase_start)
         
         self._update_capacities()
         self._update_visuals()
-        if DEBUG_MODE:
-            print(f"--- Plant {self.plant_id} ({self.grid_x},{self.grid_y}) Update END --- Health: {self.health:.2f}, Energy: {self.current_energy:.3f}, Water: {self.current_water:.3f}, Size: {self.current_size:.3f}\n")
+        if timings is not None: add_phase_time(timings, "plants.grow", phase_start)
+        if self.traced:
+            self._trace("plant.update", "END Health: {:.2f}, Energy: {:.3f}, Water: {:.3f}, Size: {:.3f}",
+                        self.health, self.current_energy, self.current_water, self.current_size)
 
 
+    def _set_state(self, new_state):
+        """상태를 바꾸고 맵 통계에 알립니다."""
+        if self.map_manager:
+            self.map_manager.stats.on_state_change(self.current_state, new_state, self.current_size)
+        self.current_state = new_state
+
+    def _set_size(self, new_size):
+        """크기를 바꾸고 맵 통계(생체량)에 변화량을 알립니다."""
+        if self.map_manager:
+            self.map_manager.stats.on_growth(new_size - self.current_size)
+        self.current_size = new_size
+
     def _update_capacities(self):
-        new_max_water = self.current_size * self.species_data["max_water_capacity_factor_size"]
-        new_max_energy = self.current_size * self.species_data["max_energy_capacity_factor_size"]
+        new_max_water = self.current_size * self.species.max_water_capacity_factor_size
+        new_max_energy = self.current_size * self.species.max_energy_capacity_factor_size
         
         # 최대 용량이 줄어들 경우, 현재 보유량이 새 최대 용량을 초과하지 않도록 조정
         if new_max_water < self.max_water_capacity and self.current_water > new_max_water:
@@ -148,49 +272,78 @@ class Plant(pygame.sprite.Sprite):
         self.current_energy = min(self.current_energy, self.max_energy_capacity)
 
 
-    def _handle_seed_state(self, current_soil_tile):
-        can_germinate = (current_soil_tile.water_level >= self.species_data["min_water_for_germination_soil"] and
-                         current_soil_tile.temperature >= self.species_data["min_temperature_for_germination"] and
-                         self.age <= self.species_data["seed_viability_duration_cycles"])
+    def update_dormant_seed(self, current_soil_tile, climate_info, current_cycle):
+        """SpritePlantSchedule이 잠든 씨앗을 깨워 current_cycle 시점으로 처리합니다.
+           자원 소모와 스트레스는 씨앗 묶음(DormantSeedCohort)이 이미 이번 cycle까지 계산했으므로,
+           update와 같은 순서로 수명, 극한 온도, 건강 악화, 발아/발아 가능 기간 종료만 확인합니다.
+           발아하지 못한 씨앗의 사망 확률 판정은 그룹 순서를 지키도록 roll_seed_failure로 따로 합니다.
+        """
+        self.traced = TRACE.enabled and TRACE.watches(self.plant_id, self.grid_x, self.grid_y)
+        self.sync_dormant_state(current_cycle)
+        if self.age > self.species.max_lifespan_cycles:
+            self._die("Old age", DeathCause.OLD_AGE)
+            return
+        environment = climate_info.environment
+        if environment.response(self.species).temp_extreme:
+            self._die(f"Extreme temperature: {environment.temperature:.1f}C", DeathCause.EXTREME_TEMPERATURE)
+            return
+        if self.health <= self.config.MIN_HEALTH_FOR_SURVIVAL:
+            self._die("Low health", DeathCause.LOW_HEALTH)
+            return
+        self._handle_seed_state(current_soil_tile, roll_failure=False)
+        if self.current_state == PlantState.SAPLING:
+            self._update_visuals()
+
+    def roll_seed_failure(self):
+        """발아하지 못한 잠든 씨앗이 이번 cycle SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE 확률로 죽는지 판정합니다.
+           update에서처럼 그룹 순서대로 난수를 하나씩 씁니다.
+        """
+        if random.random() < self.config.SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE:
+            self.traced = TRACE.enabled and TRACE.watches(self.plant_id, self.grid_x, self.grid_y)
+            if self.traced: self._trace("seed.fail", "Seed failed to germinate or viability ended. Age: {}", self.age)
+            self._die("Failed to germinate or viability ended", DeathCause.SEED_FAILURE)
+
+    def _handle_seed_state(self, current_soil_tile, roll_failure=True):
+        can_germinate = (current_soil_tile.water_level >= self.species.min_water_for_germination_soil and
+                         current_soil_tile.temperature >= self.species.min_temperature_for_germination and
+                         self.age <= self.species.seed_viability_duration_cycles)
 
         if can_germinate:
-            self.current_state = PlantState.SAPLING
-            self.current_size = 0.05 
+            self._set_state(PlantState.SAPLING)
+            self._set_size(0.05)
             self.health = 100.0 
             self._update_capacities() # 중요: 상태 변경 후 즉시 용량 업데이트
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _handle_seed_state: Germinated! New state: SAPLING, Size: {self.current_size:.3f}")
-        elif self.age > self.species_data["seed_viability_duration_cycles"] or \
-             random.random() < SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE:
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _handle_seed_state: Seed failed to germinate or viability ended. Age: {self.age}")
-            self._die("Failed to germinate or viability ended")
+            if self.traced: self._trace("seed.germinate", "Germinated! New state: SAPLING, Size: {:.3f}", self.current_size)
+        elif self.age > self.species.seed_viability_duration_cycles or \
+             (roll_failure and random.random() < self.config.SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE):
+            if self.traced: self._trace("seed.fail", "Seed failed to germinate or viability ended. Age: {}", self.age)
+            self._die("Failed to germinate or viability ended", DeathCause.SEED_FAILURE)
 
 
     def _handle_sapling_state(self):
         grown_this_cycle = self._grow() # _grow가 실제 성장했는지 여부 반환하도록 수정 고려
         if self.current_size >= self.target_size_for_adult:
-            self.current_state = PlantState.ADULT
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _handle_sapling_state: Grew into ADULT. Size: {self.current_size:.3f}")
+            self._set_state(PlantState.ADULT)
+            if self.traced: self._trace("plant.mature", "Grew into ADULT. Size: {:.3f}", self.current_size)
 
-    def _handle_adult_state(self, current_soil_tile, climate_info):
-        grown_this_cycle = self._grow()
-        if self.age >= self.species_data["maturity_age_cycles"] and self.reproduction_cooldown == 0:
-            self._reproduce(current_soil_tile, climate_info)
+    def _handle_adult_state(self):
+        grown_this_cycle = self._grow() # 번식은 update가 성장 뒤에 따로 처리 (단계별 시간을 나눠 재기 위해)
 
     def _grow(self):
-        if self.current_state == PlantState.DEAD or self.health <= MIN_HEALTH_FOR_SURVIVAL:
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _grow: Skipping growth (DEAD or Low Health: {self.health:.2f})")
+        if self.current_state == PlantState.DEAD or self.health <= self.config.MIN_HEALTH_FOR_SURVIVAL:
+            if self.traced: self._trace("plant.grow", "Skipping growth (DEAD or Low Health: {:.2f})", self.health)
             return False
 
-        max_size_for_state = self.species_data["sapling_max_size"] if self.current_state == PlantState.SAPLING else self.adult_max_size_actual
+        max_size_for_state = self.species.sapling_max_size if self.current_state == PlantState.SAPLING else self.adult_max_size_actual
         
         if self.current_size >= max_size_for_state:
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _grow: Already at max size for state ({max_size_for_state:.3f}). Current size: {self.current_size:.3f}")
+            if self.traced: self._trace("plant.grow", "Already at max size for state ({:.3f}). Current size: {:.3f}", max_size_for_state, self.current_size)
             return False
 
         # 성장은 에너지와 물을 소모, 크기가 작을수록 상대적으로 더 많은 기본 자원 필요, 건강도 영향
         # 기본 요구량은 크기에 비례, 성장률은 (1 - 현재크기/최대크기)에 비례
-        base_required_energy_for_growth = SAPLING_TO_ADULT_GROWTH_PER_CYCLE * 0.8 * self.current_size 
-        base_required_water_for_growth = SAPLING_TO_ADULT_GROWTH_PER_CYCLE * 0.5 * self.current_size
+        base_required_energy_for_growth = self.config.SAPLING_TO_ADULT_GROWTH_PER_CYCLE * 0.8 * self.current_size 
+        base_required_water_for_growth = self.config.SAPLING_TO_ADULT_GROWTH_PER_CYCLE * 0.5 * self.current_size
         
         # 건강 상태에 따른 요구량 증가 (건강 안 좋으면 더 많은 자원 필요)
         health_factor = max(0.1, self.health / 100.0) # 최소 0.1
@@ -198,78 +351,65 @@ class Plant(pygame.sprite.Sprite):
         required_water_for_growth = base_required_water_for_growth / health_factor
 
 
-        if DEBUG_MODE:
-            print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _grow Attempt: size={self.current_size:.3f}, energy={self.current_energy:.3f}, water={self.current_water:.3f}, health={self.health:.2f}, max_size_state={max_size_for_state:.3f}")
-            print(f"Plant {self.plant_id} _grow Req: E={required_energy_for_growth:.4f}, W={required_water_for_growth:.4f}")
-
         can_grow_this_cycle = (self.current_energy > required_energy_for_growth and
                                self.current_water > required_water_for_growth)
 
-        if DEBUG_MODE: print(f"Plant {self.plant_id} _grow: Growth condition met: {can_grow_this_cycle}")
+        if self.traced:
+            self._trace("plant.grow", "Attempt: size={:.3f}, energy={:.3f}, water={:.3f}, health={:.2f}, max_size_state={:.3f}, Req: E={:.4f}, W={:.4f}, met={}",
+                        self.current_size, self.current_energy, self.current_water, self.health, max_size_for_state,
+                        required_energy_for_growth, required_water_for_growth, can_grow_this_cycle)
 
         if can_grow_this_cycle:
             # 실제 성장량은 기본 성장률 * (최대크기까지 남은 비율) * 건강상태 * (자원충분도 - 단순화하여 일단 제외)
             growth_potential_ratio = (1 - (self.current_size / max_size_for_state))
-            growth_amount = self.species_data["base_growth_rate_factor"] * growth_potential_ratio
+            growth_amount = self.species.base_growth_rate_factor * growth_potential_ratio
             
             effective_growth = growth_amount * health_factor # 건강 상태가 좋을수록 잘 자람
             effective_growth = max(0, effective_growth) # 음수 성장 방지
             
             # 너무 작은 성장은 무시 (성장 임계값)
             if effective_growth < 0.0001:
-                 if DEBUG_MODE: print(f"Plant {self.plant_id} _grow: Effective growth ({effective_growth:.5f}) too small, skipping actual growth.")
+                 if self.traced: self._trace("plant.grow", "Effective growth ({:.5f}) too small, skipping actual growth.", effective_growth)
                  return False
 
             prev_size = self.current_size
-            self.current_size += effective_growth
-            self.current_size = min(self.current_size, max_size_for_state)
+            self._set_size(min(self.current_size + effective_growth, max_size_for_state))
 
             self.current_energy -= required_energy_for_growth
             self.current_water -= required_water_for_growth
             
             self._update_capacities()
 
-            if DEBUG_MODE:
-                print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _grow SUCCESS: prev_size={prev_size:.4f}, growth_amount={growth_amount:.4f}, effective_growth={effective_growth:.4f}, new_size={self.current_size:.4f}")
-                print(f"Plant {self.plant_id} _grow Resources After: E={self.current_energy:.3f}, W={self.current_water:.3f}")
+            if self.traced:
+                self._trace("plant.grow", "SUCCESS: prev_size={:.4f}, growth_amount={:.4f}, effective_growth={:.4f}, new_size={:.4f}, Resources After: E={:.3f}, W={:.3f}",
+                            prev_size, growth_amount, effective_growth, self.current_size, self.current_energy, self.current_water)
             return True
         else:
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _grow FAILED: Not enough resources or already max size.")
+            if self.traced: self._trace("plant.grow", "FAILED: Not enough resources or already max size.")
             return False
 
 
-    def _photosynthesize(self, climate_info, current_season):
+    def _photosynthesize(self, environment, response):
         if self.current_state == PlantState.SEED or self.current_state == PlantState.DEAD:
             return
 
-        day_length_ratio = climate_info.get_day_length_ratio(current_season)
-        optimal_temp_min, optimal_temp_max = self.species_data["optimal_growth_temperature"]
-        
-        temp_efficiency = 0
-        current_temp = climate_info.current_daily_temperature
-        if optimal_temp_min <= current_temp <= optimal_temp_max:
-            temp_efficiency = 1.0
-        elif current_temp < optimal_temp_min:
-            diff = optimal_temp_min - current_temp
-            range_ = optimal_temp_min - self.species_data["min_survival_temperature"]
-            if range_ > 0: temp_efficiency = max(0, 1 - (diff / range_))
-        else: 
-            diff = current_temp - optimal_temp_max
-            range_ = self.species_data["max_survival_temperature"] - optimal_temp_max
-            if range_ > 0: temp_efficiency = max(0, 1 - (diff / range_))
+        day_length_ratio = environment.day_length_ratio
+        temp_efficiency = response.temp_efficiency # 온도 효율은 종과 오늘 기온으로만 정해짐
+        current_temp = environment.temperature
 
         water_efficiency = self.current_water / self.max_water_capacity if self.max_water_capacity > 0 else 0
         size_factor = max(0.01, self.current_size) # 최소 크기 0.01로 계산 (씨앗 등 매우 작을 때 대비)
 
-        produced_energy = (PHOTOSYNTHESIS_BASE_EFFICIENCY * size_factor *
+        produced_energy = (self.config.PHOTOSYNTHESIS_BASE_EFFICIENCY * size_factor *
                            day_length_ratio * temp_efficiency * water_efficiency)
         
         prev_energy = self.current_energy
         self.current_energy = min(self.current_energy + produced_energy, self.max_energy_capacity)
 
-        if DEBUG_MODE:
-            print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _photosynthesize: DayRatio={day_length_ratio:.2f}, TempEff={temp_efficiency:.2f} (T={current_temp:.1f}), WaterEff={water_efficiency:.2f}, SizeFactor={size_factor:.2f}")
-            print(f"Plant {self.plant_id} _photosynthesize: Produced E={produced_energy:.4f}. Prev E={prev_energy:.3f}, New E={self.current_energy:.3f}/{self.max_energy_capacity:.3f}")
+        if self.traced:
+            self._trace("plant.photosynthesize", "DayRatio={:.2f}, TempEff={:.2f} (T={:.1f}), WaterEff={:.2f}, SizeFactor={:.2f}, Produced E={:.4f}. Prev E={:.3f}, New E={:.3f}/{:.3f}",
+                        day_length_ratio, temp_efficiency, current_temp, water_efficiency, size_factor,
+                        produced_energy, prev_energy, self.current_energy, self.max_energy_capacity)
 
 
     def _absorb_water(self, current_soil_tile):
@@ -278,11 +418,11 @@ class Plant(pygame.sprite.Sprite):
         
         # TerrainType Enum과 직접 비교하도록 수정
         if current_soil_tile.terrain_type != TerrainType.SOIL:
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _absorb_water: Cannot absorb, not on SOIL. Tile type: {current_soil_tile.terrain_type}")
+            if self.traced: self._trace("plant.absorb", "Cannot absorb, not on SOIL. Tile type: {}", current_soil_tile.terrain_type)
             return
 
         # 식물이 흡수 가능한 최대량 (내부 저장 공간 여유분 * 흡수율)
-        potential_absorption_by_plant = (self.max_water_capacity - self.current_water) * WATER_ABSORPTION_RATE
+        potential_absorption_by_plant = (self.max_water_capacity - self.current_water) * self.config.WATER_ABSORPTION_RATE
         available_soil_water = current_soil_tile.water_level
         
         # 한번에 토양에서 가져갈 수 있는 양 제한 (토양 수분의 10%)
@@ -298,18 +438,20 @@ class Plant(pygame.sprite.Sprite):
             prev_soil_water = current_soil_tile.water_level
             absorbed_from_soil = current_soil_tile.consume_water(actual_absorption)
             self.current_water = min(self.current_water + absorbed_from_soil, self.max_water_capacity)
-            if DEBUG_MODE:
-                print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _absorb_water: Potential={potential_absorption_by_plant:.3f}, SoilHas={available_soil_water:.2f}, MaxDrawable={max_drawable_from_soil_at_once:.3f}")
-                print(f"Plant {self.plant_id} _absorb_water: Absorbed={absorbed_from_soil:.3f}. Prev W={prev_water:.3f}, New W={self.current_water:.3f}. Soil W before={prev_soil_water:.2f}, after={current_soil_tile.water_level:.2f}")
-        elif DEBUG_MODE:
-             print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _absorb_water: No water absorbed. PotentialByPlant={potential_absorption_by_plant:.3f}, SoilHas={available_soil_water:.2f}, MaxDrawable={max_drawable_from_soil_at_once:.3f}")
+            if self.traced:
+                self._trace("plant.absorb", "Potential={:.3f}, SoilHas={:.2f}, MaxDrawable={:.3f}, Absorbed={:.3f}. Prev W={:.3f}, New W={:.3f}. Soil W before={:.2f}, after={:.2f}",
+                            potential_absorption_by_plant, available_soil_water, max_drawable_from_soil_at_once,
+                            absorbed_from_soil, prev_water, self.current_water, prev_soil_water, current_soil_tile.water_level)
+        elif self.traced:
+            self._trace("plant.absorb", "No water absorbed. PotentialByPlant={:.3f}, SoilHas={:.2f}, MaxDrawable={:.3f}",
+                        potential_absorption_by_plant, available_soil_water, max_drawable_from_soil_at_once)
 
 
     def _consume_resources_for_life(self):
         if self.current_state == PlantState.DEAD: return
 
-        energy_cost = ENERGY_COST_FOR_MAINTENANCE_PER_CYCLE * self.current_size
-        water_cost = WATER_COST_FOR_MAINTENANCE_PER_CYCLE * self.current_size
+        energy_cost = self.config.ENERGY_COST_FOR_MAINTENANCE_PER_CYCLE * self.current_size
+        water_cost = self.config.WATER_COST_FOR_MAINTENANCE_PER_CYCLE * self.current_size
 
         prev_energy = self.current_energy
         prev_water = self.current_water
@@ -330,108 +472,94 @@ class Plant(pygame.sprite.Sprite):
             self.health -= health_damage_from_lack
             # self.health = max(0, self.health) # MIN_HEALTH_FOR_SURVIVAL 보다 아래로 내려갈 수 있도록 수정
 
-        if DEBUG_MODE:
-            print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _consume_resources: E_cost={energy_cost:.4f}, W_cost={water_cost:.4f}. Prev E={prev_energy:.3f}, W={prev_water:.3f}, H={prev_health:.2f}")
-            print(f"Plant {self.plant_id} _consume_resources: New E={self.current_energy:.3f}, W={self.current_water:.3f}, H={self.health:.2f}. LackDamage={health_damage_from_lack:.2f}")
+        if self.traced:
+            self._trace("plant.maintain", "E_cost={:.4f}, W_cost={:.4f}. Prev E={:.3f}, W={:.3f}, H={:.2f}. New E={:.3f}, W={:.3f}, H={:.2f}. LackDamage={:.2f}",
+                        energy_cost, water_cost, prev_energy, prev_water, prev_health,
+                        self.current_energy, self.current_water, self.health, health_damage_from_lack)
 
 
-    def _reproduce(self, current_soil_tile, climate_info):
+    def _reproduce(self, current_soil_tile, response):
         can_reproduce_base = (self.current_state == PlantState.ADULT and
-                              self.age >= self.species_data["maturity_age_cycles"] and
+                              self.age >= self.species.maturity_age_cycles and
                               self.reproduction_cooldown == 0 and
-                              self.current_energy >= self.max_energy_capacity * REPRODUCTION_ENERGY_THRESHOLD_FACTOR and
-                              self.current_water >= self.max_water_capacity * REPRODUCTION_WATER_THRESHOLD_FACTOR and
+                              self.current_energy >= self.max_energy_capacity * self.config.REPRODUCTION_ENERGY_THRESHOLD_FACTOR and
+                              self.current_water >= self.max_water_capacity * self.config.REPRODUCTION_WATER_THRESHOLD_FACTOR and
                               self.health > 70)
         
         if not can_reproduce_base:
-            if DEBUG_MODE:
-                if self.current_state == PlantState.ADULT and self.age >= self.species_data["maturity_age_cycles"] and self.reproduction_cooldown == 0: # 기본적인 번식 시도 가능 조건은 되었을 때만 상세 로그
-                    print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _reproduce: Base condition NOT MET. E:{self.current_energy:.2f}(Need>={self.max_energy_capacity * REPRODUCTION_ENERGY_THRESHOLD_FACTOR:.2f}), W:{self.current_water:.2f}(Need>={self.max_water_capacity * REPRODUCTION_WATER_THRESHOLD_FACTOR:.2f}), H:{self.health:.1f}(Need>70)")
+            if self.traced:
+                if self.current_state == PlantState.ADULT and self.age >= self.species.maturity_age_cycles and self.reproduction_cooldown == 0: # 기본적인 번식 시도 가능 조건은 되었을 때만 상세 로그
+                    self._trace("plant.reproduce", "Base condition NOT MET. E:{:.2f}(Need>={:.2f}), W:{:.2f}(Need>={:.2f}), H:{:.1f}(Need>70)",
+                                self.current_energy, self.max_energy_capacity * self.config.REPRODUCTION_ENERGY_THRESHOLD_FACTOR,
+                                self.current_water, self.max_water_capacity * self.config.REPRODUCTION_WATER_THRESHOLD_FACTOR, self.health)
             return
 
-        optimal_temp_min, optimal_temp_max = self.species_data["optimal_growth_temperature"]
-        optimal_water_min, optimal_water_max = self.species_data["optimal_soil_water_level"]
-        temp_ok = optimal_temp_min <= climate_info.current_daily_temperature <= optimal_temp_max
-        water_ok = optimal_water_min <= current_soil_tile.water_level <= optimal_water_max
+        species = self.species
+        temp_ok = response.temp_optimal
+        water_ok = species.optimal_soil_water_level_min <= current_soil_tile.water_level <= species.optimal_soil_water_level_max
         
         reproduction_chance = 0.1 # 기본 번식 확률 낮춤 (너무 빠르게 퍼지는 것 방지)
         if temp_ok and water_ok:
             reproduction_chance = 0.3 # 최적 환경에서 확률 증가
 
-        if DEBUG_MODE: print(f"Plant {self.plant_id} _reproduce: Attempting. TempOK={temp_ok}, WaterOK={water_ok}, Chance={reproduction_chance:.2f}")
+        if self.traced: self._trace("plant.reproduce", "Attempting. TempOK={}, WaterOK={}, Chance={:.2f}", temp_ok, water_ok, reproduction_chance)
 
         if not (random.random() < reproduction_chance):
-            self.reproduction_cooldown = self.species_data["reproduction_cooldown_cycles_default"] // 3 # 실패 시 쿨다운 짧게
-            if DEBUG_MODE: print(f"Plant {self.plant_id} _reproduce: Failed by chance. Cooldown set to {self.reproduction_cooldown}")
+            self.reproduction_cooldown = species.reproduction_cooldown_cycles_default // 3 # 실패 시 쿨다운 짧게
+            if self.traced: self._trace("plant.reproduce", "Failed by chance. Cooldown set to {}", self.reproduction_cooldown)
             return
 
-        seeds_to_produce = random.randint(1, self.species_data["max_seeds_produced_per_attempt"])
+        seeds_to_produce = random.randint(1, species.max_seeds_produced_per_attempt)
         seeds_produced_count = 0
         initial_energy_before_reproduction = self.current_energy
 
-        for i in range(seeds_to_produce):
-            energy_cost = self.species_data["energy_cost_per_seed_attempt"]
-            if self.current_energy >= energy_cost:
-                self.current_energy -= energy_cost
-                
-                if self.map_manager:
-                    from config import SEED_SPREAD_RADIUS_MIN, SEED_SPREAD_RADIUS_MAX
-                    for _attempt in range(10): # 빈 땅 찾기 시도 횟수 증가
-                        # 원형으로 좀 더 자연스럽게 확산되도록 수정
-                        angle = random.uniform(0, 2 * 3.1415926535)
-                        radius = random.uniform(SEED_SPREAD_RADIUS_MIN, SEED_SPREAD_RADIUS_MAX)
-                        dx = int(round(radius * pygame.math.Vector2(1, 0).rotate(angle * 180 / 3.1415926535).x)) # Pygame Vector2 사용
-                        dy = int(round(radius * pygame.math.Vector2(1, 0).rotate(angle * 180 / 3.1415926535).y))
-                        
-                        new_x, new_y = self.grid_x + dx, self.grid_y + dy
-
-                        if self.map_manager.is_valid_tile(new_x, new_y):
-                            target_tile = self.map_manager.get_tile(new_x, new_y)
-                            if target_tile and target_tile.can_plant_grow_here():
-                                self.map_manager.add_new_plant(new_x, new_y, PlantState.SEED, self.species_data)
-                                seeds_produced_count += 1
-                                if DEBUG_MODE: print(f"Plant {self.plant_id} _reproduce: Seed {i+1} success at ({new_x},{new_y}).")
-                                break 
-                    else: # for-else: break 안걸리면 실행 (빈 땅 못찾음)
-                        if DEBUG_MODE: print(f"Plant {self.plant_id} _reproduce: Seed {i+1} failed to find empty spot.")
-            else:
-                if DEBUG_MODE: print(f"Plant {self.plant_id} _reproduce: Not enough energy for seed {i+1}. Cost={energy_cost:.2f}, Has={self.current_energy:.2f}")
-                break 
+        # 에너지가 되는 만큼 씨앗 비용을 치르고, 씨앗마다 확산 커널에서 빈 목표 셀을 고름 (빈 칸이 없으면 그 씨앗은 실패)
+        energy_cost = species.energy_cost_per_seed_attempt
+        seed_count = 0
+        while seed_count < seeds_to_produce and self.current_energy >= energy_cost:
+            self.current_energy -= energy_cost
+            seed_count += 1
+        if seed_count < seeds_to_produce and self.traced:
+            self._trace("plant.reproduce", "Not enough energy for seed {}. Cost={:.2f}, Has={:.2f}", seed_count + 1, energy_cost, self.current_energy)
+
+        if seed_count and self.map_manager:
+            target_xs, target_ys = draw_seed_targets(self.map_manager.soil_field.free_soil, self.grid_x, self.grid_y, seed_count,
+                                                     self.config.SEED_SPREAD_RADIUS_MIN, self.config.SEED_SPREAD_RADIUS_MAX)
+            for i, (new_x, new_y) in enumerate(zip(target_xs.tolist(), target_ys.tolist())):
+                if new_x >= 0:
+                    self.map_manager.add_new_plant(new_x, new_y, PlantState.SEED, self.species_data)
+                    seeds_produced_count += 1
+                    if self.traced: self._trace("plant.reproduce", "Seed {} success at ({},{}).", i + 1, new_x, new_y)
+                elif self.traced:
+                    self._trace("plant.reproduce", "Seed {} failed to find empty spot.", i + 1)
         
-        if seeds_produced_count > 0 and DEBUG_MODE:
-            print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _reproduce SUCCESS: Produced {seeds_produced_count} seeds. Energy spent: {initial_energy_before_reproduction - self.current_energy:.2f}")
+        if seeds_produced_count > 0 and self.traced:
+            self._trace("plant.reproduce", "SUCCESS: Produced {} seeds. Energy spent: {:.2f}", seeds_produced_count, initial_energy_before_reproduction - self.current_energy)
         
-        self.reproduction_cooldown = self.species_data["reproduction_cooldown_cycles_default"]
-
+        self.reproduction_cooldown = species.reproduction_cooldown_cycles_default
 
-    def _check_environmental_stress(self, current_soil_tile, climate_info):
-        stress_factor = 0
-        temp = climate_info.current_daily_temperature
-        min_survival_temp = self.species_data["min_survival_temperature"]
-        max_survival_temp = self.species_data["max_survival_temperature"]
-        optimal_temp_min, optimal_temp_max = self.species_data["optimal_growth_temperature"]
 
-        if temp < min_survival_temp or temp > max_survival_temp:
-            if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _check_environmental_stress: Dies from EXTREME temperature: {temp:.1f}C")
-            self._die(f"Extreme temperature: {temp:.1f}C")
+    def _check_environmental_stress(self, current_soil_tile, environment, response):
+        temp = environment.temperature
+        if response.temp_extreme:
+            if self.traced: self._trace("plant.stress", "Dies from EXTREME temperature: {:.1f}C", temp)
+            self._die(f"Extreme temperature: {temp:.1f}C", DeathCause.EXTREME_TEMPERATURE)
             return # 이미 죽었으므로 추가 스트레스 계산 불필요
-            
-        if temp < optimal_temp_min:
-            stress_factor += ((optimal_temp_min - temp) / (optimal_temp_min - min_survival_temp + 1e-6)) * 1.0 # 가중치 1.0
-        elif temp > optimal_temp_max:
-            stress_factor += ((temp - optimal_temp_max) / (max_survival_temp - optimal_temp_max + 1e-6)) * 1.0 # 가중치 1.0
+
+        stress_factor = response.temp_stress # 온도 항 (가중치 1.0)
 
         soil_water = current_soil_tile.water_level
-        min_survival_water = self.species_data["min_survival_soil_water_level"]
-        optimal_water_min, optimal_water_max = self.species_data["optimal_soil_water_level"]
+        species = self.species
+        min_survival_water = species.min_survival_soil_water_level
+        optimal_water_min, optimal_water_max = species.optimal_soil_water_level_min, species.optimal_soil_water_level_max
         
         if self.current_state != PlantState.SEED: # 씨앗은 토양 수분 직접 스트레스 덜 받음
             if soil_water < min_survival_water :
                  stress_factor += 1.5 # 건조 스트레스 가중치 크게
             elif soil_water < optimal_water_min:
-                stress_factor += ((optimal_water_min - soil_water) / (optimal_water_min - min_survival_water + 1e-6)) * 0.7 # 가중치 0.7
-            elif soil_water > optimal_water_max * 1.8: # 과습 기준 강화 (최적의 180%)
-                stress_factor += ((soil_water - (optimal_water_max * 1.8)) / (optimal_water_max * 0.8 + 1e-6)) * 0.5 # 과습 스트레스는 조금 약하게
+                stress_factor += ((optimal_water_min - soil_water) / response.dry_stress_range) * 0.7 # 가중치 0.7
+            elif soil_water > response.wet_stress_threshold: # 과습 기준 강화 (최적의 180%)
+                stress_factor += ((soil_water - response.wet_stress_threshold) / response.wet_stress_range) * 0.5 # 과습 스트레스는 조금 약하게
 
 
         if self.max_water_capacity > 0 and (self.current_water / self.max_water_capacity) < 0.05: # 내부 수분 5% 미만
@@ -441,17 +569,18 @@ class Plant(pygame.sprite.Sprite):
         if stress_factor > 0:
             # 건강이 낮을수록 스트레스에 더 취약하게, 최대 피해량 제한
             vulnerability = 1.0 + (1.0 - (self.health / 100.0)) * 0.5 # 건강 0일때 1.5배, 건강 100일때 1배
-            damage = min(STRESS_DAMAGE_RATE * stress_factor * vulnerability, 25.0) # 한번에 최대 25 데미지
+            damage = min(self.config.STRESS_DAMAGE_RATE * stress_factor * vulnerability, 25.0) # 한번에 최대 25 데미지
             self.health -= damage
             # self.health = max(0, self.health) # MIN_HEALTH_FOR_SURVIVAL 보다 아래로 갈 수 있음
-            if DEBUG_MODE:
-                print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _check_environmental_stress: StressFactor={stress_factor:.2f}, Temp={temp:.1f}, SoilW={soil_water:.1f}, InternalW={self.current_water/self.max_water_capacity if self.max_water_capacity>0 else 0:.2f}")
-                print(f"Plant {self.plant_id} _check_environmental_stress: Damage={damage:.2f}. Prev H={prev_health:.2f}, New H={self.health:.2f}")
+            if self.traced:
+                self._trace("plant.stress", "StressFactor={:.2f}, Temp={:.1f}, SoilW={:.1f}, InternalW={:.2f}, Damage={:.2f}. Prev H={:.2f}, New H={:.2f}",
+                            stress_factor, temp, soil_water, self.current_water / self.max_water_capacity if self.max_water_capacity > 0 else 0,
+                            damage, prev_health, self.health)
         else: # 스트레스가 없거나 매우 낮으면 건강 회복 시도
-            temp_optimal = optimal_temp_min <= temp <= optimal_temp_max
+            temp_optimal = response.temp_optimal
             soil_water_optimal = optimal_water_min <= soil_water <= optimal_water_max
             if temp_optimal and soil_water_optimal and self.current_energy > self.max_energy_capacity * 0.2 and self.current_water > self.max_water_capacity * 0.2:
-                recovery_amount = HEALING_RATE_UNDER_OPTIMAL_CONDITIONS * (self.health / 150.0 + 0.3) # 건강 낮을수록 회복량 조금 줄고, 최소 회복량 보장
+                recovery_amount = self.config.HEALING_RATE_UNDER_OPTIMAL_CONDITIONS * (self.health / 150.0 + 0.3) # 건강 낮을수록 회복량 조금 줄고, 최소 회복량 보장
                 energy_cost_for_healing = recovery_amount * 0.15
                 water_cost_for_healing = recovery_amount * 0.1
 
@@ -460,19 +589,25 @@ class Plant(pygame.sprite.Sprite):
                     self.health = min(100.0, self.health)
                     self.current_energy -= energy_cost_for_healing
                     self.current_water -= water_cost_for_healing
-                    if DEBUG_MODE:
-                        print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _check_environmental_stress: Optimal conditions. Healing by {recovery_amount:.2f}. Prev H={prev_health:.2f}, New H={self.health:.2f}")
+                    if self.traced:
+                        self._trace("plant.heal", "Optimal conditions. Healing by {:.2f}. Prev H={:.2f}, New H={:.2f}", recovery_amount, prev_health, self.health)
 
 
-    def _die(self, reason="Unknown"):
+    def _die(self, reason="Unknown", cause=None):
         if self.current_state == PlantState.DEAD: return
+        if self.current_state == PlantState.SEED and self.map_manager:
+            self.sync_dormant_state(self.map_manager.current_cycle()) # 잠든 채 죽는 씨앗의 나이를 죽는 시점으로 맞춤
+        if self.map_manager and cause:
+            self.map_manager.stats.on_death(cause)
 
-        if DEBUG_MODE: print(f"Plant {self.plant_id} ({self.grid_x},{self.grid_y}) _die: Reason: {reason}. Age: {self.age} cycles. Size: {self.current_size:.3f}, Health: {self.health:.2f}")
-        self.current_state = PlantState.DEAD
+        if self.traced: self._trace("plant.die", "Reason: {}. Age: {} cycles. Size: {:.3f}, Health: {:.2f}", reason, self.age, self.current_size, self.health)
+        self._set_state(PlantState.DEAD)
         self.health = 0
         self.current_energy = 0
         self.current_water = 0
-        self.cycles_since_death = 0
+        if self.map_manager:
+            self.death_cycle = self.map_manager.current_cycle()
+            self.map_manager.sprite_schedule.on_death(self)
         self._update_visuals()
 
     def draw(self, surface):
@@ -0,0 +1,484 @@
+# plant_population.py
+# 식물 개체군을 병렬 배열(structure-of-arrays)로 보관하고 Plant.update의 각 단계를 배열 커널로 일괄 처리하는 엔진
+import random
+import time
+import numpy as np
+
+from plant import PlantState, DeathCause, plant_visual_key
+from dispersal import draw_seed_targets
+from plant_schedule import CycleTimerWheel
+from profiler import add_phase_time
+from simulation_config import DEFAULT_SIMULATION_CONFIG
+from species_registry import SpeciesRegistry
+from terrain import SOIL_CODE
+from tracelog import TRACE
+
+# state 배열에 저장되는 상태 코드 (int8)
+PLANT_STATES_BY_CODE = (PlantState.SEED, PlantState.SAPLING, PlantState.ADULT, PlantState.DEAD)
+PLANT_STATE_CODES = {state: code for code, state in enumerate(PLANT_STATES_BY_CODE)}
+SEED = PLANT_STATE_CODES[PlantState.SEED]
+SAPLING = PLANT_STATE_CODES[PlantState.SAPLING]
+ADULT = PLANT_STATE_CODES[PlantState.ADULT]
+DEAD = PLANT_STATE_CODES[PlantState.DEAD]
+
+# (배열 이름, dtype) - 식물 한 개체가 한 행(row)을 차지
+PLANT_FIELDS = (
+    ("plant_id", np.int64),
+    ("grid_x", np.int64),
+    ("grid_y", np.int64),
+    ("species", np.int16),
+    ("state", np.int8),
+    ("age", np.int64),
+    ("health", np.float64),
+    ("size", np.float64),
+    ("adult_max_size", np.float64),
+    ("energy", np.float64),
+    ("max_energy", np.float64),
+    ("water", np.float64),
+    ("max_water", np.float64),
+    ("cooldown", np.int64),
+    ("death_cycle", np.int64), # 죽은 cycle 번호
+)
+
+class PlantPopulation:
+    """모든 식물의 상태를 병렬 배열로 보관하는 개체군 엔진.
+       update()는 Plant.update와 같은 규칙을 모든 식물에 배열 연산으로 적용하며,
+       난수를 쓰는 단계(씨앗 사망 판정, 번식)와 죽은 식물 제거는 sprite 그룹과 같은 순서로 처리하므로
+       같은 시드에서 Plant sprite 경로와 비트 단위로 같은 결과를 냅니다.
+    """
+    def __init__(self, map_manager_ref=None, capacity=1024):
+        self.map_manager = map_manager_ref
+        self.config = map_manager_ref.config if map_manager_ref else DEFAULT_SIMULATION_CONFIG
+        self.count = 0
+        self._next_plant_id = 1
+        self._capacity = 0
+        for name, dtype in PLANT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self._grow_capacity(capacity)
+
+        self.species_registry = SpeciesRegistry() # species 배열의 종 번호 -> 종 정의/레코드/파라미터 표
+        self.removals = CycleTimerWheel() # 죽은 식물(plant_id) 제거 예정
+
+    def __len__(self):
+        return self.count
+
+    def _grow_capacity(self, min_capacity):
+        new_capacity = max(min_capacity, self._capacity * 2, 16)
+        for name, dtype in PLANT_FIELDS:
+            grown = np.zeros(new_capacity, dtype=dtype)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+        self._capacity = new_capacity
+
+    @property
+    def species_list(self):
+        """종 번호 순서의 종 정의 사전 목록 (체크포인트 저장용)."""
+        return self.species_registry.definitions
+
+    def _param(self, name):
+        """종 특성 값을 종 번호 순서의 배열로 반환합니다 (name은 Species 필드 이름, 예: "optimal_soil_water_level_min")."""
+        return self.species_registry.table[name]
+
+    def row_of(self, plant_id):
+        """plant_id에 해당하는 현재 행 번호를 반환합니다. 없으면 None.
+           행은 생성 순서대로 쌓이고 제거 시에도 순서가 유지되므로 plant_id 배열은 항상 정렬되어 있습니다.
+        """
+        if not plant_id:
+            return None
+        row = int(np.searchsorted(self.plant_id[:self.count], plant_id))
+        if row < self.count and self.plant_id[row] == plant_id:
+            return row
+        return None
+
+    def visual_key(self, row):
+        """row 식물을 화면에 그릴 (상태, 픽셀 크기, 색) 조합을 반환합니다 (Plant.visual_key와 같은 값)."""
+        return plant_visual_key(PLANT_STATES_BY_CODE[self.state[row]], float(self.size[row]), float(self.adult_max_size[row]))
+
+    def plant_attributes(self, row):
+        """row 식물의 값을 Plant 속성 이름의 사전으로 반환합니다 (선택된 식물 표시용)."""
+        return {
+            "plant_id": int(self.plant_id[row]), "grid_x": int(self.grid_x[row]), "grid_y": int(self.grid_y[row]),
+            "current_state": PLANT_STATES_BY_CODE[self.state[row]], "age": int(self.age[row]), "health": float(self.health[row]),
+            "current_size": float(self.size[row]), "adult_max_size_actual": float(self.adult_max_size[row]),
+            "current_energy": float(self.energy[row]), "max_energy_capacity": float(self.max_energy[row]),
+            "current_water": float(self.water[row]), "max_water_capacity": float(self.max_water[row]),
+            "reproduction_cooldown": int(self.cooldown[row]),
+        }
+
+    def restore(self, columns, species_list, next_plant_id):
+        """체크포인트의 열 배열(PLANT_FIELDS 이름별)로 개체군 전체를 교체합니다."""
+        count = len(columns["plant_id"])
+        self.count = 0
+        self._capacity = 0
+        self._grow_capacity(count)
+        for name, _dtype in PLANT_FIELDS:
+            getattr(self, name)[:count] = columns[name]
+        self.count = count
+        self._next_plant_id = next_plant_id
+        # 저장된 목록에 내용이 같은 정의가 여럿이면 한 종 번호로 합쳐지므로 종 번호를 다시 매김
+        self.species_registry = SpeciesRegistry()
+        species_ids = np.array([self.species_registry.species_id(species_data) for species_data in species_list], dtype=np.int16)
+        if count:
+            self.species[:count] = species_ids[self.species[:count]]
+        self.removals.clear()
+        dead_rows = np.flatnonzero(self.state[:count] == DEAD)
+        for removal_cycle, plant_id in zip((self.death_cycle[dead_rows] + self.config.DEAD_PLANT_REMOVAL_CYCLES + 1).tolist(),
+                                           self.plant_id[dead_rows].tolist()):
+            self.removals.schedule(removal_cycle, plant_id)
+
+    def count_by_state(self):
+        """상태별 식물 수를 {PlantState: 개수} 형태로 반환합니다."""
+        counts = np.bincount(self.state[:self.count], minlength=len(PLANT_STATES_BY_CODE))
+        return {state: int(counts[code]) for code, state in enumerate(PLANT_STATES_BY_CODE)}
+
+    def spawn(self, grid_x, grid_y, initial_state, species_data=None):
+        """Plant 생성자와 같은 초기값(같은 난수 소비)으로 새 식물 행을 추가하고 행 번호를 반환합니다.
+           타일에 식물이 자랄 수 없으면 None을 반환합니다.
+        """
+        if not self.map_manager.can_plant_grow_at(grid_x, grid_y):
+            return None
+
+        species_data = species_data if species_data else self.config.STRONG_PLANT_SPECIES
+        if self.count == self._capacity:
+            self._grow_capacity(self.count + 1)
+
+        row = self.count
+        size = 0.01 if initial_state == PlantState.SEED else 0.05
+        species_id = self.species_registry.species_id(species_data)
+        species = self.species_registry.species[species_id]
+        adult_max_size_base = species.adult_max_size
+        max_water = size * species.max_water_capacity_factor_size
+        max_energy = size * species.max_energy_capacity_factor_size
+
+        self.plant_id[row] = self._next_plant_id
+        self.grid_x[row] = grid_x
+        self.grid_y[row] = grid_y
+        self.species[row] = species_id
+        self.state[row] = PLANT_STATE_CODES[initial_state]
+        self.age[row] = 0
+        self.health[row] = 100.0
+        self.size[row] = size
+        self.adult_max_size[row] = random.uniform(adult_max_size_base * (1 - 0.1), adult_max_size_base * (1 + 0.1))
+        self.max_water[row] = max_water
+        self.water[row] = max_water * 0.5
+        self.max_energy[row] = max_energy
+        self.energy[row] = max_energy * 0.5
+        self.cooldown[row] = 0
+        self.death_cycle[row] = 0
+
+        self.map_manager.soil_field.set_occupancy(grid_x, grid_y, True, self._next_plant_id)
+        self._next_plant_id += 1
+        self.count += 1
+        self.map_manager.stats.on_birth(initial_state, size)
+        return row
+
+    def _die(self, rows, cause):
+        """Plant._die와 같이 주어진 행(번호 또는 번호 배열)의 식물을 죽은 상태로 만들고 사망 원인을 통계에 기록합니다.
+           DEAD_PLANT_REMOVAL_CYCLES가 지난 cycle에 제거하도록 예약합니다.
+        """
+        dying = np.size(rows)
+        if dying == 0:
+            return
+        if TRACE.enabled:
+            self._trace_rows("plant.die", rows, "Reason: " + cause.value + ". Age: {} cycles. Size: {:.3f}, Health: {:.2f}",
+                             self.age, self.size, self.health)
+        self.map_manager.stats.on_death(cause, dying)
+        current_cycle = self.map_manager.current_cycle()
+        self.state[rows] = DEAD
+        self.health[rows] = 0
+        self.energy[rows] = 0
+        self.water[rows] = 0
+        self.death_cycle[rows] = current_cycle
+        self.removals.schedule_many(current_cycle + self.config.DEAD_PLANT_REMOVAL_CYCLES + 1, np.atleast_1d(self.plant_id[rows]).tolist())
+
+    def _trace_rows(self, event, rows, message, *columns):
+        """rows(행 번호 또는 bool 마스크) 중 추적 필터를 통과하는 식물마다 사건을 남깁니다.
+           columns는 message에 차례로 채울 배열이며 각 식물의 행 값을 씁니다.
+        """
+        rows = np.atleast_1d(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        plant_ids, xs, ys = self.plant_id[rows], self.grid_x[rows], self.grid_y[rows]
+        for i in TRACE.watched_rows(plant_ids, xs, ys).tolist():
+            row = rows[i]
+            TRACE.emit(event, message, *(column[row] for column in columns),
+                       plant_id=int(plant_ids[i]), x=int(xs[i]), y=int(ys[i]))
+
+    def _trace_row(self, event, row, message, *args):
+        """한 식물(행)이 추적 필터를 통과하면 사건을 남깁니다."""
+        plant_id, x, y = int(self.plant_id[row]), int(self.grid_x[row]), int(self.grid_y[row])
+        if TRACE.watches(plant_id, x, y):
+            TRACE.emit(event, message, *args, plant_id=plant_id, x=x, y=y)
+
+    def _update_capacities(self, mask):
+        n = len(mask)
+        species = self.species[:n]
+        new_max_water = self.size[:n] * self._param("max_water_capacity_factor_size")[species]
+        new_max_energy = self.size[:n] * self._param("max_energy_capacity_factor_size")[species]
+        np.copyto(self.max_water[:n], new_max_water, where=mask)
+        np.copyto(self.max_energy[:n], new_max_energy, where=mask)
+        np.copyto(self.water[:n], np.minimum(self.water[:n], new_max_water), where=mask)
+        np.copyto(self.energy[:n], np.minimum(self.energy[:n], new_max_energy), where=mask)
+
+    def _grow(self, mask):
+        """Plant._grow를 mask에 해당하는 식물에 일괄 적용합니다."""
+        n = len(mask)
+        species = self.species[:n]
+        size = self.size[:n]
+        health = self.health[:n]
+        energy = self.energy[:n]
+        water = self.water[:n]
+
+        max_size_for_state = np.where(self.state[:n] == SAPLING, self._param("sapling_max_size")[species], self.adult_max_size[:n])
+        mask = mask & (health > self.config.MIN_HEALTH_FOR_SURVIVAL) & (size < max_size_for_state)
+
+        health_factor = np.maximum(0.1, health / 100.0)
+        required_energy_for_growth = self.config.SAPLING_TO_ADULT_GROWTH_PER_CYCLE * 0.8 * size / health_factor
+        required_water_for_growth = self.config.SAPLING_TO_ADULT_GROWTH_PER_CYCLE * 0.5 * size / health_factor
+        mask &= (energy > required_energy_for_growth) & (water > required_water_for_growth)
+
+        growth_potential_ratio = (1 - (size / max_size_for_state))
+        growth_amount = self._param("base_growth_rate_factor")[species] * growth_potential_ratio
+        effective_growth = np.maximum(0, growth_amount * health_factor)
+        mask &= ~(effective_growth < 0.0001)
+
+        np.copyto(size, np.minimum(size + effective_growth, max_size_for_state), where=mask)
+        np.copyto(energy, energy - required_energy_for_growth, where=mask)
+        np.copyto(water, water - required_water_for_growth, where=mask)
+        self._update_capacities(mask)
+
+    def update(self, climate_info, time_manager, timings=None):
+        """한 cycle 동안 모든 식물을 Plant.update와 같은 규칙으로 갱신합니다.
+           timings 사전을 주면 세부 단계(profiler.PLANT_PHASES) 시간을 누적합니다.
+        """
+        n = self.count
+        if n == 0:
+            return
+        if timings is not None: phase_start = time.perf_counter()
+        field = self.map_manager.soil_field
+        species = self.species[:n]
+        state = self.state[:n]
+        age = self.age[:n]
+        health = self.health[:n]
+        size = self.size[:n]
+        energy = self.energy[:n]
+        water = self.water[:n]
+        max_energy = self.max_energy[:n]
+        max_water = self.max_water[:n]
+        cooldown = self.cooldown[:n]
+        grid_x = self.grid_x[:n]
+        grid_y = self.grid_y[:n]
+
+        # 1. 죽은 식물: 이번 cycle에 제거 예정인 식물만 표시 (실제 제거는 순서 처리 단계에서)
+        current_cycle = time_manager.total_cycles_elapsed
+        dead = state == DEAD
+        to_remove = np.zeros(n, dtype=bool)
+        due_ids = np.array(self.removals.pop_due(current_cycle), dtype=np.int64)
+        if due_ids.size:
+            due_rows = np.searchsorted(self.plant_id[:n], due_ids)
+            found = due_rows < n
+            due_rows = due_rows[found]
+            to_remove[due_rows[self.plant_id[due_rows] == due_ids[found]]] = True
+            to_remove &= dead
+
+        # 2. 나이 증가와 수명 종료
+        alive = ~dead
+        age[alive] += 1
+        old_age = alive & (age > self._param("max_lifespan_cycles")[species])
+        self._die(np.flatnonzero(old_age), DeathCause.OLD_AGE)
+        active = alive & ~old_age
+        growing = active & ((state == SAPLING) | (state == ADULT)) # 씨앗은 흡수/광합성을 하지 않음
+
+        # 3. 수분 흡수 (식물이 있는 타일의 수분만 읽고 씀 - 한 타일에 한 식물)
+        tile_water = field.water_level[grid_y, grid_x]
+        on_soil = field.terrain[grid_y, grid_x] == SOIL_CODE
+        potential_absorption_by_plant = (max_water - water) * self.config.WATER_ABSORPTION_RATE
+        max_drawable_from_soil_at_once = tile_water * 0.2
+        actual_absorption = np.maximum(0, np.minimum(np.minimum(potential_absorption_by_plant, tile_water), max_drawable_from_soil_at_once))
+        absorbing = growing & on_soil & (actual_absorption > 0)
+        absorbed_from_soil = np.minimum(tile_water, actual_absorption)
+        np.copyto(tile_water, tile_water - absorbed_from_soil, where=absorbing)
+        np.copyto(water, np.minimum(water + absorbed_from_soil, max_water), where=absorbing)
+        field.water_level[grid_y[absorbing], grid_x[absorbing]] = tile_water[absorbing]
+        field.adjust_soil_water_total(-float(absorbed_from_soil[absorbing].sum()))
+        if timings is not None: phase_start = add_phase_time(timings, "plants.absorb", phase_start)
+
+        # 4. 광합성 (온도 관련 항은 EnvironmentContext가 종마다 한 번만 계산한 값을 종 번호로 모음)
+        environment = climate_info.environment
+        responses = [environment.response(sp) for sp in self.species_registry.species]
+        def by_species(attribute, dtype=np.float64):
+            return np.array([getattr(response, attribute) for response in responses], dtype=dtype)[species]
+        day_length_ratio = environment.day_length_ratio
+        temp_efficiency = by_species("temp_efficiency")
+        water_efficiency = np.divide(water, max_water, out=np.zeros(n), where=max_water > 0)
+        size_factor = np.maximum(0.01, size)
+        produced_energy = (self.config.PHOTOSYNTHESIS_BASE_EFFICIENCY * size_factor *
+                           day_length_ratio * temp_efficiency * water_efficiency)
+        np.copyto(energy, np.minimum(energy + produced_energy, max_energy), where=growing)
+        if timings is not None: phase_start = add_phase_time(timings, "plants.photosynthesize", phase_start)
+
+        # 5. 생명 유지 자원 소모
+        np.copyto(energy, energy - self.config.ENERGY_COST_FOR_MAINTENANCE_PER_CYCLE * size, where=active)
+        np.copyto(water, water - self.config.WATER_COST_FOR_MAINTENANCE_PER_CYCLE * size, where=active)
+        energy_lack = active & (energy < 0)
+        water_lack = active & (water < 0)
+        health_damage_from_lack = np.where(energy_lack, np.abs(energy) * 1.0, 0.0) + np.where(water_lack, np.abs(water) * 1.0, 0.0)
+        energy[energy_lack] = 0
+        water[water_lack] = 0
+        np.copyto(health, health - health_damage_from_lack, where=active & (health_damage_from_lack > 0))
+
+        # 6. 환경 스트레스
+        extreme = active & by_species("temp_extreme", bool)
+        self._die(np.flatnonzero(extreme), DeathCause.EXTREME_TEMPERATURE)
+        stressed_candidates = active & ~extreme
+
+        optimal_water_min = self._param("optimal_soil_water_level_min")[species]
+        optimal_water_max = self._param("optimal_soil_water_level_max")[species]
+        min_survival_water = self._param("min_survival_soil_water_level")[species]
+        wet_stress_threshold = by_species("wet_stress_threshold")
+        soil_stress = np.select(
+            [tile_water < min_survival_water,
+             tile_water < optimal_water_min,
+             tile_water > wet_stress_threshold],
+            [1.5,
+             ((optimal_water_min - tile_water) / by_species("dry_stress_range")) * 0.7,
+             ((tile_water - wet_stress_threshold) / by_species("wet_stress_range")) * 0.5],
+            default=0.0)
+        soil_stress[state == SEED] = 0.0 # 씨앗은 토양 수분 스트레스를 받지 않음
+        internal_water_ratio = np.divide(water, max_water, out=np.ones(n), where=max_water > 0)
+        internal_stress = np.where((max_water > 0) & (internal_water_ratio < 0.05), 1.2, 0.0)
+        temp_stress = by_species("temp_stress")
+        stress_factor = temp_stress + soil_stress + internal_stress
+
+        stressed = stressed_candidates & (stress_factor > 0)
+        vulnerability = 1.0 + (1.0 - (health / 100.0)) * 0.5
+        damage = np.minimum(self.config.STRESS_DAMAGE_RATE * stress_factor * vulnerability, 25.0)
+        np.copyto(health, health - damage, where=stressed)
+
+        healing = (stressed_candidates & ~stressed & by_species("temp_optimal", bool) &
+                   (optimal_water_min <= tile_water) & (tile_water <= optimal_water_max) &
+                   (energy > max_energy * 0.2) & (water > max_water * 0.2))
+        recovery_amount = self.config.HEALING_RATE_UNDER_OPTIMAL_CONDITIONS * (health / 150.0 + 0.3)
+        energy_cost_for_healing = recovery_amount * 0.15
+        water_cost_for_healing = recovery_amount * 0.1
+        healing &= (energy > energy_cost_for_healing) & (water > water_cost_for_healing)
+        np.copyto(health, np.minimum(100.0, health + recovery_amount), where=healing)
+        np.copyto(energy, energy - energy_cost_for_healing, where=healing)
+        np.copyto(water, water - water_cost_for_healing, where=healing)
+
+        # 7. 건강 악화로 인한 사망 (이 경우 이후 단계를 건너뜀)
+        low_health = stressed_candidates & (health <= self.config.MIN_HEALTH_FOR_SURVIVAL)
+        self._die(np.flatnonzero(low_health), DeathCause.LOW_HEALTH)
+        proceeding = active & ~low_health
+        if timings is not None: phase_start = add_phase_time(timings, "plants.stress", phase_start)
+
+        cooling = proceeding & (cooldown > 0)
+        cooldown[cooling] -= 1
+
+        # 8. 상태별 처리 (상태 판정은 처리 전에 한 번에 고정)
+        seeds = proceeding & (state == SEED)
+        saplings = proceeding & (state == SAPLING)
+        adults = proceeding & (state == ADULT)
+
+        viability = self._param("seed_viability_duration_cycles")[species]
+        germinating = (seeds &
+                       (tile_water >= self._param("min_water_for_germination_soil")[species]) &
+                       (field.temperature[grid_y, grid_x] >= self._param("min_temperature_for_germination")[species]) &
+                       (age <= viability))
+        state[germinating] = SAPLING
+        size[germinating] = 0.05
+        health[germinating] = 100.0
+        self._update_capacities(germinating)
+        if TRACE.enabled: self._trace_rows("seed.germinate", germinating, "Germinated! New state: SAPLING, Size: {:.3f}", self.size)
+        seed_expired = seeds & ~germinating & (age > viability)
+        self._die(np.flatnonzero(seed_expired), DeathCause.SEED_FAILURE)
+        seed_rolls = seeds & ~germinating & ~seed_expired
+
+        self._grow(saplings)
+        maturing = saplings & (size >= self._param("default_target_size_for_adult")[species])
+        state[maturing] = ADULT
+        if TRACE.enabled: self._trace_rows("plant.mature", maturing, "Grew into ADULT. Size: {:.3f}", self.size)
+
+        self._grow(adults)
+        reproducing = (adults & (age >= self._param("maturity_age_cycles")[species]) & (cooldown == 0) &
+                       (energy >= max_energy * self.config.REPRODUCTION_ENERGY_THRESHOLD_FACTOR) &
+                       (water >= max_water * self.config.REPRODUCTION_WATER_THRESHOLD_FACTOR) &
+                       (health > 70))
+        if timings is not None: phase_start = add_phase_time(timings, "plants.grow", phase_start)
+
+        # 9. 난수를 쓰거나 점유 상태를 바꾸는 처리는 sprite 그룹과 같은 순서(행 순서)로 진행
+        removed = np.zeros(n, dtype=bool)
+        seed_death_chance = self.config.SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE
+        for row in np.flatnonzero(to_remove | seed_rolls | reproducing).tolist():
+            if to_remove[row]:
+                if TRACE.enabled: self._trace_row("plant.remove", row, "DEAD, removing from population.")
+                field.set_occupancy(self.grid_x[row], self.grid_y[row], False)
+                removed[row] = True
+            elif seed_rolls[row]:
+                if random.random() < seed_death_chance:
+                    self._die(row, DeathCause.SEED_FAILURE)
+            else:
+                self._reproduce(row, responses[self.species[row]], tile_water[row])
+        if timings is not None: phase_start = add_phase_time(timings, "plants.reproduce", phase_start)
+
+        self._update_capacities(proceeding) # proceeding은 압축 전 행 기준이므로 압축보다 먼저
+        if timings is not None: phase_start = add_phase_time(timings, "plants.grow", phase_start)
+        if removed.any():
+            self._compact(removed)
+        if timings is not None: phase_start = add_phase_time(timings, "plants.reproduce", phase_start)
+        self._sync_stats()
+        if timings is not None: add_phase_time(timings, "plants.grow", phase_start)
+
+    def _sync_stats(self):
+        """상태별 개체 수와 생체량을 한 번에 집계해 맵 통계에 반영합니다."""
+        living = self.state[:self.count] != DEAD
+        self.map_manager.stats.sync_population(self.count_by_state(), float(self.size[:self.count][living].sum()))
+
+    def _reproduce(self, row, response, soil_water):
+        """Plant._reproduce의 기본 조건 통과 이후 단계를 한 식물에 대해 수행합니다."""
+        species_id = self.species[row]
+        species_data = self.species_registry.definitions[species_id] # 씨앗에 그대로 물려줌
+        species = self.species_registry.species[species_id]
+        temp_ok = response.temp_optimal
+        water_ok = species.optimal_soil_water_level_min <= soil_water <= species.optimal_soil_water_level_max
+
+        reproduction_chance = 0.1
+        if temp_ok and water_ok:
+            reproduction_chance = 0.3
+
+        if not (random.random() < reproduction_chance):
+            self.cooldown[row] = species.reproduction_cooldown_cycles_default // 3
+            if TRACE.enabled: self._trace_row("plant.reproduce", row, "Failed by chance. Cooldown set to {}", int(self.cooldown[row]))
+            return
+
+        current_energy = float(self.energy[row])
+        seeds_to_produce = random.randint(1, species.max_seeds_produced_per_attempt)
+        energy_cost = species.energy_cost_per_seed_attempt
+        seed_count = 0
+        seeds_produced_count = 0
+        while seed_count < seeds_to_produce and current_energy >= energy_cost:
+            current_energy -= energy_cost
+            seed_count += 1
+        if seed_count:
+            target_xs, target_ys = draw_seed_targets(self.map_manager.soil_field.free_soil, int(self.grid_x[row]), int(self.grid_y[row]),
+                                                     seed_count, self.config.SEED_SPREAD_RADIUS_MIN, self.config.SEED_SPREAD_RADIUS_MAX)
+            for new_x, new_y in zip(target_xs.tolist(), target_ys.tolist()):
+                if new_x >= 0:
+                    self.spawn(new_x, new_y, PlantState.SEED, species_data)
+                    seeds_produced_count += 1
+
+        if seeds_produced_count > 0 and TRACE.enabled:
+            self._trace_row("plant.reproduce", row, "SUCCESS: Produced {} seeds. Energy spent: {:.2f}",
+                            seeds_produced_count, float(self.energy[row]) - current_energy)
+        self.energy[row] = current_energy
+        self.cooldown[row] = species.reproduction_cooldown_cycles_default
+
+    def _compact(self, removed):
+        """제거된 행을 지우고 남은 행을 순서를 유지한 채 앞으로 당깁니다."""
+        keep = np.ones(self.count, dtype=bool)
+        keep[:len(removed)] = ~removed
+        new_count = int(keep.sum())
+        for name, _dtype in PLANT_FIELDS:
+            array = getattr(self, name)
+            array[:new_count] = array[:self.count][keep]
+        self.count = new_count
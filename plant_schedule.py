@@ -0,0 +1,264 @@
+# plant_schedule.py
+# 식물 갱신 예약: 매 cycle 모든 식물을 훑지 않도록, 잠든 씨앗과 죽은 식물은 깨어날 조건이 생기거나 예정된 cycle이 될 때만 다룹니다.
+import heapq
+from operator import attrgetter
+
+from plant import PlantState
+
+_spawn_order = attrgetter("spawn_order")
+
+class CycleTimerWheel:
+    """cycle 번호별 버킷에 항목을 모아 두고, 예정 cycle이 된 버킷만 꺼내는 타이머 휠."""
+    def __init__(self):
+        self._buckets = {}
+        self._cycles = [] # 버킷이 있는 cycle 번호 (최소 힙)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def schedule(self, cycle, item):
+        """item을 cycle에 처리하도록 예약합니다."""
+        self.schedule_many(cycle, (item,))
+
+    def schedule_many(self, cycle, items):
+        bucket = self._buckets.get(cycle)
+        if bucket is None:
+            bucket = self._buckets[cycle] = []
+            heapq.heappush(self._cycles, cycle)
+        bucket.extend(items)
+
+    def pop_due(self, cycle):
+        """cycle 이전(포함)으로 예약된 항목을 예약 cycle 순서대로 꺼내 반환합니다."""
+        due = []
+        while self._cycles and self._cycles[0] <= cycle:
+            due.extend(self._buckets.pop(heapq.heappop(self._cycles)))
+        return due
+
+    def clear(self):
+        self._buckets = {}
+        self._cycles = []
+
+
+class DormantSeedCohort:
+    """같은 cycle에 같은 상태로 잠든 같은 종 씨앗 묶음.
+       씨앗의 생명 유지 자원 소모와 스트레스(기온, 내부 수분)는 놓인 타일과 무관하므로 묶음 전체가 같은 건강/자원 값을 가지며,
+       한 번만 계산해 구성원(Plant)은 깨어날 때 이 값을 가져갑니다. 타일 수분에 따라 갈리는 건강 회복은 묶음을 나눠 처리합니다.
+    """
+    __slots__ = ("species", "size", "max_energy", "max_water", "health", "energy", "water", "members")
+
+    def __init__(self, plant):
+        self.species = plant.species
+        self.size = plant.current_size
+        self.max_energy = plant.max_energy_capacity
+        self.max_water = plant.max_water_capacity
+        self.health = plant.health
+        self.energy = plant.current_energy
+        self.water = plant.current_water
+        self.members = {} # Plant -> None
+
+    def state_key(self):
+        return (self.species, self.size, self.max_energy, self.max_water, self.health, self.energy, self.water)
+
+    def split(self, plants):
+        """plants를 같은 상태의 새 묶음으로 옮겨 반환합니다."""
+        cohort = DormantSeedCohort.__new__(DormantSeedCohort)
+        for name in DormantSeedCohort.__slots__[:-1]:
+            setattr(cohort, name, getattr(self, name))
+        cohort.members = {}
+        for plant in plants:
+            del self.members[plant]
+            cohort.members[plant] = None
+            plant.seed_cohort = cohort
+        return cohort
+
+    def step(self, config, response, map_manager):
+        """Plant.update의 생명 유지 자원 소모와 환경 스트레스를 씨앗 규칙 그대로 한 cycle 적용합니다 (극한 온도인 날은 호출하지 않음).
+           회복 조건이 타일 수분에 따라 갈리면 회복한 구성원을 새 묶음으로 나눠 반환합니다.
+        """
+        energy = self.energy - config.ENERGY_COST_FOR_MAINTENANCE_PER_CYCLE * self.size
+        water = self.water - config.WATER_COST_FOR_MAINTENANCE_PER_CYCLE * self.size
+        health_damage_from_lack = 0
+        if energy < 0:
+            health_damage_from_lack += abs(energy) * 1.0
+            energy = 0
+        if water < 0:
+            health_damage_from_lack += abs(water) * 1.0
+            water = 0
+        if health_damage_from_lack > 0:
+            self.health -= health_damage_from_lack
+        self.energy, self.water = energy, water
+
+        stress_factor = response.temp_stress # 씨앗은 토양 수분 스트레스를 받지 않음
+        if self.max_water > 0 and (water / self.max_water) < 0.05:
+            stress_factor += 1.2
+        if stress_factor > 0:
+            vulnerability = 1.0 + (1.0 - (self.health / 100.0)) * 0.5
+            self.health -= min(config.STRESS_DAMAGE_RATE * stress_factor * vulnerability, 25.0)
+            return None
+        if not (response.temp_optimal and energy > self.max_energy * 0.2 and water > self.max_water * 0.2):
+            return None
+        recovery_amount = config.HEALING_RATE_UNDER_OPTIMAL_CONDITIONS * (self.health / 150.0 + 0.3)
+        energy_cost_for_healing = recovery_amount * 0.15
+        water_cost_for_healing = recovery_amount * 0.1
+        if not (energy > energy_cost_for_healing and water > water_cost_for_healing):
+            return None
+        species = self.species
+        healed = [plant for plant in self.members
+                  if species.optimal_soil_water_level_min <= map_manager.get_tile(plant.grid_x, plant.grid_y).water_level <= species.optimal_soil_water_level_max]
+        if not healed:
+            return None
+        cohort = self if len(healed) == len(self.members) else self.split(healed)
+        cohort.health = min(100.0, cohort.health + recovery_amount)
+        cohort.energy -= energy_cost_for_healing
+        cohort.water -= water_cost_for_healing
+        return cohort if cohort is not self else None
+
+
+class SpritePlantSchedule:
+    """Plant sprite 엔진에서 cycle마다 update할 식물을 고릅니다.
+       유묘/성체만 매 cycle 그룹 순서(spawn_order)대로 update하고, 죽은 식물은 제거 예정 cycle에만 끼워 넣습니다.
+       씨앗의 자원 소모와 스트레스는 DormantSeedCohort로 묶어 계산하고, 발아 여부가 바뀔 수 있는 날
+       (발아 온도에 처음 도달한 날, 비 온 날, 극한 온도인 날), 건강 악화로 죽는 날, 수명/발아 가능 기간이 끝나는 cycle에만
+       씨앗을 깨워 검사합니다. 비가 오지 않으면 토양 수분은 늘지 않으므로 그 사이에 건너뛴 검사는 모두 발아하지 못했을 검사입니다.
+       발아하지 못한 씨앗의 사망 확률 판정은 난수 순서가 Plant.update와 같도록 매 cycle 그룹 순서대로 update 사이에 끼워 넣습니다.
+    """
+    def __init__(self, map_manager):
+        self.map_manager = map_manager
+        self.config = map_manager.config
+        self.awake = [] # 매 cycle update하는 유묘/성체 (spawn_order 순)
+        self.seeds = {} # id(species_data) -> {Plant: None} 잠든 씨앗
+        self.species = {} # id(species_data) -> Species 레코드
+        self.seed_order = [] # 잠든 씨앗 (spawn_order 순, 사망 확률 판정 순서)
+        self.cohorts = {} # DormantSeedCohort -> None
+        self._joining = {} # 이번 cycle에 만든 묶음의 상태 -> DormantSeedCohort (같은 상태로 들어온 씨앗끼리 묶음)
+        self.new_seeds = [] # 아직 한 번도 발아 검사를 받지 않은 씨앗
+        self.seed_events = CycleTimerWheel() # 씨앗 수명/발아 가능 기간 종료 예정
+        self.removals = CycleTimerWheel() # 죽은 식물 제거 예정
+        self._germination_temp_ok = {} # 종별 직전 cycle의 발아 온도 충족 여부
+        self._next_spawn_order = 0
+        self._spawned = [] # 이번 cycle 도중 새로 생긴 유묘/성체 (다음 cycle부터 update)
+        self._in_cycle = False
+        self._germinated = []
+        self._cycle_plants = []
+
+    def add(self, plant, current_cycle):
+        """맵에 새로 놓인(또는 체크포인트에서 복원된) 식물을 상태에 맞는 예약에 넣습니다."""
+        plant.spawn_order = self._next_spawn_order
+        self._next_spawn_order += 1
+        if plant.current_state == PlantState.SEED:
+            species_key = id(plant.species_data)
+            self.species[species_key] = plant.species
+            self.seeds.setdefault(species_key, {})[plant] = None
+            self.seed_order.append(plant)
+            self.new_seeds.append(plant)
+            self._join_cohort(plant)
+            # 나이가 수명이나 발아 가능 기간을 넘는 cycle (그 전에 발아하지 못했다면 그때 죽음)
+            end_age = min(plant.species.max_lifespan_cycles, plant.species.seed_viability_duration_cycles) + 1
+            self.seed_events.schedule(plant.seed_birth_cycle + end_age, plant)
+        elif plant.current_state == PlantState.DEAD:
+            self.removals.schedule(plant.death_cycle + self.config.DEAD_PLANT_REMOVAL_CYCLES + 1, plant)
+        elif self._in_cycle:
+            self._spawned.append(plant)
+        else: # 초기 배치, 체크포인트 복원: 다음 cycle부터 바로 update
+            self.awake.append(plant)
+
+    def _join_cohort(self, plant):
+        cohort = DormantSeedCohort(plant)
+        cohort = self._joining.setdefault(cohort.state_key(), cohort)
+        cohort.members[plant] = None
+        plant.seed_cohort = cohort
+        self.cohorts[cohort] = None
+
+    def _leave_cohort(self, plant):
+        cohort = plant.seed_cohort
+        if cohort is None:
+            return
+        plant.seed_cohort = None
+        cohort.members.pop(plant, None)
+        if not cohort.members:
+            self.cohorts.pop(cohort, None)
+
+    def on_death(self, plant):
+        """식물이 죽으면 잠든 씨앗 목록에서 빼고 제거를 예약합니다."""
+        self.seeds.get(id(plant.species_data), {}).pop(plant, None)
+        self._leave_cohort(plant)
+        self.removals.schedule(plant.death_cycle + self.config.DEAD_PLANT_REMOVAL_CYCLES + 1, plant)
+
+    def begin_cycle(self, climate_info, current_cycle):
+        """이번 cycle의 씨앗 사건을 처리하고, update할 식물을 그룹 순서대로 내주는 반복자를 반환합니다.
+           반복하는 동안 잠든 씨앗의 사망 확률 판정이 그룹 순서에 맞춰 끼어들므로 끝까지 반복해야 합니다.
+        """
+        self._in_cycle = True
+        self._joining = {}
+        environment = climate_info.environment
+        rained = climate_info.current_daily_rain > 0
+        candidates = dict.fromkeys(self.new_seeds)
+        self.new_seeds = []
+        candidates.update(dict.fromkeys(self.seed_events.pop_due(current_cycle)))
+
+        # 씨앗 묶음마다 자원 소모와 스트레스를 한 번 계산 (극한 온도인 날은 아래에서 모두 깨워 죽음)
+        for cohort in list(self.cohorts):
+            response = environment.response(cohort.species)
+            if response.temp_extreme:
+                continue
+            healed = cohort.step(self.config, response, self.map_manager)
+            if healed is not None:
+                self.cohorts[healed] = None
+            for stepped in (cohort, healed):
+                if stepped is not None and stepped.health <= self.config.MIN_HEALTH_FOR_SURVIVAL:
+                    candidates.update(dict.fromkeys(stepped.members))
+
+        for species_key, species in self.species.items():
+            response = environment.response(species)
+            temp_ok = response.germination_temp_ok
+            extreme = response.temp_extreme
+            if extreme or (temp_ok and (rained or not self._germination_temp_ok.get(species_key, False))):
+                candidates.update(dict.fromkeys(self.seeds.get(species_key, ())))
+            self._germination_temp_ok[species_key] = temp_ok
+
+        for plant in candidates:
+            if plant.current_state != PlantState.SEED or not plant.alive():
+                continue
+            plant.update_dormant_seed(self.map_manager.get_tile(plant.grid_x, plant.grid_y), climate_info, current_cycle)
+            if plant.current_state == PlantState.SAPLING:
+                self.seeds[id(plant.species_data)].pop(plant, None)
+                self._leave_cohort(plant)
+                self._germinated.append(plant)
+        self.seed_order = [plant for plant in self.seed_order if plant.current_state == PlantState.SEED]
+
+        due_dead = [plant for plant in self.removals.pop_due(current_cycle) if plant.alive()]
+        if due_dead:
+            due_dead.sort(key=_spawn_order)
+            self._cycle_plants = list(heapq.merge(self.awake, due_dead, key=_spawn_order))
+        else:
+            self._cycle_plants = self.awake
+        return self._iter_cycle(self._cycle_plants, self.seed_order)
+
+    def _iter_cycle(self, cycle_plants, seeds):
+        """cycle_plants를 차례로 내주면서, 그룹에서 그 앞에 있는 씨앗의 사망 확률 판정을 먼저 합니다.
+           (seeds는 begin_cycle 시점의 목록이므로 이번 cycle에 새로 생긴 씨앗은 판정하지 않음)
+        """
+        seed_count = len(seeds)
+        next_seed = 0
+        for plant in cycle_plants:
+            spawn_order = plant.spawn_order
+            while next_seed < seed_count and seeds[next_seed].spawn_order < spawn_order:
+                seeds[next_seed].roll_seed_failure()
+                next_seed += 1
+            yield plant
+        for seed in seeds[next_seed:seed_count]:
+            seed.roll_seed_failure()
+
+    def end_cycle(self):
+        """이번 cycle에 죽거나 제거된 식물을 빼고, 발아했거나 새로 생긴 유묘/성체를 다음 cycle부터 update하도록 넣습니다."""
+        awake = [plant for plant in self._cycle_plants
+                 if plant.current_state == PlantState.SAPLING or plant.current_state == PlantState.ADULT]
+        if self._germinated:
+            self._germinated.sort(key=_spawn_order)
+            awake = list(heapq.merge(awake, self._germinated, key=_spawn_order))
+            self._germinated = []
+        awake.extend(self._spawned) # 가장 늦게 생겼으므로 끝에 붙여도 순서 유지
+        self._spawned = []
+        self.awake = awake
+        self._cycle_plants = []
+        self._in_cycle = False
@@ -0,0 +1,126 @@
+# profiler.py
+# 단계별 소요 시간 계측: perform_simulation_cycle의 timings 사전과 같은 방식으로 단계 시간을 모아
+# 최근 N개 표본의 분포(p50/p95/max)를 제공하고, 지정한 cycle 구간만 cProfile로 기록합니다.
+import contextlib
+import cProfile
+import json
+import threading
+import time
+
+import numpy as np
+
+from config import PROFILER_WINDOW_SAMPLES
+
+# 식물 갱신 세부 단계 (두 엔진 모두 timings를 주면 기록)
+# - plants.grow: 발아/성장/상태 전환과 용량 갱신 (배열 엔진은 개체 수/생체량 집계도 포함)
+# - plants.reproduce: 번식 (배열 엔진은 같은 행 순서 루프에서 하는 씨앗 사망 판정과 죽은 식물 제거도 포함)
+PLANT_PHASES = ("plants.absorb", "plants.photosynthesize", "plants.stress", "plants.grow", "plants.reproduce")
+# 화면 그리기 단계 (프레임마다 한 표본)
+RENDER_PHASES = ("draw_grid", "draw_plants", "draw_info_panel")
+
+def add_phase_time(timings, phase, phase_start):
+    """phase_start부터 지금까지의 시간을 timings[phase]에 더하고 현재 시각을 반환합니다 (다음 단계의 시작 시각)."""
+    now = time.perf_counter()
+    timings[phase] = timings.get(phase, 0.0) + (now - phase_start)
+    return now
+
+class PhaseProfiler:
+    """단계별 소요 시간 표본을 단계마다 고정 크기 원형 버퍼에 보관합니다.
+       시뮬레이션 단계는 timings 사전(perform_simulation_cycle에 그대로 넘김)에 한 cycle 동안 누적한 값을 end_cycle()에서
+       cycle당 한 표본으로 옮기고, 그리기 단계는 phase() 블록 한 번이 한 표본입니다.
+       enabled가 False이면 phase()는 시간을 재지 않습니다.
+       시뮬레이션 스레드(end_cycle, reset)와 화면 스레드(phase, summary)가 함께 쓰므로 표본은 잠금 안에서만 바꾸고 읽습니다.
+       timings 사전은 시뮬레이션 스레드만 씁니다.
+    """
+    def __init__(self, window=PROFILER_WINDOW_SAMPLES, enabled=True):
+        self.window = window
+        self.enabled = enabled
+        self.timings = {} # 이번 cycle 동안 누적 중인 단계 시간 (초)
+        self.cycles = 0
+        self._samples = {} # 단계 -> 최근 window개 표본 (초, 원형 버퍼)
+        self._counts = {} # 단계 -> 지금까지 받은 표본 수
+        self._lock = threading.Lock()
+
+    def add_sample(self, phase, seconds):
+        with self._lock:
+            self._add_sample(phase, seconds)
+
+    def _add_sample(self, phase, seconds):
+        samples = self._samples.get(phase)
+        if samples is None:
+            samples = self._samples[phase] = np.zeros(self.window)
+            self._counts[phase] = 0
+        samples[self._counts[phase] % self.window] = seconds
+        self._counts[phase] += 1
+
+    def end_cycle(self):
+        """timings에 모인 이번 cycle의 단계 시간을 표본으로 옮기고 timings를 비웁니다."""
+        with self._lock:
+            for phase, seconds in self.timings.items():
+                self._add_sample(phase, seconds)
+        self.timings.clear()
+        self.cycles += 1
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """with 블록의 소요 시간을 name 단계의 표본 하나로 기록합니다."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_sample(name, time.perf_counter() - start)
+
+    def reset(self):
+        self.timings.clear()
+        self.cycles = 0
+        with self._lock:
+            self._samples = {}
+            self._counts = {}
+
+    def summary(self):
+        """단계별 최근 표본의 {"samples", "mean_ms", "p50_ms", "p95_ms", "max_ms"}를 단계가 처음 기록된 순서로 반환합니다."""
+        with self._lock:
+            recent_samples = [(phase, samples[:min(self._counts[phase], self.window)] * 1000.0)
+                              for phase, samples in self._samples.items()]
+        result = {}
+        for phase, recent in recent_samples:
+            p50, p95 = np.percentile(recent, (50, 95))
+            result[phase] = {"samples": int(recent.size), "mean_ms": float(recent.mean()),
+                             "p50_ms": float(p50), "p95_ms": float(p95), "max_ms": float(recent.max())}
+        return result
+
+    def dump_json(self, path):
+        """summary()를 cycle 수, 표본 창 크기와 함께 JSON 파일로 저장합니다."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"cycles": self.cycles, "window": self.window, "phases": self.summary()}, f, indent=1)
+
+
+class CycleProfileCapture:
+    """[start_cycle, stop_cycle] 구간의 cycle만 cProfile로 기록해 끝나면 path에 저장합니다 (pstats/snakeviz로 열람)."""
+    def __init__(self, start_cycle, stop_cycle, path):
+        self.start_cycle = start_cycle
+        self.stop_cycle = stop_cycle
+        self.path = path
+        self._profile = None
+
+    def before_cycle(self, cycle):
+        if cycle == self.start_cycle:
+            self._profile = cProfile.Profile()
+        if self._profile is not None and self.start_cycle <= cycle <= self.stop_cycle:
+            self._profile.enable()
+
+    def after_cycle(self, cycle):
+        if self._profile is None or not self.start_cycle <= cycle <= self.stop_cycle:
+            return
+        self._profile.disable()
+        if cycle == self.stop_cycle:
+            self.finish()
+
+    def finish(self):
+        """기록 중이던 결과를 저장합니다 (실행이 stop_cycle 전에 끝난 경우에도 호출)."""
+        if self._profile is not None:
+            self._profile.dump_stats(self.path)
+            self._profile = None
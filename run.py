@@ -0,0 +1,182 @@
+# run.py
+# 화면 없이 시뮬레이션을 최대 속도로 진행하는 헤드리스 실행기
+# 사용 예: python -m run --cycles 36000 --seed 7
+#         python -m run --cycles 3600 --seed 7 --save-checkpoint ckpt_y10 && python -m run --cycles 3600 --resume ckpt_y10
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import random
+import time
+
+from config import MAP_WIDTH, MAP_HEIGHT, YEAR_LENGTH_DAYS
+from plant import Plant, PlantState
+from simulation import ENGINES, create_simulation, perform_simulation_cycle
+from checkpoint import save_checkpoint, load_checkpoint
+from telemetry import TelemetryWriter
+from climate_schedule import ClimateSchedule
+from profiler import PhaseProfiler, CycleProfileCapture
+from tracelog import TRACE
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless plant ecosystem simulation")
+    parser.add_argument("--cycles", type=int, default=YEAR_LENGTH_DAYS, help="진행할 시뮬레이션 cycle 수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (지정 시 결과 재현 가능)")
+    parser.add_argument("--width", type=int, default=MAP_WIDTH, help="맵 너비 (셀)")
+    parser.add_argument("--height", type=int, default=MAP_HEIGHT, help="맵 높이 (셀)")
+    parser.add_argument("--engine", choices=ENGINES, default=None, help="식물 갱신 엔진 (sprite: Plant 객체, vectorized: 배열 기반, 기본: sprite 또는 체크포인트의 엔진)")
+    parser.add_argument("--report-every", type=int, default=0, help="N cycle마다 진행 상황 출력 (0이면 출력 안 함)")
+    parser.add_argument("--resume", default=None, help="새 맵 대신 이 체크포인트 디렉터리에서 이어서 진행 (--seed/--width/--height 무시)")
+    parser.add_argument("--save-checkpoint", default=None, help="진행이 끝나면 이 디렉터리에 체크포인트 저장")
+    parser.add_argument("--checkpoint-every", type=int, default=0, help="N cycle마다 --save-checkpoint 위치에 덮어써서 저장 (0이면 끝에서만)")
+    parser.add_argument("--telemetry", default=None, help="cycle별 지표를 기록할 텔레메트리 디렉터리 (이미 있으면 이어서 기록)")
+    parser.add_argument("--climate-seed", type=int, default=None, help="이 시드로 전체 기간의 기후 일정표를 미리 생성해 사용")
+    parser.add_argument("--climate-trace", default=None, help="ClimateSchedule.save()로 저장한 기후 일정표(.npz)를 재생")
+    parser.add_argument("--profile", default=None, help="단계별 소요 시간 분포(p50/p95/max)를 이 JSON 파일로 저장")
+    parser.add_argument("--cprofile-cycles", default=None, help="START:END 구간(진행 cycle 번호, 1부터)만 cProfile로 기록")
+    parser.add_argument("--cprofile-output", default="run.prof", help="--cprofile-cycles 결과 파일 (pstats 형식)")
+    parser.add_argument("--trace", default=None, help="추적 로그를 켜고 끝날 때 버퍼의 사건을 이 파일로 저장")
+    parser.add_argument("--trace-plants", default=None, help="쉼표로 구분한 plant_id의 사건만 기록")
+    parser.add_argument("--trace-region", default=None, help="X0,Y0,X1,Y1 범위(X1, Y1 제외) 안의 식물 사건만 기록")
+    parser.add_argument("--trace-events", default=None, help="쉼표로 구분한 사건 종류 또는 분류만 기록 (예: seed,plant.die)")
+    return parser.parse_args(argv)
+
+def format_population(stats):
+    plant_counts = stats.plant_counts
+    return (f"Total Plants: {stats.total_plants} (Seed: {plant_counts[PlantState.SEED]}, Sapling: {plant_counts[PlantState.SAPLING]}, "
+            f"Adult: {plant_counts[PlantState.ADULT]}, Dead: {plant_counts[PlantState.DEAD]}) | Biomass: {stats.biomass:.2f}")
+
+def population_snapshot(cycle, time_manager, stats):
+    """시계열 한 행: 현재 날짜와 개체군/토양 통계를 사전으로 반환합니다."""
+    plant_counts = stats.plant_counts
+    return {
+        "cycle": cycle,
+        "year": time_manager.current_year,
+        "season": time_manager.current_season.value,
+        "day": time_manager.current_day_in_season,
+        "total_plants": stats.total_plants,
+        "seeds": plant_counts[PlantState.SEED],
+        "saplings": plant_counts[PlantState.SAPLING],
+        "adults": plant_counts[PlantState.ADULT],
+        "dead": plant_counts[PlantState.DEAD],
+        "biomass": stats.biomass,
+        "avg_soil_water": stats.average_soil_water_level(),
+    }
+
+def run_headless(cycles, seed=None, width=MAP_WIDTH, height=MAP_HEIGHT, engine=None, report_every=0,
+                 sim_config=None, sample_every=0, resume_from=None, checkpoint_path=None, checkpoint_every=0,
+                 telemetry_path=None, climate_schedule=None, profiler=None, cprofile_capture=None):
+    """sprite 이미지 생성 없이 주어진 cycle 수만큼 시뮬레이션을 진행하고 결과 요약을 반환합니다.
+       sample_every > 0이면 N cycle마다(0 cycle 포함) population_snapshot을 모아 "timeseries"로 함께 반환합니다.
+       resume_from을 주면 새 맵을 만드는 대신 체크포인트에서 이어서 진행하고(난수 상태 포함),
+       checkpoint_path를 주면 끝에서(그리고 checkpoint_every cycle마다) 체크포인트를 저장합니다.
+       telemetry_path를 주면 매 cycle의 지표를 TelemetryWriter로 기록합니다.
+       climate_schedule(ClimateSchedule)을 주면 새 맵의 기후를 일정표에서 조회합니다 (체크포인트는 저장된 일정표 사용).
+       profiler(PhaseProfiler)를 주면 cycle마다 단계별 소요 시간을 기록해 "profile"로 함께 반환하고,
+       cprofile_capture(CycleProfileCapture)를 주면 그 구간의 cycle을 cProfile로 기록합니다.
+    """
+    Plant.visuals_enabled = False
+
+    setup_start = time.perf_counter()
+    if resume_from:
+        time_manager, climate_manager, map_manager, plant_group = load_checkpoint(resume_from, engine=engine)
+        schedule = climate_manager.schedule
+        cycles_needed = time_manager.total_cycles_elapsed + cycles
+        if schedule is not None and len(schedule) <= cycles_needed and schedule.seed is not None:
+            # 저장된 일정표가 짧으면 같은 시드로 늘림 (이미 지난 구간의 기후는 그대로)
+            climate_manager.schedule = ClimateSchedule.generate(cycles_needed, seed=schedule.seed, sim_config=climate_manager.config)
+    else:
+        if seed is not None:
+            random.seed(seed)
+        time_manager, climate_manager, map_manager, plant_group = create_simulation(width, height, engine=engine or "sprite", sim_config=sim_config,
+                                                                                climate_schedule=climate_schedule)
+    setup_seconds = time.perf_counter() - setup_start
+
+    timeseries = []
+    if sample_every:
+        timeseries.append(population_snapshot(0, time_manager, map_manager.stats))
+
+    telemetry = TelemetryWriter(telemetry_path, map_manager.stats) if telemetry_path else None
+    run_start = time.perf_counter()
+    for cycle in range(1, cycles + 1):
+        if cprofile_capture:
+            cprofile_capture.before_cycle(cycle)
+        perform_simulation_cycle(time_manager, climate_manager, map_manager, plant_group,
+                                 profiler.timings if profiler else None)
+        if cprofile_capture:
+            cprofile_capture.after_cycle(cycle)
+        if profiler:
+            profiler.end_cycle()
+        if telemetry:
+            telemetry.record(time_manager, climate_manager, map_manager.stats)
+        if sample_every and (cycle % sample_every == 0 or cycle == cycles):
+            timeseries.append(population_snapshot(cycle, time_manager, map_manager.stats))
+        if report_every and cycle % report_every == 0:
+            elapsed = time.perf_counter() - run_start
+            print(f"[{cycle}/{cycles}] {time_manager.get_current_date_str()} | {format_population(map_manager.stats)} | {cycle / elapsed:.1f} cycles/s")
+        if checkpoint_path and checkpoint_every and cycle % checkpoint_every == 0 and cycle != cycles:
+            save_checkpoint(checkpoint_path, time_manager, climate_manager, map_manager, plant_group)
+    if telemetry:
+        telemetry.close()
+    run_seconds = time.perf_counter() - run_start
+    if cprofile_capture:
+        cprofile_capture.finish()
+    if checkpoint_path:
+        save_checkpoint(checkpoint_path, time_manager, climate_manager, map_manager, plant_group)
+
+    return {
+        "width": map_manager.width,
+        "height": map_manager.height,
+        "engine": "vectorized" if map_manager.plant_population is not None else "sprite",
+        "cycles": cycles,
+        "setup_seconds": setup_seconds,
+        "run_seconds": run_seconds,
+        "cycles_per_second": cycles / run_seconds if run_seconds > 0 else float("inf"),
+        "date": time_manager.get_current_date_str(),
+        "total_plants": map_manager.stats.total_plants,
+        "plant_counts": {state.value: count for state, count in map_manager.stats.plant_counts.items()},
+        "biomass": map_manager.stats.biomass,
+        "avg_soil_water": map_manager.stats.average_soil_water_level(),
+        "timeseries": timeseries,
+        "profile": profiler.summary() if profiler else None,
+    }
+
+def main(argv=None):
+    args = parse_args(argv)
+    climate_schedule = None
+    if args.climate_trace:
+        climate_schedule = ClimateSchedule.load(args.climate_trace)
+    elif args.climate_seed is not None:
+        climate_schedule = ClimateSchedule.generate(args.cycles, seed=args.climate_seed)
+    profiler = PhaseProfiler() if args.profile else None
+    cprofile_capture = None
+    if args.cprofile_cycles:
+        start, stop = (int(value) for value in args.cprofile_cycles.split(":"))
+        cprofile_capture = CycleProfileCapture(start, stop, args.cprofile_output)
+    if args.trace:
+        TRACE.enabled = True
+        TRACE.configure(plant_ids=[int(value) for value in args.trace_plants.split(",")] if args.trace_plants else None,
+                        region=[int(value) for value in args.trace_region.split(",")] if args.trace_region else None,
+                        events=args.trace_events.split(",") if args.trace_events else None)
+    summary = run_headless(args.cycles, seed=args.seed, width=args.width, height=args.height,
+                           engine=args.engine, report_every=args.report_every, resume_from=args.resume,
+                           checkpoint_path=args.save_checkpoint, checkpoint_every=args.checkpoint_every,
+                           telemetry_path=args.telemetry, climate_schedule=climate_schedule,
+                           profiler=profiler, cprofile_capture=cprofile_capture)
+    counts = summary["plant_counts"]
+    print(f"Map: {summary['width']}x{summary['height']}, Seed: {args.seed if not args.resume else 'resumed from ' + args.resume}, Engine: {summary['engine']}")
+    print(f"Setup: {summary['setup_seconds']:.2f}s, Run: {summary['run_seconds']:.2f}s "
+          f"({summary['cycles']} cycles, {summary['cycles_per_second']:.1f} cycles/s)")
+    print(summary["date"])
+    print(f"Total Plants: {summary['total_plants']} (Seed: {counts['SEED']}, Sapling: {counts['SAPLING']}, "
+          f"Adult: {counts['ADULT']}, Dead: {counts['DEAD']})")
+    print(f"Biomass: {summary['biomass']:.2f}")
+    print(f"Avg Soil Water: {summary['avg_soil_water']:.1f}mm")
+    if profiler:
+        profiler.dump_json(args.profile)
+        print(f"Profile: {args.profile}")
+    if args.trace:
+        print(f"Trace: {TRACE.dump(args.trace)} events written to {args.trace}")
+
+if __name__ == '__main__':
+    main()
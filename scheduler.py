@@ -0,0 +1,81 @@
+# scheduler.py
+import time
+
+from config import (SIMULATION_CYCLES_PER_SECOND, MAX_CATCHUP_CYCLES_PER_FRAME,
+                    MAX_SPEED_RENDER_EVERY_N_CYCLES, MAX_SPEED_FRAME_BUDGET_SECONDS)
+
+class SimulationScheduler:
+    """시뮬레이션 진행 속도(고정 시간 간격)와 화면 갱신 빈도를 분리하는 스케줄러.
+
+       - 일반 모드: 흐른 시간을 누적해 cycle_interval마다 한 cycle씩, 밀린 만큼 한 프레임에 여러 cycle을 진행
+         (한 프레임 최대 max_catchup_cycles, 그 이상 밀리면 밀린 시간을 버림)
+       - 최고 속도 모드: 프레임 시간 예산 안에서 가능한 만큼 진행하고 N cycle마다 한 번만 화면을 갱신
+       - 일시정지: cycle을 진행하지 않고, 화면도 입력 등으로 바뀐 것이 있을 때만 갱신
+    """
+    def __init__(self, cycles_per_second=SIMULATION_CYCLES_PER_SECOND, max_catchup_cycles=MAX_CATCHUP_CYCLES_PER_FRAME,
+                 max_speed_render_every=MAX_SPEED_RENDER_EVERY_N_CYCLES, max_speed_frame_budget=MAX_SPEED_FRAME_BUDGET_SECONDS):
+        self.cycle_interval = 1.0 / cycles_per_second if cycles_per_second > 0 else 0
+        self.max_catchup_cycles = max_catchup_cycles
+        self.max_speed_render_every = max_speed_render_every
+        self.max_speed_frame_budget = max_speed_frame_budget
+        self.paused = False
+        self.max_speed = False
+        self._accumulator = 0.0
+        self._last_time = time.perf_counter()
+        self._cycles_since_render = 0
+        self._dirty = True # 첫 프레임은 항상 그림
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self.mark_dirty()
+
+    def toggle_max_speed(self):
+        self.max_speed = not self.max_speed
+        self._accumulator = 0.0
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """시뮬레이션 외의 이유(입력, 수동 진행 등)로 화면을 다시 그려야 함을 표시합니다."""
+        self._dirty = True
+
+    def advance(self, step):
+        """이번 프레임에 진행해야 할 만큼 step()을 호출하고 진행한 cycle 수를 반환합니다."""
+        now = time.perf_counter()
+        elapsed = now - self._last_time
+        self._last_time = now
+
+        if self.paused or (self.cycle_interval == 0 and not self.max_speed): # 속도 0이면 수동 진행만
+            self._accumulator = 0.0
+            return 0
+
+        cycles = 0
+        if self.max_speed:
+            deadline = now + self.max_speed_frame_budget
+            while cycles < self.max_speed_render_every and time.perf_counter() < deadline:
+                step()
+                cycles += 1
+        else:
+            self._accumulator += elapsed
+            cycles = int(self._accumulator / self.cycle_interval)
+            if cycles > self.max_catchup_cycles:
+                cycles = self.max_catchup_cycles
+                self._accumulator = 0.0 # 따라잡을 수 없을 만큼 밀렸으면 밀린 시간을 버림
+            else:
+                self._accumulator -= cycles * self.cycle_interval
+            for _ in range(cycles):
+                step()
+
+        self._cycles_since_render += cycles
+        return cycles
+
+    def should_render(self):
+        """이번 프레임에 화면을 다시 그려야 하는지 반환합니다."""
+        if self._dirty:
+            return True
+        if self.max_speed:
+            return self._cycles_since_render >= self.max_speed_render_every
+        return self._cycles_since_render > 0
+
+    def mark_rendered(self):
+        self._cycles_since_render = 0
+        self._dirty = False
@@ -0,0 +1,255 @@
+# sim_worker.py
+# 시뮬레이션을 화면 루프와 분리된 작업 스레드에서 진행하고, 그리기에 필요한 값만 담은 스냅샷을 화면 루프에 넘깁니다.
+# 화면 루프는 최신 스냅샷만 읽고, 일시정지/수동 진행/식물 선택 등은 명령으로 작업 스레드에 보냅니다.
+import collections
+import queue
+import threading
+
+import numpy as np
+
+from config import SIMULATION_WORKER_IDLE_SECONDS, CAMERA_SPRITE_MIN_CELL_PIXELS
+from scheduler import SimulationScheduler
+from simulation import perform_simulation_cycle
+from tracelog import TRACE
+from visualization import aggregate_view, panel_info
+
+# draw_selected_plant_info가 읽는 Plant 속성의 복사본 (선택된 식물 표시용)
+PlantInfo = collections.namedtuple("PlantInfo", (
+    "plant_id", "grid_x", "grid_y", "current_state", "age", "health", "current_size", "adult_max_size_actual",
+    "current_energy", "max_energy_capacity", "current_water", "max_water_capacity", "reproduction_cooldown"))
+
+class RenderSnapshot:
+    """한 시점의 뷰 범위 화면 상태. 만든 뒤에는 바꾸지 않습니다.
+       - view: 담고 있는 범위 (x0, y0, x1, y1, block) - Camera.visible_cells() 형식
+       - terrain_buckets: 묶음(block x block 셀)별 팔레트 인덱스 (읽기 전용 배열)
+       - plant_density: 묶음별 식물 밀도 (읽기 전용 배열, 식물을 하나씩 그리는 배율이면 None)
+       - plant_visuals: 범위 안 식물의 (grid_x, grid_y, (상태, 픽셀 크기, 색)) 튜플 (밀도로 그리는 배율이면 빈 튜플)
+       - panel: visualization.panel_info()의 정보 패널 값
+       - selected: 선택된 식물의 PlantInfo (없으면 None)
+    """
+    __slots__ = ("serial", "cycle", "slot", "view", "terrain_buckets", "plant_density", "plant_visuals", "panel", "selected")
+
+    def __init__(self, serial, cycle, slot, view, terrain_buckets, plant_density, plant_visuals, panel, selected):
+        self.serial = serial
+        self.cycle = cycle
+        self.slot = slot
+        self.view = view
+        self.terrain_buckets = terrain_buckets
+        self.plant_density = plant_density
+        self.plant_visuals = plant_visuals
+        self.panel = panel
+        self.selected = selected
+
+
+class SnapshotBuffer:
+    """뷰 범위의 지형 버킷/식물 밀도 배열 두 벌을 번갈아 채우는 이중 버퍼.
+       배열은 뷰포트가 담을 수 있는 최대 묶음 수(max_blocks_high x max_blocks_wide) 크기로 미리 만들어 두고,
+       스냅샷에는 그중 뷰 범위만큼 잘라 읽기 전용으로 넘깁니다.
+       작업 스레드는 화면 루프가 마지막 스냅샷을 가져간 뒤에만(ready) 새 스냅샷을 만들고, 그때 화면 루프가 읽고 있지 않은
+       쪽 칸에 씁니다. 화면 루프는 acquire()로 최신 스냅샷으로 옮겨 가며, 다음 acquire() 전까지 그 칸은 바뀌지 않습니다.
+    """
+    def __init__(self, max_blocks_high, max_blocks_wide):
+        self._lock = threading.Lock()
+        shape = (max_blocks_high, max_blocks_wide)
+        self._buckets = [np.zeros(shape, dtype=np.uint8) for _ in range(2)]
+        self._density = [np.zeros(shape, dtype=np.float32) for _ in range(2)]
+        self._slot_sources = [None, None] # 칸별로 담고 있는 (토양 version, 뷰 범위) - version은 cycle마다 바뀜
+        self._latest = None
+        self._serial = 0
+        self.ready = True # 화면 루프가 최신 스냅샷을 가져갔는지 (작업 스레드가 다음 스냅샷을 만들어도 되는지)
+
+    def publish(self, cycle, soil_field, view, with_density, plant_visuals, panel, selected):
+        """작업 스레드에서 호출: 비어 있는 칸에 뷰 범위의 지형 버킷(과 식물 밀도)을 채우고 새 스냅샷을 최신으로 만듭니다."""
+        slot = 0 if self._latest is None else 1 - self._latest.slot
+        x0, y0, x1, y1, block = view
+        source = (soil_field.version, view) # 같은 cycle의 같은 범위면 (토양과 식물 배치가 그대로) 다시 계산하지 않음
+        blocks_high, blocks_wide = -(-(y1 - y0) // block), -(-(x1 - x0) // block)
+        if self._slot_sources[slot] != source:
+            buckets, density = aggregate_view(soil_field, x0, y0, x1, y1, block)
+            self._buckets[slot][:blocks_high, :blocks_wide] = buckets
+            self._density[slot][:blocks_high, :blocks_wide] = density
+            self._slot_sources[slot] = source
+        terrain_buckets = _read_only(self._buckets[slot][:blocks_high, :blocks_wide])
+        plant_density = _read_only(self._density[slot][:blocks_high, :blocks_wide]) if with_density else None
+        self._serial += 1
+        snapshot = RenderSnapshot(self._serial, cycle, slot, view, terrain_buckets, plant_density, plant_visuals, panel, selected)
+        with self._lock:
+            self._latest = snapshot
+            self.ready = False
+        return snapshot
+
+    def acquire(self):
+        """화면 루프에서 호출: 최신 스냅샷을 반환합니다 (아직 없으면 None)."""
+        with self._lock:
+            self.ready = True
+            return self._latest
+
+
+def _read_only(array):
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class SimulationWorker:
+    """시뮬레이션 객체를 소유하고 작업 스레드에서 진행합니다. 진행 속도는 SimulationScheduler가 정하며
+       (일반/최고 속도/일시정지), 화면을 다시 그릴 때가 되었고 화면 루프가 이전 스냅샷을 가져갔으면 새 스냅샷을 냅니다.
+       시뮬레이션 상태는 작업 스레드만 읽고 씁니다. 화면 루프는 send()로 명령을 보내고 snapshots.acquire()로 결과를 읽습니다.
+    """
+    def __init__(self, time_manager, climate_manager, map_manager, plants, camera, scheduler=None, profiler=None):
+        self.time_manager = time_manager
+        self.climate_manager = climate_manager
+        self.map_manager = map_manager
+        self.plants = plants
+        self.scheduler = scheduler if scheduler else SimulationScheduler()
+        self.profiler = profiler
+        # 뷰 범위의 묶음 수는 뷰포트 픽셀 수 + 양 끝에 걸친 묶음 2개를 넘지 않음
+        self.snapshots = SnapshotBuffer(camera.view_height + 2, camera.view_width + 2)
+        self.view = camera.visible_cells()
+        self.draw_sprites = camera.cell_pixels >= CAMERA_SPRITE_MIN_CELL_PIXELS
+        self.selected_plant = None # sprite 엔진: Plant, 배열 엔진: plant_id
+        self.status = "" # 정보 패널 맨 아래 줄에 보여 줄 최근 명령 결과
+        self.error = None
+        self._commands = queue.Queue()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="simulation-worker", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def send(self, command, *args):
+        """명령을 작업 스레드로 보냅니다. 명령은 _handle_<command> 메서드 이름입니다 (예: "toggle_pause", "select")."""
+        self._commands.put((command, args))
+
+    def stop(self):
+        """작업 스레드를 끝내고 기다립니다. 작업 스레드에서 예외가 났으면 다시 발생시킵니다."""
+        self.send("stop")
+        self._thread.join()
+        if self.error:
+            raise self.error
+
+    def _run(self):
+        try:
+            while self._running:
+                cycles = self.scheduler.advance(self._step)
+                if self.scheduler.should_render() and self.snapshots.ready:
+                    self._publish()
+                    self.scheduler.mark_rendered()
+                # 진행할 cycle이 없었으면 명령이 올 때까지 잠깐 기다림 (최고 속도 모드에서는 기다리지 않음)
+                self._handle_commands(timeout=None if cycles else SIMULATION_WORKER_IDLE_SECONDS)
+        except Exception as e:
+            self.error = e
+
+    def _handle_commands(self, timeout):
+        while self._running:
+            try:
+                if timeout is None:
+                    command, args = self._commands.get_nowait()
+                else:
+                    command, args = self._commands.get(timeout=timeout)
+                    timeout = None
+            except queue.Empty:
+                return
+            getattr(self, f"_handle_{command}")(*args)
+            self.scheduler.mark_dirty() # 명령의 결과가 보이도록 다시 그림
+
+    def _step(self):
+        profiler = self.profiler
+        perform_simulation_cycle(self.time_manager, self.climate_manager, self.map_manager, self.plants,
+                                 profiler.timings if profiler and profiler.enabled else None)
+        if profiler and profiler.enabled:
+            profiler.end_cycle()
+
+    def _publish(self):
+        plant_visuals = ()
+        if self.draw_sprites: # 뷰 범위 안의 식물만 (맵 전체를 훑지 않음)
+            x0, y0, x1, y1, _block = self.view
+            population = self.map_manager.plant_population
+            if population is not None:
+                plant_visuals = tuple((int(population.grid_x[row]), int(population.grid_y[row]), population.visual_key(row))
+                                      for row in self.map_manager.plant_rows_in_rect(x0, y0, x1, y1))
+            else:
+                plant_visuals = tuple((plant.grid_x, plant.grid_y, plant.visual_key)
+                                      for plant in self.map_manager.plants_in_rect(x0, y0, x1, y1))
+        self.snapshots.publish(self.time_manager.total_cycles_elapsed, self.map_manager.soil_field, self.view, not self.draw_sprites,
+                               plant_visuals, panel_info(self.time_manager, self.climate_manager, self.map_manager, self.status), self._selected_info())
+
+    def _selected_info(self):
+        """선택된 식물의 PlantInfo를 반환합니다. 선택이 없거나 (배열 엔진에서) 선택한 식물이 제거되었으면 None."""
+        population = self.map_manager.plant_population
+        if population is not None:
+            row = population.row_of(self.selected_plant)
+            return PlantInfo(**population.plant_attributes(row)) if row is not None else None
+        plant = self.selected_plant
+        if plant is None:
+            return None
+        plant.sync_dormant_state(self.time_manager.total_cycles_elapsed) # 잠든 씨앗의 나이와 건강/자원을 현재 cycle로 맞춤
+        return PlantInfo(*(getattr(plant, field) for field in PlantInfo._fields))
+
+    def _report(self, event, message, *args):
+        """명령 결과를 정보 패널 상태 줄에 보여 주고, 추적 로그가 켜져 있으면 사건으로도 남깁니다."""
+        self.status = message.format(*args)
+        if TRACE.enabled: TRACE.emit(event, message, *args)
+
+    # --- 명령 ---
+    def _handle_stop(self):
+        self._running = False
+
+    def _handle_toggle_pause(self):
+        self.scheduler.toggle_pause()
+        self._report("ui.pause", "Simulation {}", "PAUSED" if self.scheduler.paused else "RESUMED")
+
+    def _handle_step(self):
+        """일시정지 중(또는 속도 0)일 때 한 cycle을 진행합니다."""
+        if self.scheduler.paused or self.scheduler.cycle_interval == 0:
+            self._step()
+
+    def _handle_toggle_max_speed(self):
+        self.scheduler.toggle_max_speed()
+        self._report("ui.max_speed", "Max speed mode {}", "ENABLED" if self.scheduler.max_speed else "DISABLED")
+
+    def _handle_toggle_profiler(self):
+        """단계별 소요 시간 기록을 켜고 끕니다 (켤 때마다 새로 집계)."""
+        self.profiler.enabled = not self.profiler.enabled
+        self.profiler.reset()
+        self._report("ui.profiler", "Profiler overlay {}", "ENABLED" if self.profiler.enabled else "DISABLED")
+
+    def _handle_set_debug(self, enabled):
+        """디버그 모드를 따라 추적 로그를 켜고 끕니다 (사건을 추가하는 작업 스레드에서 바꿈)."""
+        if not enabled:
+            self._report("ui.debug", "Debug mode {}", "DISABLED") # 끄기 전에 기록
+        TRACE.enabled = enabled
+        if enabled:
+            self._report("ui.debug", "Debug mode {}", "ENABLED")
+
+    def _handle_set_view(self, view, draw_sprites):
+        """스냅샷에 담을 범위(Camera.visible_cells())와 식물을 하나씩 담을지(아니면 묶음별 밀도) 정합니다."""
+        self.view = view
+        self.draw_sprites = draw_sprites
+
+    def _handle_select(self, grid_x, grid_y):
+        """(grid_x, grid_y)의 식물을 선택하고 추적 로그를 그 식물로 좁힙니다. 식물이 없으면 선택을 유지합니다.
+           sprite 엔진에서는 Plant 객체를, 배열 엔진에서는 행 번호가 바뀌므로 plant_id를 선택으로 보관합니다.
+        """
+        population = self.map_manager.plant_population
+        if population is not None:
+            row = self.map_manager.plant_row_at(grid_x, grid_y)
+            if row is None:
+                return
+            plant_id = self.selected_plant = int(population.plant_id[row])
+        else:
+            plant = self.map_manager.plant_at(grid_x, grid_y)
+            if plant is None:
+                return
+            self.selected_plant = plant
+            plant_id = plant.plant_id
+        TRACE.configure(plant_ids=(plant_id,)) # 선택한 식물의 사건만 기록
+        if TRACE.enabled: TRACE.emit("ui.select", "Selected plant", plant_id=plant_id, x=grid_x, y=grid_y)
+
+    def _handle_deselect(self):
+        self.selected_plant = None
+        TRACE.configure() # 식물 필터 해제
+
+    def _handle_dump_trace(self, path):
+        """추적 로그 버퍼를 path에 저장합니다 (사건을 추가하는 작업 스레드에서 저장해야 버퍼가 도중에 바뀌지 않음)."""
+        self.status = f"Trace: {TRACE.dump(path)} events written to {path}"
@@ -0,0 +1,74 @@
+# simulation.py
+# 화면(pygame display)과 무관한 시뮬레이션 구성/진행 로직
+import time
+import pygame
+
+from config import STATS_RESYNC_CYCLES
+from time_manager import TimeManager
+from climate import ClimateManager
+from map_manager import MapManager
+from plant_population import PlantPopulation
+from profiler import add_phase_time
+from tracelog import TRACE
+
+ENGINES = ("sprite", "vectorized")
+
+def create_simulation(width, height, engine="sprite", sim_config=None, climate_schedule=None):
+    """시간, 기후, 맵, 식물 집합을 생성하고 초기 식물을 배치한 뒤 반환합니다.
+       engine이 "sprite"이면 식물 집합은 Plant sprite 그룹, "vectorized"이면 PlantPopulation입니다.
+       sim_config(SimulationConfig)를 주면 모든 객체가 config.py 기본값 대신 그 파라미터를 사용합니다.
+       climate_schedule(ClimateSchedule)을 주면 기후를 매 cycle 계산하지 않고 일정표에서 조회합니다.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown plant engine: {engine}")
+    time_manager = TimeManager(sim_config=sim_config)
+    climate_manager = ClimateManager(time_manager_ref=time_manager, sim_config=sim_config, schedule=climate_schedule)
+    all_plants_group = pygame.sprite.Group()
+    map_manager = MapManager(width=width, height=height,
+                             climate_manager_ref=climate_manager,
+                             plant_group_ref=all_plants_group,
+                             sim_config=sim_config, engine=engine)
+    plants = all_plants_group
+    if engine == "vectorized":
+        plants = PlantPopulation(map_manager_ref=map_manager)
+        map_manager.plant_population = plants
+    map_manager.initial_plant_placement()
+    return time_manager, climate_manager, map_manager, plants
+
+# perform_simulation_cycle의 단계 이름 (timings 사전의 키)
+CYCLE_PHASES = ("time_climate", "environment", "plants")
+
+def perform_simulation_cycle(time_manager, climate_manager, map_manager, plant_group, timings=None):
+    """한 cycle(하루)을 진행합니다. timings 사전을 주면 단계별(CYCLE_PHASES) 소요 시간(초)을 누적하고,
+       식물 갱신의 세부 단계(profiler.PLANT_PHASES) 시간도 함께 누적합니다.
+    """
+    if TRACE.enabled:
+        TRACE.cycle = time_manager.total_cycles_elapsed + 1
+        TRACE.emit("cycle.start", "--- Cycle {} Start ---", TRACE.cycle)
+    if timings is not None: phase_start = time.perf_counter()
+    year_changed = time_manager.update()
+    if year_changed:
+        climate_manager.apply_yearly_fluctuations()
+
+    current_temp, rain_today = climate_manager.update_daily_climate()
+    if timings is not None: phase_start = add_phase_time(timings, "time_climate", phase_start)
+    map_manager.update_map_environment(current_temp, rain_today)
+    if timings is not None: phase_start = add_phase_time(timings, "environment", phase_start)
+
+    if isinstance(plant_group, PlantPopulation):
+        plant_group.update(climate_manager, time_manager, timings)
+    else:
+        # 유묘/성체와 제거 예정인 죽은 식물만 그룹 순서대로 update (잠든 씨앗은 묶음으로 계산하고 사건이 있을 때만 깨움)
+        schedule = map_manager.sprite_schedule
+        for plant_sprite in schedule.begin_cycle(climate_manager, time_manager.total_cycles_elapsed):
+            soil_tile = map_manager.get_tile(plant_sprite.grid_x, plant_sprite.grid_y)
+            if soil_tile:
+                plant_sprite.update(soil_tile, climate_manager, time_manager, timings)
+            else:
+                if TRACE.enabled:
+                    TRACE.emit("plant.skip", "No valid soil tile. Skipping update.",
+                               plant_id=plant_sprite.plant_id, x=plant_sprite.grid_x, y=plant_sprite.grid_y)
+        schedule.end_cycle()
+        if time_manager.total_cycles_elapsed % STATS_RESYNC_CYCLES == 0:
+            map_manager.stats.recount(plant_group)
+    if timings is not None: add_phase_time(timings, "plants", phase_start)
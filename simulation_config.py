@@ -0,0 +1,76 @@
+# simulation_config.py
+# 한 번의 시뮬레이션 실행에 쓰이는 파라미터 묶음 (config.py 상수 + 종 특성)
+import copy
+
+import config
+import plant_species
+
+# 실행마다 바꿀 수 있는 시뮬레이션 파라미터 (화면/색상 등 표시용 상수는 제외)
+SIMULATION_PARAMETER_NAMES = (
+    # 시간
+    "CYCLES_PER_DAY", "DAYS_PER_SEASON",
+    # 지형
+    "TERRAIN_NOISE_SCALE", "TERRAIN_NOISE_OCTAVES", "TERRAIN_WATER_THRESHOLD", "TERRAIN_ROCK_THRESHOLD",
+    # 토양
+    "MAX_SOIL_WATER_LEVEL", "INITIAL_SOIL_NUTRIENT_LEVEL",
+    # 기후
+    "SEASON_AVG_TEMPS", "SEASON_TEMP_VARIATION", "YEARLY_AVG_TEMP_FLUCTUATION_RANGE",
+    "SEASON_RAINFALL_PATTERNS", "YEARLY_RAINFALL_FLUCTUATION_RANGE", "DAY_LENGTH_RATIOS",
+    # 식물 배치
+    "INITIAL_PLANT_DENSITY", "MIN_INITIAL_PLANT_DISTANCE",
+    # 식물 생존/성장/번식/죽음
+    "MIN_HEALTH_FOR_SURVIVAL", "ENERGY_COST_FOR_MAINTENANCE_PER_CYCLE", "WATER_COST_FOR_MAINTENANCE_PER_CYCLE",
+    "PHOTOSYNTHESIS_BASE_EFFICIENCY", "WATER_ABSORPTION_RATE", "STRESS_DAMAGE_RATE",
+    "HEALING_RATE_UNDER_OPTIMAL_CONDITIONS", "SEED_DEATH_CHANCE_PER_CYCLE_IF_UNABLE_TO_GERMINATE",
+    "SAPLING_TO_ADULT_GROWTH_PER_CYCLE", "SEED_SPREAD_RADIUS_MAX", "SEED_SPREAD_RADIUS_MIN",
+    "REPRODUCTION_ENERGY_THRESHOLD_FACTOR", "REPRODUCTION_WATER_THRESHOLD_FACTOR", "DEAD_PLANT_REMOVAL_CYCLES",
+)
+# 종 특성 (plant_species.py)
+SPECIES_PARAMETER_NAMES = ("STRONG_PLANT_SPECIES",)
+
+
+class SimulationConfig:
+    """한 실행의 시뮬레이션 파라미터. 기본값은 config.py / plant_species.py의 값이며,
+       시뮬레이션 객체들은 모듈 상수 대신 이 객체의 속성(예: cfg.STRESS_DAMAGE_RATE)을 읽습니다.
+       같은 프로세스에서 서로 다른 설정의 실행을 섞어도 서로 영향을 주지 않습니다.
+    """
+    def __init__(self, overrides=None):
+        for name in SIMULATION_PARAMETER_NAMES:
+            setattr(self, name, copy.deepcopy(getattr(config, name)))
+        for name in SPECIES_PARAMETER_NAMES:
+            setattr(self, name, copy.deepcopy(getattr(plant_species, name)))
+        if overrides:
+            self._apply_overrides(overrides)
+
+    @property
+    def year_length_days(self):
+        return self.DAYS_PER_SEASON * 4
+
+    def _apply_overrides(self, overrides):
+        """{"이름": 값} 또는 {"이름.키": 값} 형태의 덮어쓰기를 적용합니다.
+           "이름.키"는 사전형 파라미터(종 특성, 계절별 값 등)의 한 항목만 바꿉니다.
+        """
+        for key, value in overrides.items():
+            name, _, item = key.partition(".")
+            if name not in SIMULATION_PARAMETER_NAMES and name not in SPECIES_PARAMETER_NAMES:
+                raise KeyError(f"Unknown simulation parameter: {name}")
+            if not item:
+                setattr(self, name, value)
+                continue
+            target = getattr(self, name)
+            if not isinstance(target, dict) or item not in target:
+                raise KeyError(f"Unknown simulation parameter: {key}")
+            target[item] = value
+
+    def with_overrides(self, overrides):
+        """현재 설정을 복사한 뒤 덮어쓰기를 적용한 새 설정을 반환합니다."""
+        new_config = copy.deepcopy(self)
+        new_config._apply_overrides(overrides)
+        return new_config
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in SIMULATION_PARAMETER_NAMES + SPECIES_PARAMETER_NAMES}
+
+
+# 설정을 지정하지 않은 시뮬레이션 객체가 공유하는 기본 설정 (수정하지 말고 with_overrides로 복사해서 사용)
+DEFAULT_SIMULATION_CONFIG = SimulationConfig()
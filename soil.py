@@ -1,26 +1,364 @@
 # soil.py
-from terrain import TerrainType
-from config import MAX_SOIL_WATER_LEVEL, INITIAL_SOIL_NUTRIENT_LEVEL
+import numpy as np
+
+from terrain import TerrainType, TERRAIN_TYPES_BY_CODE, TERRAIN_CODES, SOIL_CODE, WATER_CODE
+from config import MAX_SOIL_WATER_LEVEL, INITIAL_SOIL_NUTRIENT_LEVEL, SOIL_CHUNK_SIZE
+
+# 셀 단위 상태 배열 이름 (체크포인트에 그대로 저장되는 열)
+SOIL_FIELD_ARRAYS = ("terrain", "water_level", "temperature", "nutrient_level", "occupied", "plant_id")
+
+class SoilField:
+    """맵 전체의 토양 상태를 셀 단위 NumPy 배열(structure-of-arrays)로 보관합니다.
+       모든 배열은 (height, width) 모양이며 [y, x]로 접근합니다.
+
+       맵은 SOIL_CHUNK_SIZE 정사각형 청크로 나뉩니다. 식물이 있는 청크만 매 cycle SOIL 셀에 강수/증발을 계산하고,
+       식물이 없는 SOIL 청크는 잠들어 셀을 건드리지 않습니다. 같은 cycle에 잠든 청크들은 한 묶음(sleep group)이 되어
+       그동안의 날씨를 묶음 변환 하나에 합성해 두고, 식물이 들어와 깨어날 때(또는 셀에 값을 쓸 때) 셀마다 한 번 적용합니다.
+       하루 갱신(강수 후 상한, 증발)은 선형분수 변환과 min으로 이루어져 며칠을 합성해도
+       min((p * w + q) / (s * w + u), cap) 꼴이므로, 잠든 기간과 무관하게 셀당 O(1)로 따라잡습니다.
+       WATER/ROCK만 있는 청크는 갱신하지도 묶음에 넣지도 않습니다. 기온은 모든 셀이 같은 값을 공유합니다.
+       water_level 배열은 잠든 청크에서는 잠든 시점의 값이므로, 현재 수분은 water_at / water_level_in_rect /
+       soil_water_total로 읽습니다. 읽기는 배열과 묶음 변환을 바꾸지 않으므로 언제 읽어도 시뮬레이션 결과가 같습니다.
+    """
+    def __init__(self, width, height, max_water_level=MAX_SOIL_WATER_LEVEL, initial_nutrient_level=INITIAL_SOIL_NUTRIENT_LEVEL,
+                 chunk_size=SOIL_CHUNK_SIZE):
+        self.width = width
+        self.height = height
+        self.max_water_level = max_water_level # 셀당 최대 토양 수분량 (실행 설정값)
+        shape = (height, width)
+        self.terrain = np.full(shape, SOIL_CODE, dtype=np.int8)
+        self.water_level = np.zeros(shape, dtype=np.float64)
+        self.set_temperature(0.0)
+        self.nutrient_level = np.full(shape, initial_nutrient_level, dtype=np.float64)
+        self.occupied = np.zeros(shape, dtype=bool)
+        self.plant_id = np.zeros(shape, dtype=np.int64) # 0이면 점유 식물 없음
+        self.version = 0 # update_environment마다 1씩 증가 (렌더링 캐시 무효화용)
+        self._init_chunk_state(chunk_size, 0.0)
+        self.refresh_terrain_masks() # free_soil: 식물을 새로 심을 수 있는 셀(비어 있는 SOIL) 비트맵, set_occupancy로 갱신
+
+    @classmethod
+    def from_arrays(cls, arrays, max_water_level, soil_water_total, version=0, soil_cell_index=None, water_cell_index=None,
+                    chunk_group=None, group_transform=None, chunk_size=SOIL_CHUNK_SIZE):
+        """이미 있는 배열(예: 체크포인트에서 메모리 매핑한 배열)로 SoilField를 만듭니다. 배열을 복사하지 않습니다.
+           soil_water_total은 배열에 담긴 SOIL 셀 수분 합계(soil_water_base_total)입니다.
+           chunk_group/group_transform(잠든 청크의 묶음과 묶음 변환)을 주지 않으면 모든 청크가 version 시점의 값이어야 합니다.
+        """
+        field = cls.__new__(cls)
+        field.height, field.width = arrays["terrain"].shape
+        field.max_water_level = max_water_level
+        for name in SOIL_FIELD_ARRAYS:
+            setattr(field, name, arrays[name])
+        field.current_temperature = float(field.temperature.item(0, 0)) if field.temperature.size else 0.0
+        field.version = version
+        field._init_chunk_state(chunk_size, soil_water_total)
+        if soil_cell_index is None or water_cell_index is None:
+            field.refresh_terrain_masks()
+        else:
+            field.soil_cell_index = soil_cell_index
+            field.water_cell_index = water_cell_index
+            field._build_chunks()
+        if chunk_group is not None:
+            field.chunk_group = np.array(chunk_group, dtype=np.int64)
+            field._group_transform = np.array(group_transform, dtype=np.float64).reshape(-1, 5)
+            field._group_members = np.bincount(field.chunk_group[field.chunk_group >= 0], minlength=len(field._group_transform))
+            field._sleeping_water_delta = None
+        return field
+
+    def _init_chunk_state(self, chunk_size, soil_water_total):
+        self.chunk_size = chunk_size
+        self.chunk_cols = -(-self.width // chunk_size)
+        self.chunk_rows = -(-self.height // chunk_size)
+        self.chunk_group = None # 청크별 잠든 묶음 번호 (-1이면 깨어 있음)
+        self._group_transform = np.zeros((0, 5)) # 묶음별 잠든 뒤 날씨의 합성 변환 [p, q, s, u, cap]
+        self._group_members = np.zeros(0, dtype=np.int64) # 묶음별 잠든 청크 수 (0이면 빈 묶음)
+        self._soil_water_base = soil_water_total # 배열에 담긴 SOIL 셀 수분 합계 (배열이 바뀔 때마다 변화량을 더해 유지)
+        self._sleeping_water_delta = 0.0 # 잠든 청크의 현재 수분 - 배열 값의 합 (None이면 다시 계산)
+
+    def refresh_terrain_masks(self):
+        """지형 배열이 바뀐 뒤 호출하여 SOIL/WATER 셀 인덱스 캐시와 청크 구성을 갱신합니다."""
+        if self.chunk_group is not None:
+            self.sync() # 지형이 바뀌기 전 셀 구성으로 잠든 청크부터 깨움
+        flat_terrain = self.terrain.reshape(-1)
+        self.soil_cell_index = np.flatnonzero(flat_terrain == SOIL_CODE)
+        self.water_cell_index = np.flatnonzero(flat_terrain == WATER_CODE)
+        self._build_chunks()
+
+    def _build_chunks(self):
+        """SOIL 셀을 청크 순서로 정렬한 인덱스(청크별 구간)와 청크별 식물 수를 만들고 free_soil을 다시 계산합니다."""
+        soil_ys, soil_xs = np.divmod(self.soil_cell_index, self.width)
+        soil_chunks = (soil_ys // self.chunk_size) * self.chunk_cols + soil_xs // self.chunk_size
+        chunk_count = self.chunk_rows * self.chunk_cols
+        self.soil_cells_by_chunk = self.soil_cell_index[np.argsort(soil_chunks, kind="stable")]
+        self.chunk_soil_start = np.zeros(chunk_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(soil_chunks, minlength=chunk_count), out=self.chunk_soil_start[1:])
+        self.chunk_has_soil = np.diff(self.chunk_soil_start) > 0
+        self.soil_chunk_count = int(np.count_nonzero(self.chunk_has_soil)) # SOIL 셀이 있는 청크 수
+        self.chunk_group = np.full(chunk_count, -1, dtype=np.int64)
+        self._group_transform = np.zeros((0, 5))
+        self._group_members = np.zeros(0, dtype=np.int64)
+        self._sleeping_water_delta = 0.0
+        self.refresh_free_soil()
+
+    def refresh_free_soil(self):
+        """점유 배열을 직접 바꾼 뒤 호출하여 free_soil 비트맵과 청크별 식물 수를 다시 계산합니다."""
+        self.free_soil = (self.terrain == SOIL_CODE) & ~self.occupied
+        occupied_ys, occupied_xs = np.nonzero(self.occupied)
+        self.chunk_plant_count = np.bincount((occupied_ys // self.chunk_size) * self.chunk_cols + occupied_xs // self.chunk_size,
+                                             minlength=self.chunk_rows * self.chunk_cols)
+
+    def set_occupancy(self, x, y, occupied, plant_id=0):
+        """(x, y) 셀의 점유 상태와 식물 ID를 설정하고 free_soil 비트맵과 청크별 식물 수를 함께 갱신합니다.
+           잠든 청크에 식물이 들어오면 다음 update_environment가 그 청크를 먼저 깨웁니다
+           (새 식물은 다음 cycle부터 토양을 읽고, 그 전에는 water_at으로 현재 값을 읽음).
+        """
+        if occupied != self.occupied.item(y, x):
+            self.chunk_plant_count[(y // self.chunk_size) * self.chunk_cols + x // self.chunk_size] += 1 if occupied else -1
+        self.occupied[y, x] = occupied
+        self.plant_id[y, x] = plant_id if occupied and plant_id else 0
+        self.free_soil[y, x] = not occupied and self.terrain.item(y, x) == SOIL_CODE
+
+    def set_temperature(self, temperature):
+        """모든 셀의 온도를 temperature로 맞춥니다. 셀마다 쓰지 않고 한 값을 공유하는 읽기 전용 배열로 바꿉니다."""
+        self.current_temperature = float(temperature)
+        self.temperature = np.broadcast_to(np.array(self.current_temperature), (self.height, self.width))
+
+    def set_cell_temperature(self, x, y, temperature):
+        """(x, y) 셀 하나의 온도를 바꿉니다 (다음 set_temperature까지 유지, 그동안만 셀별 배열을 씀)."""
+        if not self.temperature.flags.writeable:
+            self.temperature = self.temperature.copy()
+        self.temperature[y, x] = temperature
+
+    def _chunk_soil_cells(self, chunks):
+        """주어진 청크들의 SOIL 셀 평면 인덱스를 이어 붙여 반환합니다 (청크 수가 아니라 셀 수에 비례)."""
+        starts = self.chunk_soil_start[chunks]
+        lengths = self.chunk_soil_start[chunks + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        run_offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self.soil_cells_by_chunk[run_offsets + np.arange(total)]
+
+    def _daily_coefficients(self, daily_temp):
+        """하루 증발 변환 w -> retention * w / (1 + saturation * w)의 계수를 반환합니다.
+           기온에 비례하는 증발률(음수면 0)과 수분이 많을수록 커지는 증발을 함께 나타냅니다
+           (w * (1 - 증발률 - 0.01 * w / 최대 수분량)과 1차까지 같음).
+        """
+        retention = 1.0 - max(0.01 + (daily_temp / 30.0) * 0.02, 0.0)
+        return retention, 0.01 / self.max_water_level / retention
+
+    def _environment_step(self, soil_water, daily_temp, daily_rain_amount):
+        """SOIL 셀 수분 배열에 하루치 강수와 증발을 적용한 새 배열을 반환합니다 (SoilTile의 add_water -> evaporate_water와 같은 순서)."""
+        if daily_rain_amount > 0:
+            soil_water = np.minimum(soil_water + daily_rain_amount, self.max_water_level)
+        retention, saturation = self._daily_coefficients(daily_temp)
+        return retention * soil_water / (1.0 + saturation * soil_water)
+
+    def _compose_environment_step(self, daily_temp, daily_rain_amount):
+        """모든 잠든 묶음의 변환 뒤에 하루치 강수와 증발을 합성합니다 (묶음 수에 비례, 셀은 건드리지 않음)."""
+        transform = self._group_transform
+        p, q, s, u, cap = transform.T
+        if daily_rain_amount > 0: # w -> w + rain, 상한은 cap에만 적용 (단조 증가 변환이므로 min을 밖으로 뺄 수 있음)
+            p += daily_rain_amount * s
+            q += daily_rain_amount * u
+            np.minimum(cap + daily_rain_amount, self.max_water_level, out=cap)
+        retention, saturation = self._daily_coefficients(daily_temp)
+        s += saturation * p
+        u += saturation * q
+        p *= retention
+        q *= retention
+        cap[:] = retention * cap / (1.0 + saturation * cap)
+        transform[:, :4] /= u[:, None] # 같은 변환을 나타내도록 비율만 유지 (오래 잠들어도 넘치지 않게)
+
+    def _apply_groups(self, soil_water, groups):
+        """잠든 묶음 groups(셀별)의 변환을 수분 배열 soil_water에 적용한 현재 값을 반환합니다."""
+        p, q, s, u, cap = self._group_transform[groups].T
+        return np.minimum((p * soil_water + q) / (s * soil_water + u), cap)
+
+    def _sleeping_cells(self, chunks):
+        """잠든 청크들의 SOIL 셀 평면 인덱스와 셀별 묶음 번호를 반환합니다."""
+        lengths = self.chunk_soil_start[chunks + 1] - self.chunk_soil_start[chunks]
+        return self._chunk_soil_cells(chunks), np.repeat(self.chunk_group[chunks], lengths)
+
+    def update_environment(self, daily_temp, daily_rain_amount):
+        """모든 셀의 온도를 설정하고, SOIL 셀에 강수와 증발을 적용합니다.
+           식물이 있는 청크만 셀을 바로 계산하고, 식물이 없는 SOIL 청크는 잠든 묶음의 변환에 오늘 날씨를 합성합니다.
+        """
+        has_plants = self.chunk_plant_count > 0
+        self.catch_up(np.flatnonzero(has_plants & (self.chunk_group >= 0))) # 지난 cycle에 식물이 들어와 깨어난 청크
+        falling_asleep = np.flatnonzero(~has_plants & (self.chunk_group < 0) & self.chunk_has_soil)
+        if falling_asleep.size:
+            self._add_group(falling_asleep)
+        self.version += 1
+        self.set_temperature(daily_temp)
+
+        # 모든 SOIL 청크가 깨어 있으면(작은 맵 등) 청크별 인덱스를 모으지 않고 전체 SOIL 셀을 바로 갱신
+        active_chunks = np.flatnonzero(has_plants)
+        cells = self.soil_cell_index if len(active_chunks) == self.soil_chunk_count else self._chunk_soil_cells(active_chunks)
+        if cells.size:
+            flat_water = self.water_level.reshape(-1)
+            soil_water = flat_water[cells]
+            new_soil_water = self._environment_step(soil_water, daily_temp, daily_rain_amount)
+            flat_water[cells] = new_soil_water
+            self._soil_water_base += float(new_soil_water.sum() - soil_water.sum())
+        if len(self._group_transform):
+            self._compose_environment_step(daily_temp, daily_rain_amount)
+            self._sleeping_water_delta = None
+
+    def _add_group(self, chunks):
+        """chunks를 오늘 잠든 새 묶음(항등 변환)으로 재웁니다. 빈 묶음이 절반을 넘으면 먼저 정리합니다."""
+        empty = self._group_members == 0
+        if empty.sum() * 2 > len(empty):
+            kept = np.flatnonzero(~empty)
+            renumber = np.full(len(empty), -1, dtype=np.int64)
+            renumber[kept] = np.arange(len(kept))
+            sleeping = self.chunk_group >= 0
+            self.chunk_group[sleeping] = renumber[self.chunk_group[sleeping]]
+            self._group_transform = self._group_transform[kept]
+            self._group_members = self._group_members[kept]
+        self.chunk_group[chunks] = len(self._group_transform)
+        self._group_transform = np.vstack((self._group_transform, [[1.0, 0.0, 0.0, 1.0, self.max_water_level]]))
+        self._group_members = np.append(self._group_members, len(chunks))
+
+    def catch_up(self, chunks):
+        """잠든 청크들을 깨워 묶음 변환을 셀에 적용합니다 (셀당 한 번, 잠든 기간과 무관). 깨어 있는 청크는 건너뜁니다."""
+        chunks = chunks[self.chunk_group[chunks] >= 0]
+        if not chunks.size:
+            return
+        cells, groups = self._sleeping_cells(chunks)
+        if cells.size:
+            flat_water = self.water_level.reshape(-1)
+            soil_water = flat_water[cells]
+            new_soil_water = self._apply_groups(soil_water, groups)
+            flat_water[cells] = new_soil_water
+            self._soil_water_base += float(new_soil_water.sum() - soil_water.sum())
+        self._group_members -= np.bincount(self.chunk_group[chunks], minlength=len(self._group_members))
+        self.chunk_group[chunks] = -1
+        self._sleeping_water_delta = None
+
+    def sync(self):
+        """잠든 청크를 모두 깨워 water_level 배열 전체를 현재 값으로 맞춥니다 (지형을 바꾸기 전 등)."""
+        if self.chunk_group is not None:
+            self.catch_up(np.flatnonzero(self.chunk_group >= 0))
+
+    def sync_cell(self, x, y):
+        """(x, y) 셀이 있는 청크가 잠들어 있으면 깨웁니다 (셀에 값을 쓰기 전에 호출)."""
+        chunk = (y // self.chunk_size) * self.chunk_cols + x // self.chunk_size
+        if self.chunk_group.item(chunk) >= 0:
+            self.catch_up(np.array([chunk]))
+
+    def water_at(self, x, y):
+        """(x, y) 셀의 현재 수분을 반환합니다 (잠든 청크면 변환을 적용한 값, 배열은 바꾸지 않음)."""
+        water = self.water_level.item(y, x)
+        group = self.chunk_group.item((y // self.chunk_size) * self.chunk_cols + x // self.chunk_size)
+        if group < 0 or self.terrain.item(y, x) != SOIL_CODE:
+            return water
+        p, q, s, u, cap = self._group_transform[group].tolist()
+        return min((p * water + q) / (s * water + u), cap)
+
+    def water_level_in_rect(self, x0, y0, x1, y1):
+        """[x0, x1) x [y0, y1) 범위의 현재 수분 배열(복사본)을 반환합니다. 범위에 걸친 잠든 청크의 셀만 변환합니다."""
+        water = self.water_level[y0:y1, x0:x1].copy()
+        if water.size and len(self._group_transform):
+            chunk_ys = np.arange(y0, y0 + water.shape[0]) // self.chunk_size
+            chunk_xs = np.arange(x0, x0 + water.shape[1]) // self.chunk_size
+            groups = self.chunk_group[chunk_ys[:, None] * self.chunk_cols + chunk_xs[None, :]]
+            sleeping = (groups >= 0) & (self.terrain[y0:y1, x0:x1] == SOIL_CODE)
+            if sleeping.any():
+                water[sleeping] = self._apply_groups(water[sleeping], groups[sleeping])
+        return water
+
+    @property
+    def soil_water_total(self):
+        """SOIL 셀의 현재 수분 합계. 잠든 청크의 몫은 날씨가 바뀐 뒤 처음 읽을 때 한 번 변환해 합산합니다 (배열은 바꾸지 않음)."""
+        if self._sleeping_water_delta is None:
+            cells, groups = self._sleeping_cells(np.flatnonzero(self.chunk_group >= 0))
+            soil_water = self.water_level.reshape(-1)[cells]
+            self._sleeping_water_delta = float((self._apply_groups(soil_water, groups) - soil_water).sum())
+        return self._soil_water_base + self._sleeping_water_delta
+
+    @property
+    def soil_water_base_total(self):
+        """water_level 배열에 담긴 SOIL 셀 수분 합계 (체크포인트 저장용, 잠든 청크는 잠든 시점 값)."""
+        return self._soil_water_base
+
+    def sleep_state(self):
+        """잠든 청크 상태 (chunk_group, group_transform)를 반환합니다 (체크포인트 저장용)."""
+        return self.chunk_group, self._group_transform
+
+    def adjust_soil_water_total(self, delta):
+        """깨어 있는 셀 하나의 수분을 직접 바꿨을 때 합계에 변화량을 반영합니다."""
+        self._soil_water_base += delta
+
+    def recompute_soil_water_total(self):
+        """수분 배열을 직접 바꾼 뒤 호출하여 SOIL 셀 수분 합계를 배열에서 다시 계산합니다."""
+        self._soil_water_base = float(self.water_level.reshape(-1)[self.soil_cell_index].sum())
+        self._sleeping_water_delta = None
+
+    def tile(self, x, y):
+        """(x, y) 셀에 대한 SoilTile 뷰를 반환합니다."""
+        return SoilTile(self, x, y)
+
 
 class SoilTile:
-    def __init__(self, grid_x, grid_y, terrain_type=TerrainType.SOIL):
+    """SoilField의 한 셀을 가리키는 가벼운 뷰. 기존 SoilTile 객체와 같은 속성/메서드를 제공합니다."""
+    __slots__ = ("field", "grid_x", "grid_y")
+
+    def __init__(self, field, grid_x, grid_y):
+        self.field = field
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.terrain_type = terrain_type
-        self.water_level = 0.0  # 초기값은 ClimateManager에서 설정
-        self.temperature = 0.0 # 초기값은 ClimateManager에서 설정
-        self.nutrient_level = INITIAL_SOIL_NUTRIENT_LEVEL # MVP에서는 단순 고정값
-        self.is_occupied_by_plant = False
-        self.plant_id = None # 해당 타일을 점유한 식물의 ID (선택적)
+
+    @property
+    def terrain_type(self):
+        return TERRAIN_TYPES_BY_CODE[self.field.terrain.item(self.grid_y, self.grid_x)]
+
+    @terrain_type.setter
+    def terrain_type(self, terrain_type):
+        self.field.terrain[self.grid_y, self.grid_x] = TERRAIN_CODES[terrain_type]
+        self.field.refresh_terrain_masks()
+        self.field.recompute_soil_water_total()
+
+    @property
+    def water_level(self):
+        return self.field.water_at(self.grid_x, self.grid_y)
+
+    @water_level.setter
+    def water_level(self, value):
+        field = self.field
+        field.sync_cell(self.grid_x, self.grid_y) # 잠든 청크면 먼저 깨워 쓴 값에 묶음 변환이 다시 적용되지 않게 함
+        if field.terrain.item(self.grid_y, self.grid_x) == SOIL_CODE:
+            field.adjust_soil_water_total(value - field.water_level.item(self.grid_y, self.grid_x))
+        field.water_level[self.grid_y, self.grid_x] = value
+
+    @property
+    def temperature(self):
+        return self.field.temperature.item(self.grid_y, self.grid_x)
+
+    @property
+    def nutrient_level(self):
+        return self.field.nutrient_level.item(self.grid_y, self.grid_x)
+
+    @nutrient_level.setter
+    def nutrient_level(self, value):
+        self.field.nutrient_level[self.grid_y, self.grid_x] = value
+
+    @property
+    def is_occupied_by_plant(self):
+        return self.field.occupied.item(self.grid_y, self.grid_x)
+
+    @property
+    def plant_id(self):
+        plant_id = self.field.plant_id.item(self.grid_y, self.grid_x)
+        return plant_id if plant_id else None
 
     def update_temperature(self, new_temp):
         """토양 온도를 업데이트합니다."""
-        self.temperature = new_temp
+        self.field.set_cell_temperature(self.grid_x, self.grid_y, new_temp)
 
     def add_water(self, amount):
         """토양에 수분을 추가합니다."""
         if self.terrain_type == TerrainType.SOIL:
-            self.water_level = min(self.water_level + amount, MAX_SOIL_WATER_LEVEL)
+            self.water_level = min(self.water_level + amount, self.field.max_water_level)
 
     def evaporate_water(self, amount):
         """토양에서 수분을 증발시킵니다."""
@@ -30,8 +368,9 @@ class SoilTile:
     def consume_water(self, amount):
         """식물에 의해 수분이 소모됩니다."""
         if self.terrain_type == TerrainType.SOIL:
-            consumed = min(self.water_level, amount)
-            self.water_level -= consumed
+            water_level = self.water_level
+            consumed = min(water_level, amount)
+            self.water_level = water_level - consumed
             return consumed
         return 0.0
 
@@ -41,8 +380,7 @@ class SoilTile:
 
     def set_occupancy(self, occupied: bool, plant_id=None):
         """타일의 식물 점유 상태를 설정합니다."""
-        self.is_occupied_by_plant = occupied
-        self.plant_id = plant_id if occupied else None
+        self.field.set_occupancy(self.grid_x, self.grid_y, occupied, plant_id)
 
     def __repr__(self):
-        return f"SoilTile({self.grid_x},{self.grid_y}, {self.terrain_type.name}, W:{self.water_level:.1f}, T:{self.temperature:.1f})"
\ No newline at end of file
+        return f"SoilTile({self.grid_x},{self.grid_y}, {self.terrain_type.name}, W:{self.water_level:.1f}, T:{self.temperature:.1f})"
@@ -0,0 +1,146 @@
+# species_registry.py
+# 종 정의(plant_species.py의 사전)를 한 번 검증해 불변 레코드(Species)와 종 번호별 NumPy 파라미터 표로 컴파일합니다.
+# 식물은 매 cycle 사전을 문자열 키로 찾는 대신 레코드 속성을 읽고, 배열 엔진은 표에서 종 번호로 값을 모읍니다.
+import collections
+
+import numpy as np
+
+# (정의 사전의 키, 형식) - "range"는 (최소, 최대) 튜플이며 레코드와 표에서는 <키>_min, <키>_max 두 필드로 펼침
+SPECIES_SCHEMA = (
+    ("species_name", "name"),
+    ("optimal_growth_temperature", "range"),
+    ("min_survival_temperature", "float"),
+    ("max_survival_temperature", "float"),
+    ("optimal_soil_water_level", "range"),
+    ("min_survival_soil_water_level", "float"),
+    ("max_lifespan_cycles", "int"),
+    ("seed_viability_duration_cycles", "int"),
+    ("min_water_for_germination_soil", "float"),
+    ("min_temperature_for_germination", "float"),
+    ("max_water_capacity_factor_size", "float"),
+    ("max_energy_capacity_factor_size", "float"),
+    ("base_growth_rate_factor", "float"),
+    ("default_target_size_for_adult", "float"),
+    ("maturity_age_cycles", "int"),
+    ("energy_cost_per_seed_attempt", "float"),
+    ("max_seeds_produced_per_attempt", "int"),
+    ("reproduction_cooldown_cycles_default", "int"),
+    ("sapling_max_size", "float"),
+    ("adult_max_size", "float"),
+)
+
+def _record_fields():
+    fields = []
+    for key, kind in SPECIES_SCHEMA:
+        if kind == "range":
+            fields.append((f"{key}_min", np.float64))
+            fields.append((f"{key}_max", np.float64))
+        elif kind == "int":
+            fields.append((key, np.int64))
+        elif kind == "float":
+            fields.append((key, np.float64))
+        else:
+            fields.append((key, None)) # 이름은 표에 넣지 않음
+    return tuple(fields)
+
+# (레코드 필드 이름, 표의 dtype)
+SPECIES_FIELDS = _record_fields()
+# 종 특성 레코드 (튜플이므로 만든 뒤 바꿀 수 없고 인스턴스별 __dict__가 없음)
+Species = collections.namedtuple("Species", tuple(name for name, _dtype in SPECIES_FIELDS))
+# 종 번호별 파라미터 표의 dtype (숫자 필드만)
+SPECIES_TABLE_DTYPE = np.dtype([(name, dtype) for name, dtype in SPECIES_FIELDS if dtype is not None])
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def compile_species(species_data):
+    """종 정의 사전을 검증해 Species 레코드로 바꿉니다. 빠지거나 모르는 키는 KeyError, 잘못된 값은 ValueError입니다."""
+    missing = [key for key, _kind in SPECIES_SCHEMA if key not in species_data]
+    if missing:
+        raise KeyError(f"Species definition is missing: {', '.join(missing)}")
+    known = {key for key, _kind in SPECIES_SCHEMA}
+    unknown = [key for key in species_data if key not in known]
+    if unknown:
+        raise KeyError(f"Unknown species parameter: {', '.join(unknown)}")
+
+    values = []
+    for key, kind in SPECIES_SCHEMA:
+        value = species_data[key]
+        if kind == "name":
+            if not isinstance(value, str):
+                raise ValueError(f"{key} must be a string: {value!r}")
+            values.append(value)
+        elif kind == "range":
+            if not (isinstance(value, tuple) and len(value) == 2 and all(_is_number(v) for v in value)) or value[0] > value[1]:
+                raise ValueError(f"{key} must be a (min, max) tuple of numbers: {value!r}")
+            values.extend((float(value[0]), float(value[1])))
+        elif kind == "int":
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"{key} must be a non-negative integer: {value!r}")
+            values.append(value)
+        else:
+            if not _is_number(value):
+                raise ValueError(f"{key} must be a number: {value!r}")
+            values.append(float(value))
+    species = Species(*values)
+
+    if species.min_survival_temperature > species.max_survival_temperature:
+        raise ValueError(f"min_survival_temperature ({species.min_survival_temperature}) is above "
+                         f"max_survival_temperature ({species.max_survival_temperature})")
+    if species.max_seeds_produced_per_attempt < 1:
+        raise ValueError(f"max_seeds_produced_per_attempt must be at least 1: {species.max_seeds_produced_per_attempt}")
+    return species
+
+
+class SpeciesRegistry:
+    """종 정의를 종 번호에 대응시키고 컴파일한 레코드와 파라미터 표를 보관합니다.
+       같은 사전 객체는 한 번만 검증하며, 내용이 같은 정의는 같은 종 번호를 공유합니다.
+       정의 사전은 등록한 뒤에 바꾸지 않아야 합니다 (SimulationConfig의 덮어쓰기는 사용 전에 적용됨).
+    """
+    def __init__(self, definitions=()):
+        self.species = [] # 종 번호 순서의 Species 레코드
+        self.definitions = [] # 종 번호 순서의 원본 정의 사전 (체크포인트 저장용)
+        self._ids_by_object = {} # id(정의 사전) -> (정의 사전, 종 번호) - 사전을 붙잡아 두어 id가 재사용되지 않음
+        self._ids_by_record = {} # Species -> 종 번호
+        self._table = None
+        for species_data in definitions:
+            self.species_id(species_data)
+
+    def __len__(self):
+        return len(self.species)
+
+    def species_id(self, species_data):
+        """정의 사전의 종 번호를 반환합니다 (처음 보는 정의면 검증해 등록)."""
+        entry = self._ids_by_object.get(id(species_data))
+        if entry is not None:
+            return entry[1]
+        species = compile_species(species_data)
+        species_id = self._ids_by_record.get(species)
+        if species_id is None:
+            species_id = len(self.species)
+            self.species.append(species)
+            self.definitions.append(species_data)
+            self._ids_by_record[species] = species_id
+            self._table = None
+        self._ids_by_object[id(species_data)] = (species_data, species_id)
+        return species_id
+
+    def get(self, species_data):
+        """정의 사전의 Species 레코드를 반환합니다."""
+        return self.species[self.species_id(species_data)]
+
+    @property
+    def table(self):
+        """종 번호로 인덱싱하는 파라미터 표 (구조체 배열, 예: table["base_growth_rate_factor"][species])."""
+        if self._table is None:
+            table = np.zeros(len(self.species), dtype=SPECIES_TABLE_DTYPE)
+            for name in SPECIES_TABLE_DTYPE.names:
+                table[name] = [getattr(species, name) for species in self.species]
+            table.flags.writeable = False
+            self._table = table
+        return self._table
+
+
+# sprite 엔진의 Plant가 공유하는 레지스트리 (배열 엔진은 개체군마다 자체 레지스트리로 종 번호를 매김)
+SPECIES_REGISTRY = SpeciesRegistry()
@@ -0,0 +1,67 @@
+# stats.py
+from plant import PlantState, DeathCause
+
+class SimulationStats:
+    """식물 개체군과 토양 통계를 사건(탄생, 상태 변화, 성장, 제거)마다 증분 갱신하고 O(1)로 제공합니다.
+       정보 패널과 헤드리스 보고는 식물 그룹이나 맵 전체를 다시 세지 않고 이 값을 읽습니다.
+    """
+    def __init__(self, soil_field):
+        self.soil_field = soil_field # 토양 수분 합계는 SoilField가 유지
+        self.plant_counts = {state: 0 for state in PlantState}
+        self.total_plants = 0
+        self.biomass = 0.0 # 살아 있는(DEAD 제외) 식물 크기의 합
+        self.births = 0 # 시작 이후 누적 탄생 수 (초기 배치 포함)
+        self.deaths_by_cause = {cause: 0 for cause in DeathCause} # 시작 이후 누적 사망 수
+
+    def on_birth(self, state, size):
+        """새 식물이 맵에 추가되었을 때 호출합니다."""
+        self.plant_counts[state] += 1
+        self.total_plants += 1
+        self.births += 1
+        if state != PlantState.DEAD:
+            self.biomass += size
+
+    def on_death(self, cause, count=1):
+        """식물이 죽었을 때 원인(DeathCause)별 누적 사망 수를 늘립니다. (상태 변화는 on_state_change로 따로 알림)"""
+        self.deaths_by_cause[cause] += count
+
+    def on_state_change(self, old_state, new_state, size):
+        """식물 상태가 바뀌었을 때 호출합니다. 죽으면 그 크기만큼 생체량에서 뺍니다."""
+        if old_state == new_state:
+            return
+        self.plant_counts[old_state] -= 1
+        self.plant_counts[new_state] += 1
+        if new_state == PlantState.DEAD:
+            self.biomass = max(0.0, self.biomass - size)
+
+    def on_growth(self, size_delta):
+        """살아 있는 식물의 크기가 변했을 때 호출합니다."""
+        self.biomass = max(0.0, self.biomass + size_delta)
+
+    def on_removal(self, state, size):
+        """식물이 맵에서 제거되었을 때 호출합니다."""
+        self.plant_counts[state] -= 1
+        self.total_plants -= 1
+        if state != PlantState.DEAD:
+            self.biomass = max(0.0, self.biomass - size) # 증분 합의 반올림 오차로 음수가 되지 않도록
+
+    def sync_population(self, plant_counts, biomass):
+        """배열 기반 개체군 엔진이 cycle마다 집계한 값으로 덮어씁니다."""
+        self.plant_counts = dict(plant_counts)
+        self.total_plants = sum(plant_counts.values())
+        self.biomass = biomass
+
+    def recount(self, plants):
+        """Plant 목록에서 상태별 개체 수와 생체량을 다시 집계해 덮어씁니다 (증분 값의 누적 오차를 주기적으로 없앰)."""
+        plant_counts = {state: 0 for state in PlantState}
+        biomass = 0.0
+        for plant in plants:
+            plant_counts[plant.current_state] += 1
+            if plant.current_state != PlantState.DEAD:
+                biomass += plant.current_size
+        self.sync_population(plant_counts, biomass)
+
+    def average_soil_water_level(self):
+        """모든 SOIL 타일의 평균 수분량을 반환합니다."""
+        soil_tile_count = self.soil_field.soil_cell_index.size
+        return self.soil_field.soil_water_total / soil_tile_count if soil_tile_count > 0 else 0
@@ -0,0 +1,169 @@
+# telemetry.py
+# cycle마다의 지표를 열(column)별 append-only 바이너리 파일로 기록하는 텔레메트리 기록기
+#
+# 텔레메트리 디렉터리 구성
+#   schema.json      형식 버전, 열 이름/dtype 목록, 계절 코드표
+#   <열 이름>.bin     해당 열 값들을 기록 순서대로 이어 붙인 원시 배열 (리틀 엔디언)
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+from config import TELEMETRY_BATCH_SIZE
+from plant import PlantState, DeathCause
+
+TELEMETRY_FORMAT_VERSION = 1
+SEASON_CODES = ("SPRING", "SUMMER", "AUTUMN", "WINTER") # season 열 값 = TimeManager.current_season_index
+
+# (열 이름, dtype) - 한 cycle이 한 행
+TELEMETRY_COLUMNS = (
+    ("cycle", "<i8"),
+    ("year", "<i4"),
+    ("season", "<i1"),
+    ("day", "<i4"),
+    ("temperature", "<f8"),
+    ("rain", "<f8"),
+    *((f"count_{state.value.lower()}", "<i8") for state in PlantState),
+    ("total_plants", "<i8"),
+    ("biomass", "<f8"),
+    ("avg_soil_water", "<f8"),
+    ("births", "<i8"), # 이번 cycle에 새로 생긴 식물 수
+    *((f"deaths_{cause.value.lower()}", "<i8") for cause in DeathCause), # 이번 cycle의 원인별 사망 수
+)
+
+class TelemetryWriter:
+    """cycle마다 record()로 한 행을 미리 할당한 버퍼 배열에 채우고, 버퍼가 차면 배경 스레드가 열별 파일에 이어 씁니다.
+       버퍼는 두 개를 번갈아 쓰므로 시뮬레이션 스레드는 디스크 쓰기를 기다리지 않습니다
+       (배경 스레드가 밀리면 빈 버퍼가 생길 때까지만 기다림).
+    """
+    def __init__(self, path, stats=None, batch_size=TELEMETRY_BATCH_SIZE, buffer_count=2):
+        """stats(SimulationStats)를 주면 그 시점의 누적 탄생/사망 수를 기준으로 첫 행의 증가분을 계산합니다."""
+        self.path = path
+        self.batch_size = batch_size
+        os.makedirs(path, exist_ok=True)
+        schema_path = os.path.join(path, "schema.json")
+        schema = {"format_version": TELEMETRY_FORMAT_VERSION, "columns": [list(column) for column in TELEMETRY_COLUMNS],
+                  "season_codes": list(SEASON_CODES)}
+        if os.path.exists(schema_path): # 이어 쓰기: 기존 파일과 열 구성이 같아야 함
+            with open(schema_path, encoding="utf-8") as f:
+                if json.load(f) != schema:
+                    raise ValueError(f"Telemetry schema mismatch in {path}")
+        else:
+            with open(schema_path, "w", encoding="utf-8") as f:
+                json.dump(schema, f, indent=1)
+
+        self._free_buffers = queue.Queue()
+        for _ in range(buffer_count):
+            self._free_buffers.put({name: np.zeros(batch_size, dtype=dtype) for name, dtype in TELEMETRY_COLUMNS})
+        self._pending = queue.Queue()
+        self._buffer = self._free_buffers.get()
+        self._rows = 0
+        self._last_births = stats.births if stats else None
+        self._last_deaths = dict(stats.deaths_by_cause) if stats else None
+        self._error = None
+        self._thread = threading.Thread(target=self._flush_loop, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, time_manager, climate_manager, stats):
+        """현재 cycle의 지표를 한 행으로 기록합니다. perform_simulation_cycle 직후에 호출합니다."""
+        if self._last_births is None: # 첫 기록: 이전 cycle까지의 누적값을 기준으로 삼음
+            self._last_births = stats.births
+            self._last_deaths = dict(stats.deaths_by_cause)
+        buffer, row = self._buffer, self._rows
+        buffer["cycle"][row] = time_manager.total_cycles_elapsed
+        buffer["year"][row] = time_manager.current_year
+        buffer["season"][row] = time_manager.current_season_index
+        buffer["day"][row] = time_manager.current_day_in_season
+        buffer["temperature"][row] = climate_manager.current_daily_temperature
+        buffer["rain"][row] = climate_manager.current_daily_rain
+        for state, count in stats.plant_counts.items():
+            buffer[f"count_{state.value.lower()}"][row] = count
+        buffer["total_plants"][row] = stats.total_plants
+        buffer["biomass"][row] = stats.biomass
+        buffer["avg_soil_water"][row] = stats.average_soil_water_level()
+        buffer["births"][row] = stats.births - self._last_births
+        self._last_births = stats.births
+        for cause, count in stats.deaths_by_cause.items():
+            buffer[f"deaths_{cause.value.lower()}"][row] = count - self._last_deaths[cause]
+            self._last_deaths[cause] = count
+
+        self._rows += 1
+        if self._rows == self.batch_size:
+            self._submit()
+
+    def _submit(self):
+        if self._error:
+            raise self._error
+        if self._rows:
+            self._pending.put((self._buffer, self._rows))
+            self._buffer = self._free_buffers.get()
+            self._rows = 0
+
+    def _flush_loop(self):
+        """배경 스레드: 넘겨받은 버퍼를 열별 파일에 이어 쓰고 버퍼를 돌려줍니다.
+           예외가 나면 저장해 두고(flush/close에서 다시 발생), 이후 넘어오는 버퍼는 쓰지 않고 돌려주기만 하여
+           record()가 빈 버퍼를 기다리다 멈추지 않게 합니다.
+        """
+        files = {}
+        try:
+            for name, _dtype in TELEMETRY_COLUMNS:
+                files[name] = open(os.path.join(self.path, f"{name}.bin"), "ab")
+            while True:
+                item = self._pending.get()
+                if item is None:
+                    return
+                buffer, rows = item
+                try:
+                    for name, _dtype in TELEMETRY_COLUMNS:
+                        files[name].write(buffer[name][:rows].tobytes())
+                    for f in files.values():
+                        f.flush()
+                finally:
+                    self._free_buffers.put(buffer)
+        except BaseException as e:
+            self._error = e
+        finally:
+            for f in files.values():
+                f.close()
+        while True: # 오류 뒤: close()가 보낸 종료 표시까지 버퍼만 돌려줌
+            item = self._pending.get()
+            if item is None:
+                return
+            self._free_buffers.put(item[0])
+
+    def flush(self):
+        """아직 버퍼에 남은 행을 배경 스레드로 넘깁니다. 배경 스레드에서 예외가 났으면 다시 발생시킵니다."""
+        self._submit()
+
+    def close(self):
+        """남은 행을 모두 쓰고 배경 스레드를 종료합니다. 배경 스레드에서 예외가 났으면 다시 발생시킵니다."""
+        try:
+            self._submit()
+        finally:
+            self._pending.put(None)
+            self._thread.join()
+        if self._error:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_telemetry(path, mmap=True):
+    """텔레메트리 디렉터리를 {열 이름: 배열}로 읽습니다. 중간에 끊긴 기록이 있으면 모든 열이 가진 행까지만 반환합니다."""
+    with open(os.path.join(path, "schema.json"), encoding="utf-8") as f:
+        schema = json.load(f)
+    columns = {}
+    for name, dtype in schema["columns"]:
+        column_path = os.path.join(path, f"{name}.bin")
+        if mmap and os.path.getsize(column_path) > 0:
+            columns[name] = np.memmap(column_path, dtype=dtype, mode="r")
+        else:
+            columns[name] = np.fromfile(column_path, dtype=dtype)
+    rows = min(len(values) for values in columns.values())
+    return {name: values[:rows] for name, values in columns.items()}
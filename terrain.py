@@ -4,4 +4,11 @@ import enum
 class TerrainType(enum.Enum):
     SOIL = "SOIL"
     WATER = "WATER"
-    ROCK = "ROCK"
\ No newline at end of file
+    ROCK = "ROCK"
+
+# SoilField 배열에 저장되는 지형 코드 (int8)
+TERRAIN_TYPES_BY_CODE = (TerrainType.SOIL, TerrainType.WATER, TerrainType.ROCK)
+TERRAIN_CODES = {terrain_type: code for code, terrain_type in enumerate(TERRAIN_TYPES_BY_CODE)}
+SOIL_CODE = TERRAIN_CODES[TerrainType.SOIL]
+WATER_CODE = TERRAIN_CODES[TerrainType.WATER]
+ROCK_CODE = TERRAIN_CODES[TerrainType.ROCK]
@@ -0,0 +1,112 @@
+# terrain_generation.py
+# 맵 전체의 노이즈 값을 NumPy 배열 단위로 만들어 지형 코드 배열로 바꾸고, 큰 맵의 결과를 디스크에 캐시하는 지형 생성기
+import hashlib
+import os
+
+import numpy as np
+try:
+    import noise # Perlin noise
+except ImportError:
+    print("Warning: 'noise' library not found. Using NumPy Perlin noise for terrain generation.")
+    noise = None
+
+from terrain import SOIL_CODE, WATER_CODE, ROCK_CODE
+
+TERRAIN_CACHE_FORMAT_VERSION = 1
+NOISE_PERSISTENCE = 0.5
+NOISE_LACUNARITY = 2.0
+NOISE_ROWS_PER_BLOCK = 256 # 큰 맵에서 임시 배열 메모리를 제한하기 위해 이 행 수만큼씩 계산
+# NumPy Perlin 격자 기울기 (Ken Perlin improved noise의 12방향 기울기를 2D로 투영한 16개, noise.pnoise2와 같은 구성)
+_GRADIENTS = np.array([(1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (1, 0), (-1, 0),
+                       (0, 1), (0, -1), (0, 1), (0, -1), (1, 1), (0, -1), (-1, 1), (0, -1)], dtype=np.float64)
+
+def noise_backend():
+    """현재 사용하는 노이즈 구현 이름을 반환합니다 (구현마다 같은 시드에서도 지형이 다름)."""
+    return "noise" if noise else "numpy"
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+def _perlin_numpy(xs, ys, permutation):
+    """좌표 배열의 2D Perlin 노이즈 값을 계산합니다 (permutation: 0~255 순열을 두 번 이어 붙인 512개 배열)."""
+    x0 = np.floor(xs)
+    y0 = np.floor(ys)
+    xf = xs - x0
+    yf = ys - y0
+    xi = x0.astype(np.int64) & 255
+    yi = y0.astype(np.int64) & 255
+    u = _fade(xf)
+    v = _fade(yf)
+
+    def gradient_dot(hash_values, dx, dy):
+        gradient = _GRADIENTS[hash_values & 15]
+        return gradient[..., 0] * dx + gradient[..., 1] * dy
+
+    a = permutation[xi]
+    b = permutation[xi + 1]
+    bottom = gradient_dot(permutation[a + yi], xf, yf) * (1 - u) + gradient_dot(permutation[b + yi], xf - 1, yf) * u
+    top = gradient_dot(permutation[a + yi + 1], xf, yf - 1) * (1 - u) + gradient_dot(permutation[b + yi + 1], xf - 1, yf - 1) * u
+    return bottom * (1 - v) + top * v
+
+def noise_field(width, height, scale, octaves, seed):
+    """(height, width) 크기의 프랙탈 Perlin 노이즈 배열을 반환합니다. 맵 전체가 하나의 시드를 공유하므로 이웃 셀끼리 값이 이어집니다."""
+    rng = np.random.default_rng(seed)
+    offset_x, offset_y = rng.uniform(0, 256, size=2) # 시드마다 노이즈 평면의 다른 위치를 사용
+    base = int(rng.integers(0, 101)) # noise.pnoise2의 base (기존 지형 생성과 같은 범위)
+    permutation = np.tile(rng.permutation(256), 2)
+    values = np.empty((height, width), dtype=np.float64)
+    xs = np.arange(width) * scale + offset_x
+    if noise:
+        pnoise2 = np.frompyfunc(lambda x, y: noise.pnoise2(x, y, octaves=octaves, persistence=NOISE_PERSISTENCE,
+                                                            lacunarity=NOISE_LACUNARITY, base=base), 2, 1)
+    for row_start in range(0, height, NOISE_ROWS_PER_BLOCK):
+        row_stop = min(height, row_start + NOISE_ROWS_PER_BLOCK)
+        ys = (np.arange(row_start, row_stop) * scale + offset_y)[:, None]
+        if noise:
+            values[row_start:row_stop] = pnoise2(xs[None, :], ys)
+            continue
+        total = np.zeros((row_stop - row_start, width))
+        frequency, amplitude, amplitude_sum = 1.0, 1.0, 0.0
+        for _ in range(octaves):
+            total += _perlin_numpy(xs[None, :] * frequency, ys * frequency, permutation) * amplitude
+            amplitude_sum += amplitude
+            frequency *= NOISE_LACUNARITY
+            amplitude *= NOISE_PERSISTENCE
+        values[row_start:row_stop] = total / amplitude_sum
+    return values
+
+def classify_terrain(values, water_threshold, rock_threshold):
+    """노이즈 배열을 0~1로 정규화한 뒤 임계값에 따라 지형 코드(int8) 배열로 바꿉니다."""
+    normalized = np.clip((values + 0.7) / 1.4, 0, 1)
+    terrain = np.full(values.shape, SOIL_CODE, dtype=np.int8)
+    terrain[normalized < water_threshold] = WATER_CODE
+    terrain[normalized >= rock_threshold] = ROCK_CODE
+    return terrain
+
+def terrain_cache_path(cache_dir, width, height, seed, sim_config):
+    """지형을 결정하는 값(구현, 시드, 크기, 축척, 옥타브, 임계값)으로 캐시 파일 경로를 만듭니다."""
+    key = repr((TERRAIN_CACHE_FORMAT_VERSION, noise_backend(), seed, width, height,
+                sim_config.TERRAIN_NOISE_SCALE, sim_config.TERRAIN_NOISE_OCTAVES,
+                sim_config.TERRAIN_WATER_THRESHOLD, sim_config.TERRAIN_ROCK_THRESHOLD))
+    return os.path.join(cache_dir, f"terrain_{hashlib.sha1(key.encode()).hexdigest()}.npy")
+
+def generate_terrain(width, height, seed, sim_config, cache_dir=None, cache_min_cells=0):
+    """지형 코드 배열을 생성합니다. cache_dir이 있고 맵이 cache_min_cells 이상이면 디스크 캐시를 먼저 찾고,
+       없으면 생성한 결과를 저장합니다.
+    """
+    cache_path = None
+    if cache_dir and width * height >= cache_min_cells:
+        cache_path = terrain_cache_path(cache_dir, width, height, seed, sim_config)
+        if os.path.exists(cache_path):
+            terrain = np.load(cache_path)
+            if terrain.shape == (height, width):
+                return terrain
+
+    values = noise_field(width, height, sim_config.TERRAIN_NOISE_SCALE, sim_config.TERRAIN_NOISE_OCTAVES, seed)
+    terrain = classify_terrain(values, sim_config.TERRAIN_WATER_THRESHOLD, sim_config.TERRAIN_ROCK_THRESHOLD)
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp.npy" # 여러 프로세스가 동시에 만들어도 완성된 파일만 보이도록
+        np.save(tmp_path, terrain)
+        os.replace(tmp_path, cache_path)
+    return terrain
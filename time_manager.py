@@ -1,6 +1,6 @@
 # time_manager.py
 import enum
-from config import CYCLES_PER_DAY, DAYS_PER_SEASON, YEAR_LENGTH_DAYS
+from simulation_config import DEFAULT_SIMULATION_CONFIG
 
 class Season(enum.Enum):
     SPRING = "SPRING"
@@ -9,7 +9,8 @@ class Season(enum.Enum):
     WINTER = "WINTER"
 
 class TimeManager:
-    def __init__(self):
+    def __init__(self, sim_config=None):
+        self.config = sim_config if sim_config else DEFAULT_SIMULATION_CONFIG
         self.current_cycle_in_day = 1 # MVP에서는 1일 1사이클
         self.current_day_in_season = 1
         self.current_season_index = 0
@@ -23,7 +24,7 @@ class TimeManager:
         self.total_cycles_elapsed += 1
         self.current_day_in_season += 1
 
-        if self.current_day_in_season > DAYS_PER_SEASON:
+        if self.current_day_in_season > self.config.DAYS_PER_SEASON:
             self.current_day_in_season = 1
             self.current_season_index = (self.current_season_index + 1) % len(self.seasons_order)
             self.current_season = self.seasons_order[self.current_season_index]
@@ -38,4 +39,4 @@ class TimeManager:
 
     def get_total_days_elapsed(self):
         """시뮬레이션 시작 후 총 경과 일수를 반환합니다."""
-        return self.total_cycles_elapsed // CYCLES_PER_DAY
\ No newline at end of file
+        return self.total_cycles_elapsed // self.config.CYCLES_PER_DAY
\ No newline at end of file
@@ -0,0 +1,78 @@
+# tracelog.py
+# 구조화된 추적 로그: DEBUG_MODE로 감싼 print 대신 사건을 고정 크기 원형 버퍼에 모으고 필요할 때 파일로 저장합니다.
+# 꺼져 있을 때 호출 지점의 비용은 `if TRACE.enabled:` 검사 하나이고, 메시지 문자열은 저장(dump)할 때만 만듭니다.
+import collections
+
+import numpy as np
+
+from config import TRACE_BUFFER_SIZE
+
+class TraceLog:
+    """사건을 (cycle, 사건 종류, plant_id, x, y, 형식 문자열, 인자) 튜플로 최근 capacity개까지 보관합니다.
+       필터(configure)를 주면 일치하는 사건만 보관합니다.
+       - plant_ids: 이 식물들의 사건만 (식물과 무관한 사건은 항상 통과)
+       - region: (x0, y0, x1, y1) 범위(x1, y1 제외) 안의 식물 사건만
+       - events: 사건 종류 이름 또는 분류("plant.grow"의 "plant")의 집합
+       모든 모듈이 같은 TRACE 객체를 공유하므로 실행 중에 켜고 끈 것이 바로 반영됩니다.
+    """
+    def __init__(self, capacity=TRACE_BUFFER_SIZE):
+        self.enabled = False
+        self.cycle = 0 # 사건에 기록할 현재 cycle (perform_simulation_cycle이 갱신)
+        self.records = collections.deque(maxlen=capacity)
+        self.plant_ids = None
+        self.region = None
+        self.events = None
+
+    def configure(self, plant_ids=None, region=None, events=None):
+        """필터를 바꿉니다. None인 항목은 거르지 않습니다."""
+        self.plant_ids = frozenset(plant_ids) if plant_ids is not None else None
+        self.region = tuple(region) if region is not None else None
+        self.events = frozenset(events) if events is not None else None
+
+    def watches(self, plant_id, x, y):
+        """이 식물의 사건을 기록할지(식물/영역 필터 통과 여부) 반환합니다. 식물마다 cycle당 한 번 확인하는 용도입니다."""
+        if self.plant_ids is not None and plant_id not in self.plant_ids:
+            return False
+        if self.region is not None:
+            x0, y0, x1, y1 = self.region
+            return x0 <= x < x1 and y0 <= y < y1
+        return True
+
+    def watched_rows(self, plant_ids, xs, ys):
+        """plant_ids, xs, ys 배열 중 식물/영역 필터를 통과하는 위치(인덱스) 배열을 반환합니다."""
+        mask = np.ones(len(plant_ids), dtype=bool)
+        if self.plant_ids is not None:
+            mask &= np.isin(plant_ids, np.fromiter(self.plant_ids, dtype=np.int64, count=len(self.plant_ids)))
+        if self.region is not None:
+            x0, y0, x1, y1 = self.region
+            mask &= (x0 <= xs) & (xs < x1) & (y0 <= ys) & (ys < y1)
+        return np.flatnonzero(mask)
+
+    def emit(self, event, message, *args, plant_id=None, x=None, y=None):
+        """사건 하나를 보관합니다. message는 str.format 형식 문자열이며 args와 함께 저장했다가 dump할 때 채웁니다.
+           식물 사건은 호출 전에 watches()로 걸러야 합니다 (여기서는 사건 종류만 거름).
+        """
+        if self.events is not None and event not in self.events and event.partition(".")[0] not in self.events:
+            return
+        self.records.append((self.cycle, event, plant_id, x, y, message, args))
+
+    def lines(self):
+        """보관 중인 사건을 오래된 순서로 한 줄씩 문자열로 만들어 돌려줍니다."""
+        for cycle, event, plant_id, x, y, message, args in self.records:
+            subject = f" plant={plant_id} ({x},{y})" if plant_id is not None else ""
+            yield f"[{cycle:>7}] {event:<22}{subject} {message.format(*args)}"
+
+    def dump(self, path):
+        """보관 중인 사건을 path에 텍스트로 저장하고 저장한 사건 수를 반환합니다."""
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.lines():
+                f.write(line + "\n")
+                count += 1
+        return count
+
+    def clear(self):
+        self.records.clear()
+
+
+TRACE = TraceLog()
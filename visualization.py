@@ -1,44 +1,192 @@
 # visualization.py
+import collections
+import math
 import pygame
+import numpy as np
 from config import (SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, INFO_PANEL_HEIGHT, GAME_AREA_HEIGHT,
-                    TERRAIN_COLORS, SOIL_COLOR_STEPS, MAX_SOIL_WATER_LEVEL, MAP_HEIGHT, MAP_WIDTH,
-                    INFO_FONT_SIZE, INFO_FONT_COLOR, INFO_LINE_SPACING,
+                    TERRAIN_COLORS, SOIL_COLOR_STEPS, MAP_HEIGHT, MAP_WIDTH,
+                    INFO_FONT_SIZE, DEBUG_FONT_SIZE, INFO_FONT_COLOR, INFO_LINE_SPACING, TEXT_CACHE_SIZE,
                     GAUGE_BAR_WIDTH, GAUGE_BAR_HEIGHT, GAUGE_TEXT_OFFSET, # 게이지바 설정 임포트
                     DEBUG_INFO_START_X, DEBUG_INFO_START_Y, DEBUG_INFO_LINE_SPACING, # 디버그 정보 위치
-                    DEBUG_INFO_CATEGORY_SPACING, GAUGE_BAR_COLORS, DEBUG_MODE) # DEBUG_MODE 임포트
-from terrain import TerrainType
-from plant import PlantState
+                    DEBUG_INFO_CATEGORY_SPACING, GAUGE_BAR_COLORS,
+                    PROFILER_OVERLAY_POSITION, PROFILER_OVERLAY_BACKGROUND,
+                    CAMERA_DENSITY_COLOR, CAMERA_DENSITY_BLEND)
+from terrain import WATER_CODE, ROCK_CODE, SOIL_CODE
+from plant import PlantState, get_plant_image
 
-pygame.font.init()
-INFO_FONT = pygame.font.SysFont("arial", INFO_FONT_SIZE)
-DEBUG_FONT = pygame.font.SysFont("arial", INFO_FONT_SIZE - 2) # 디버그용 약간 작은 폰트
+# 폰트는 처음 그릴 때 만듦 (SysFont는 시스템 폰트 목록을 훑으므로 import 시점에 만들지 않음)
+_fonts = {}
+
+def get_font(size):
+    """size 크기의 폰트를 반환합니다 (처음 요청할 때 만들고 이후에는 재사용)."""
+    font = _fonts.get(size)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = _fonts[size] = pygame.font.SysFont("arial", size)
+    return font
+
+class TextCache:
+    """렌더링한 글자 Surface를 (폰트, 글자, 색)으로 보관하는 크기 제한 LRU 캐시.
+       가득 차면 가장 오래 쓰지 않은 Surface부터 버립니다.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._surfaces = collections.OrderedDict()
+
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = self._surfaces[key] = font.render(text, True, color)
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+TEXT_CACHE = TextCache(TEXT_CACHE_SIZE)
+
+# 정보 패널/식물 정보처럼 여러 글자를 합성한 Surface: 이름 -> (그린 입력 값, Surface)
+_composites = {}
+
+def _get_composite(name, inputs, compose):
+    """inputs가 지난번과 같으면 합성해 둔 Surface를 그대로, 다르면 compose()로 새로 합성한 Surface를 반환합니다."""
+    cached = _composites.get(name)
+    if cached is None or cached[0] != inputs:
+        cached = _composites[name] = (inputs, compose())
+    return cached[1]
+
+# 지형 팔레트: 0=WATER, 1=ROCK, 2~6=SOIL 수분 단계 (건조 -> 축축)
+TERRAIN_PALETTE = np.array([TERRAIN_COLORS["WATER"], TERRAIN_COLORS["ROCK"],
+                            TERRAIN_COLORS["SOIL_DRY"], TERRAIN_COLORS["SOIL_MOIST_1"], TERRAIN_COLORS["SOIL_MOIST_2"],
+                            TERRAIN_COLORS["SOIL_MOIST_3"], TERRAIN_COLORS["SOIL_WET"]], dtype=np.uint8)
+PALETTE_WATER, PALETTE_ROCK, PALETTE_SOIL_START = 0, 1, 2
+SOIL_MOISTURE_BUCKET_EDGES = np.array([0.1, 0.3, 0.6, 0.85]) # 수분 비율 경계 (SOIL_DRY < 0.1 <= SOIL_MOIST_1 < 0.3 ...)
+TERRAIN_LAYER_FULL_REDRAW_RATIO = 0.25 # 바뀐 셀 비율이 이보다 크면 셀 단위 대신 전체를 다시 그림
+
+def compute_terrain_buckets(soil_field):
+    """각 셀의 팔레트 인덱스(지형 + 토양 수분 단계)를 (height, width) 배열로 계산합니다."""
+    water_level = soil_field.water_level_in_rect(0, 0, soil_field.width, soil_field.height) # 잠든 청크도 현재 수분으로
+    water_ratio = water_level / soil_field.max_water_level if soil_field.max_water_level > 0 else np.zeros_like(water_level)
+    buckets = np.digitize(water_ratio, SOIL_MOISTURE_BUCKET_EDGES).astype(np.uint8) + PALETTE_SOIL_START
+    buckets[soil_field.terrain == WATER_CODE] = PALETTE_WATER
+    buckets[soil_field.terrain == ROCK_CODE] = PALETTE_ROCK
+    return buckets
+
+def aggregate_view(soil_field, x0, y0, x1, y1, block):
+    """[x0, x1) x [y0, y1) 범위를 block x block 셀 묶음으로 줄여 (팔레트 인덱스, 식물 밀도) 배열을 반환합니다.
+       묶음의 지형은 가장 많은 지형이고, 토양이면 토양 셀의 평균 수분 비율로 단계를 정합니다.
+       식물 밀도는 묶음에서 식물이 있는 셀의 비율입니다. block이 1이면 셀별 값 그대로입니다.
+       수분은 범위에 걸친 잠든 청크만 현재 값으로 계산해 읽습니다 (맵 전체를 따라잡지 않음).
+    """
+    terrain = soil_field.terrain[y0:y1, x0:x1]
+    water_level = soil_field.water_level_in_rect(x0, y0, x1, y1)
+    occupied = soil_field.occupied[y0:y1, x0:x1]
+    max_water_level = soil_field.max_water_level
+    if block == 1 or terrain.size == 0:
+        water_ratio = water_level / max_water_level if max_water_level > 0 else np.zeros_like(water_level)
+        buckets = np.digitize(water_ratio, SOIL_MOISTURE_BUCKET_EDGES).astype(np.uint8) + PALETTE_SOIL_START
+        buckets[terrain == WATER_CODE] = PALETTE_WATER
+        buckets[terrain == ROCK_CODE] = PALETTE_ROCK
+        return buckets, occupied.astype(np.float32)
+
+    row_starts = np.arange(0, terrain.shape[0], block)
+    column_starts = np.arange(0, terrain.shape[1], block)
+    def block_sum(values):
+        return np.add.reduceat(np.add.reduceat(values, row_starts, axis=0), column_starts, axis=1)
+
+    soil = terrain == SOIL_CODE
+    cell_count = block_sum(np.ones(terrain.shape, dtype=np.int32))
+    soil_count = block_sum(soil.astype(np.int32))
+    water_count = block_sum((terrain == WATER_CODE).astype(np.int32))
+    rock_count = cell_count - soil_count - water_count
+    mean_water = block_sum(np.where(soil, water_level, 0.0)) / np.maximum(soil_count, 1)
+    water_ratio = mean_water / max_water_level if max_water_level > 0 else np.zeros_like(mean_water)
+    buckets = np.digitize(water_ratio, SOIL_MOISTURE_BUCKET_EDGES).astype(np.uint8) + PALETTE_SOIL_START
+    buckets[(water_count > soil_count) & (water_count >= rock_count)] = PALETTE_WATER
+    buckets[(rock_count > soil_count) & (rock_count > water_count)] = PALETTE_ROCK
+    density = (block_sum(occupied.astype(np.int32)) / cell_count).astype(np.float32)
+    return buckets, density
+
+class TerrainLayer:
+    """지형을 미리 그려 둔 Surface. 토양 수분 단계가 바뀐 셀만 다시 그리고, 변화가 없으면 아무것도 하지 않습니다.
+       source는 마지막으로 그린 버킷의 출처(맵과 토양 version)이며 같으면 다시 그리지 않습니다.
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.surface = pygame.Surface((width * GRID_SIZE, height * GRID_SIZE))
+        self.buckets = None
+        self.source = None
+
+    def refresh(self, map_manager):
+        source = (map_manager, map_manager.soil_field.version)
+        if self.source == source:
+            return # 마지막으로 그린 이후 토양이 바뀌지 않음 (예: 일시정지)
+        self.source = source
+        self.update(compute_terrain_buckets(map_manager.soil_field))
+
+    def update(self, new_buckets):
+        """new_buckets와 달라진 셀만 다시 그립니다. new_buckets는 복사해 두므로 호출한 쪽이 나중에 바꿔도 됩니다."""
+        if self.buckets is None:
+            self._redraw_all(new_buckets)
+        else:
+            changed_ys, changed_xs = np.nonzero(new_buckets != self.buckets)
+            if len(changed_xs) > new_buckets.size * TERRAIN_LAYER_FULL_REDRAW_RATIO:
+                self._redraw_all(new_buckets)
+            else:
+                for x, y, bucket in zip(changed_xs.tolist(), changed_ys.tolist(), new_buckets[changed_ys, changed_xs].tolist()):
+                    self.surface.fill(TERRAIN_PALETTE[bucket], (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+        self.buckets = new_buckets.copy()
+
+    def _redraw_all(self, buckets):
+        """팔레트 조회로 셀당 1픽셀 이미지를 만든 뒤 GRID_SIZE 배율로 확대해 한 번에 그립니다."""
+        cell_pixels = pygame.Surface((self.width, self.height))
+        pygame.surfarray.blit_array(cell_pixels, TERRAIN_PALETTE[buckets].transpose(1, 0, 2)) # surfarray는 [x, y] 순서
+        pygame.transform.scale(cell_pixels, self.surface.get_size(), self.surface)
+
+_terrain_layer = None
+
+def _get_terrain_layer(width, height):
+    global _terrain_layer
+    if _terrain_layer is None or (_terrain_layer.width, _terrain_layer.height) != (width, height):
+        _terrain_layer = TerrainLayer(width, height)
+    return _terrain_layer
 
 def draw_grid(surface, map_manager):
-    # ... (기존 draw_grid 내용 동일) ...
-    for r in range(map_manager.height):
-        for c in range(map_manager.width):
-            tile = map_manager.get_tile(c, r)
-            rect = pygame.Rect(c * GRID_SIZE, r * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            
-            color = (0,0,0) 
-            if tile.terrain_type == TerrainType.WATER:
-                color = TERRAIN_COLORS["WATER"]
-            elif tile.terrain_type == TerrainType.ROCK:
-                color = TERRAIN_COLORS["ROCK"]
-            elif tile.terrain_type == TerrainType.SOIL:
-                water_ratio = tile.water_level / MAX_SOIL_WATER_LEVEL if MAX_SOIL_WATER_LEVEL > 0 else 0
-                if water_ratio < 0.1: 
-                    color = TERRAIN_COLORS["SOIL_DRY"]
-                elif water_ratio < 0.3:
-                    color = TERRAIN_COLORS["SOIL_MOIST_1"]
-                elif water_ratio < 0.6:
-                    color = TERRAIN_COLORS["SOIL_MOIST_2"]
-                elif water_ratio < 0.85:
-                    color = TERRAIN_COLORS["SOIL_MOIST_3"]
-                else: 
-                    color = TERRAIN_COLORS["SOIL_WET"]
-            
-            pygame.draw.rect(surface, color, rect)
+    terrain_layer = _get_terrain_layer(map_manager.width, map_manager.height)
+    terrain_layer.refresh(map_manager)
+    surface.blit(terrain_layer.surface, (0, 0))
+
+def draw_view_terrain(surface, snapshot, camera):
+    """RenderSnapshot의 뷰 범위 지형(묶음당 1픽셀)을 카메라 배율로 확대해 그립니다.
+       식물 밀도가 있으면(낮은 배율) 밀도만큼 지형 색에 섞습니다. 지금 카메라에 보이는 부분만 확대하므로
+       비용은 맵 크기가 아니라 뷰포트 크기에 비례합니다.
+    """
+    x0, y0, _x1, _y1, block = snapshot.view
+    buckets = snapshot.terrain_buckets
+    cell_pixels = camera.cell_pixels
+    # 스냅샷이 카메라보다 늦을 수 있으므로(이동/확대 직후) 스냅샷 중 지금 보이는 묶음 범위만 자름
+    bx0 = max(0, int((camera.x - x0) // block))
+    by0 = max(0, int((camera.y - y0) // block))
+    bx1 = min(buckets.shape[1], math.ceil((camera.x + camera.view_width / cell_pixels - x0) / block))
+    by1 = min(buckets.shape[0], math.ceil((camera.y + camera.view_height / cell_pixels - y0) / block))
+    if bx0 >= bx1 or by0 >= by1:
+        return
+    colors = TERRAIN_PALETTE[buckets[by0:by1, bx0:bx1]]
+    if snapshot.plant_density is not None:
+        weight = snapshot.plant_density[by0:by1, bx0:bx1, None] * CAMERA_DENSITY_BLEND
+        colors = (colors * (1 - weight) + np.array(CAMERA_DENSITY_COLOR) * weight).astype(np.uint8)
+    block_pixels = pygame.Surface((bx1 - bx0, by1 - by0))
+    pygame.surfarray.blit_array(block_pixels, colors.transpose(1, 0, 2)) # surfarray는 [x, y] 순서
+    scale = block * cell_pixels
+    left, top = camera.cell_to_screen(x0 + bx0 * block, y0 + by0 * block)
+    surface.blit(pygame.transform.scale(block_pixels, (round((bx1 - bx0) * scale), round((by1 - by0) * scale))),
+                 (round(left), round(top)))
 
 
 def draw_plants(surface, plant_group):
@@ -46,111 +194,157 @@ def draw_plants(surface, plant_group):
     for plant in plant_group:
         plant.draw(surface)
 
+def draw_view_plants(surface, snapshot, camera):
+    """RenderSnapshot의 뷰 범위 식물을 카메라 배율에 맞춘 크기로 그립니다 (이미지는 크기별로 캐시)."""
+    scale = camera.cell_pixels / GRID_SIZE # 식물 이미지 크기는 GRID_SIZE 기준
+    blits = []
+    for grid_x, grid_y, (state, pixel_size, color) in snapshot.plant_visuals:
+        size = max(1, int(pixel_size * scale))
+        center_x, center_y = camera.cell_to_screen(grid_x + 0.5, grid_y + 0.5)
+        blits.append((get_plant_image(state, size, color), (int(center_x) - size // 2, int(center_y) - size // 2)))
+    surface.blits(blits, doreturn=False)
+
+
+def panel_info(time_manager, climate_manager, map_manager, status=""):
+    """정보 패널에 표시할 값을 사전으로 모읍니다 (화면 스레드로 넘길 수 있도록 시뮬레이션 객체 대신 값만 담음).
+       status는 패널 맨 아래 줄에 보여 줄 최근 조작 결과입니다 (예: 최고 속도 모드 전환, 추적 로그 저장).
+    """
+    stats = map_manager.stats
+    return {
+        "date": time_manager.get_current_date_str(),
+        "total_plants": stats.total_plants,
+        "plant_counts": dict(stats.plant_counts),
+        "avg_soil_water": stats.average_soil_water_level(),
+        "temperature": climate_manager.current_daily_temperature,
+        "rain_info": climate_manager.get_last_rainfall_info_str(),
+        "day_length": climate_manager.get_day_length_ratio(time_manager.current_season) * 24,
+        "status": status,
+    }
 
 def draw_info_panel(surface, time_manager, climate_manager, plant_group, map_manager):
-    # ... (기존 draw_info_panel 내용 동일) ...
-    panel_rect = pygame.Rect(0, GAME_AREA_HEIGHT, SCREEN_WIDTH, INFO_PANEL_HEIGHT)
-    pygame.draw.rect(surface, (30, 30, 30), panel_rect) 
+    draw_panel_info(surface, panel_info(time_manager, climate_manager, map_manager))
 
-    y_offset = GAME_AREA_HEIGHT + 10 
-    
-    time_text = time_manager.get_current_date_str()
-    draw_text(surface, time_text, 10, y_offset, font=INFO_FONT, color=INFO_FONT_COLOR)
+def draw_panel_info(surface, info):
+    """panel_info()로 모은 값을 화면 아래 정보 패널에 그립니다. 표시할 글자가 그대로면 합성해 둔 패널을 다시 씁니다."""
+    plant_counts = info["plant_counts"]
+    texts = (
+        info["date"],
+        f"Total Plants: {info['total_plants']} (Seed: {plant_counts[PlantState.SEED]}, Sapling: {plant_counts[PlantState.SAPLING]}, Adult: {plant_counts[PlantState.ADULT]}, Dead: {plant_counts[PlantState.DEAD]})",
+        f"Avg Soil Water: {info['avg_soil_water']:.1f}mm",
+        f"Current Avg Temp: {info['temperature']:.1f}C",
+        info["rain_info"],
+        f"Day Length: {info['day_length']:.1f} hrs",
+        info["status"],
+    )
+    panel = _get_composite("info_panel", texts, lambda: _compose_info_panel(texts))
+    surface.blit(panel, (0, GAME_AREA_HEIGHT))
+
+def _compose_info_panel(texts):
+    date_text, plant_info_str, soil_water_text, temperature_text, rain_info, day_length_text, status_text = texts
+    info_font = get_font(INFO_FONT_SIZE)
+    panel = pygame.Surface((SCREEN_WIDTH, INFO_PANEL_HEIGHT))
+    panel.fill((30, 30, 30))
+
+    y_offset = 10
+    draw_text(panel, date_text, 10, y_offset, font=info_font, color=INFO_FONT_COLOR)
     y_offset += INFO_LINE_SPACING
 
-    total_plants = len(plant_group)
-    plant_counts = {state: 0 for state in PlantState}
-    for plant in plant_group:
-        plant_counts[plant.current_state] += 1
-    
-    plant_info_str = f"Total Plants: {total_plants} (Seed: {plant_counts[PlantState.SEED]}, Sapling: {plant_counts[PlantState.SAPLING]}, Adult: {plant_counts[PlantState.ADULT]}, Dead: {plant_counts[PlantState.DEAD]})"
-    draw_text(surface, plant_info_str, 10, y_offset, font=INFO_FONT, color=INFO_FONT_COLOR)
+    draw_text(panel, plant_info_str, 10, y_offset, font=info_font, color=INFO_FONT_COLOR)
     y_offset += INFO_LINE_SPACING * 1.5 
 
     left_x_offset = 10
     right_x_offset = SCREEN_WIDTH // 2 + 10
     env_y_offset = y_offset 
 
-    avg_soil_water = map_manager.get_average_soil_water_level()
-    draw_text(surface, f"Avg Soil Water: {avg_soil_water:.1f}mm", left_x_offset, env_y_offset, font=INFO_FONT, color=INFO_FONT_COLOR)
-    
-    current_temp = climate_manager.current_daily_temperature
-    draw_text(surface, f"Current Avg Temp: {current_temp:.1f}C", right_x_offset, env_y_offset, font=INFO_FONT, color=INFO_FONT_COLOR)
+    draw_text(panel, soil_water_text, left_x_offset, env_y_offset, font=info_font, color=INFO_FONT_COLOR)
+    draw_text(panel, temperature_text, right_x_offset, env_y_offset, font=info_font, color=INFO_FONT_COLOR)
     env_y_offset += INFO_LINE_SPACING
 
-    rain_info = climate_manager.get_last_rainfall_info_str()
-    draw_text(surface, rain_info, left_x_offset, env_y_offset, font=INFO_FONT, color=INFO_FONT_COLOR)
-    
-    day_length = climate_manager.get_day_length_ratio(time_manager.current_season) * 24
-    draw_text(surface, f"Day Length: {day_length:.1f} hrs", right_x_offset, env_y_offset, font=INFO_FONT, color=INFO_FONT_COLOR)
+    draw_text(panel, rain_info, left_x_offset, env_y_offset, font=info_font, color=INFO_FONT_COLOR)
+    draw_text(panel, day_length_text, right_x_offset, env_y_offset, font=info_font, color=INFO_FONT_COLOR)
+    env_y_offset += INFO_LINE_SPACING
+
+    if status_text:
+        draw_text(panel, status_text, left_x_offset, env_y_offset, font=info_font, color=INFO_FONT_COLOR)
+    return panel
 
 
 def draw_text(surface, text, x, y, font=None, color=None):
-    # ... (기존 draw_text 내용 동일, INFO_FONT와 INFO_FONT_COLOR를 기본값으로 사용하도록 수정) ...
-    if font is None: font = INFO_FONT
+    """글자를 그립니다. 렌더링한 Surface는 TEXT_CACHE에서 재사용합니다 (기본값: 정보 패널 폰트와 색)."""
+    if font is None: font = get_font(INFO_FONT_SIZE)
     if color is None: color = INFO_FONT_COLOR
-    text_surface = font.render(text, True, color)
-    surface.blit(text_surface, (x, y))
+    surface.blit(TEXT_CACHE.render(font, text, color), (x, y))
 
 # 새로운 함수
 def draw_selected_plant_info(surface, plant_object, start_x, start_y):
-    """선택된 식물의 상세 정보를 화면에 그립니다."""
-    if plant_object is None or not DEBUG_MODE: # DEBUG_MODE가 꺼져있거나 선택된 식물이 없으면 그리지 않음
+    """선택된 식물의 상세 정보를 화면에 그립니다. 표시할 글자와 게이지 길이가 그대로면 합성해 둔 Surface를 다시 씁니다."""
+    if plant_object is None: # 선택된 식물이 없으면 그리지 않음 (디버그 모드 여부는 호출하는 쪽에서 확인)
         return
 
-    current_y = start_y
+    energy_ratio = plant_object.current_energy / plant_object.max_energy_capacity if plant_object.max_energy_capacity > 0 else 0
+    water_ratio = plant_object.current_water / plant_object.max_water_capacity if plant_object.max_water_capacity > 0 else 0
+    health_ratio = plant_object.health / 100.0
+    texts = (
+        f"Plant ID: {plant_object.plant_id}",
+        f"Pos: ({plant_object.grid_x}, {plant_object.grid_y})",
+        f"Energy: {plant_object.current_energy:.2f} / {plant_object.max_energy_capacity:.2f}",
+        f"Water: {plant_object.current_water:.2f} / {plant_object.max_water_capacity:.2f}",
+        f"Health: {plant_object.health:.2f} / 100.0",
+        f"Size: {plant_object.current_size:.4f} (Max: {plant_object.adult_max_size_actual:.3f})",
+        f"State: {plant_object.current_state.value}",
+        f"Age: {plant_object.age} cycles",
+        f"Repro Cooldown: {plant_object.reproduction_cooldown}", # 번식 쿨다운 (추가 정보)
+    )
+    gauge_widths = (int(GAUGE_BAR_WIDTH * energy_ratio), int(GAUGE_BAR_WIDTH * water_ratio), int(GAUGE_BAR_WIDTH * health_ratio))
+    inspector = _get_composite("selected_plant_info", (texts, gauge_widths),
+                               lambda: _compose_selected_plant_info(texts, gauge_widths))
+    surface.blit(inspector, (start_x, start_y))
+
+def _compose_selected_plant_info(texts, gauge_widths):
+    id_text, coord_text, energy_text, water_text, health_text, size_text, state_text, age_text, repro_text = texts
+    energy_width, water_width, health_width = gauge_widths
+    debug_font = get_font(DEBUG_FONT_SIZE)
+    # 배경이 비치도록 투명 Surface에 합성하되, 블릿 비용을 줄이도록 내용이 차지하는 크기로만 만듦
+    width = max(GAUGE_BAR_WIDTH, max(debug_font.size(text)[0] for text in texts))
+    height = (DEBUG_INFO_LINE_SPACING // 1.5 + DEBUG_INFO_LINE_SPACING * 4
+              + (DEBUG_INFO_CATEGORY_SPACING + GAUGE_BAR_HEIGHT + DEBUG_INFO_LINE_SPACING) * 3 + debug_font.get_linesize())
+    inspector = pygame.Surface((width, int(height)), pygame.SRCALPHA)
+    current_y = 0
     
     # 식물 ID 및 좌표
-    id_text = f"Plant ID: {plant_object.plant_id}"
-    coord_text = f"Pos: ({plant_object.grid_x}, {plant_object.grid_y})"
-    draw_text(surface, id_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
+    draw_text(inspector, id_text, 0, current_y, font=debug_font, color=INFO_FONT_COLOR)
     current_y += DEBUG_INFO_LINE_SPACING // 1.5
-    draw_text(surface, coord_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
+    draw_text(inspector, coord_text, 0, current_y, font=debug_font, color=INFO_FONT_COLOR)
     current_y += DEBUG_INFO_LINE_SPACING
 
-    # 에너지
-    energy_ratio = plant_object.current_energy / plant_object.max_energy_capacity if plant_object.max_energy_capacity > 0 else 0
-    energy_text = f"Energy: {plant_object.current_energy:.2f} / {plant_object.max_energy_capacity:.2f}"
-    draw_text(surface, energy_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_CATEGORY_SPACING
-    pygame.draw.rect(surface, GAUGE_BAR_COLORS["BACKGROUND"], (start_x, current_y, GAUGE_BAR_WIDTH, GAUGE_BAR_HEIGHT))
-    pygame.draw.rect(surface, GAUGE_BAR_COLORS["ENERGY"], (start_x, current_y, GAUGE_BAR_WIDTH * energy_ratio, GAUGE_BAR_HEIGHT))
-    current_y += GAUGE_BAR_HEIGHT + DEBUG_INFO_LINE_SPACING
-
-    # 물
-    water_ratio = plant_object.current_water / plant_object.max_water_capacity if plant_object.max_water_capacity > 0 else 0
-    water_text = f"Water: {plant_object.current_water:.2f} / {plant_object.max_water_capacity:.2f}"
-    draw_text(surface, water_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_CATEGORY_SPACING
-    pygame.draw.rect(surface, GAUGE_BAR_COLORS["BACKGROUND"], (start_x, current_y, GAUGE_BAR_WIDTH, GAUGE_BAR_HEIGHT))
-    pygame.draw.rect(surface, GAUGE_BAR_COLORS["WATER"], (start_x, current_y, GAUGE_BAR_WIDTH * water_ratio, GAUGE_BAR_HEIGHT))
-    current_y += GAUGE_BAR_HEIGHT + DEBUG_INFO_LINE_SPACING
-
-    # 건강
-    health_ratio = plant_object.health / 100.0
-    health_text = f"Health: {plant_object.health:.2f} / 100.0"
-    draw_text(surface, health_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_CATEGORY_SPACING
-    pygame.draw.rect(surface, GAUGE_BAR_COLORS["BACKGROUND"], (start_x, current_y, GAUGE_BAR_WIDTH, GAUGE_BAR_HEIGHT))
-    pygame.draw.rect(surface, GAUGE_BAR_COLORS["HEALTH"], (start_x, current_y, GAUGE_BAR_WIDTH * health_ratio, GAUGE_BAR_HEIGHT))
-    current_y += GAUGE_BAR_HEIGHT + DEBUG_INFO_LINE_SPACING
-
-    # 크기
-    size_text = f"Size: {plant_object.current_size:.4f} (Max: {plant_object.adult_max_size_actual:.3f})"
-    draw_text(surface, size_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_LINE_SPACING
+    # 에너지, 물, 건강 (글자 아래 게이지바)
+    for text, width, color in ((energy_text, energy_width, GAUGE_BAR_COLORS["ENERGY"]),
+                               (water_text, water_width, GAUGE_BAR_COLORS["WATER"]),
+                               (health_text, health_width, GAUGE_BAR_COLORS["HEALTH"])):
+        draw_text(inspector, text, 0, current_y, font=debug_font, color=INFO_FONT_COLOR)
+        current_y += DEBUG_INFO_CATEGORY_SPACING
+        pygame.draw.rect(inspector, GAUGE_BAR_COLORS["BACKGROUND"], (0, current_y, GAUGE_BAR_WIDTH, GAUGE_BAR_HEIGHT))
+        pygame.draw.rect(inspector, color, (0, current_y, width, GAUGE_BAR_HEIGHT))
+        current_y += GAUGE_BAR_HEIGHT + DEBUG_INFO_LINE_SPACING
 
-    # 상태
-    state_text = f"State: {plant_object.current_state.value}"
-    draw_text(surface, state_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_LINE_SPACING
+    # 크기, 상태, 나이, 번식 쿨다운
+    for text in (size_text, state_text, age_text, repro_text):
+        draw_text(inspector, text, 0, current_y, font=debug_font, color=INFO_FONT_COLOR)
+        current_y += DEBUG_INFO_LINE_SPACING
+    return inspector
 
-    # 나이
-    age_text = f"Age: {plant_object.age} cycles"
-    draw_text(surface, age_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_LINE_SPACING
-    
-    # 번식 쿨다운 (추가 정보)
-    repro_text = f"Repro Cooldown: {plant_object.reproduction_cooldown}"
-    draw_text(surface, repro_text, start_x, current_y, font=DEBUG_FONT, color=INFO_FONT_COLOR)
-    current_y += DEBUG_INFO_LINE_SPACING
\ No newline at end of file
+def draw_profiler_overlay(surface, profiler):
+    """단계별 소요 시간(최근 표본의 p50/p95/max, ms)을 반투명 패널로 화면 위에 그립니다."""
+    lines = [f"{'phase':<24}{'p50':>8}{'p95':>8}{'max':>8}  (ms)"]
+    for phase, stats in profiler.summary().items():
+        lines.append(f"{phase:<24}{stats['p50_ms']:>8.2f}{stats['p95_ms']:>8.2f}{stats['max_ms']:>8.2f}")
+    debug_font = get_font(DEBUG_FONT_SIZE)
+    rendered = [TEXT_CACHE.render(debug_font, line, INFO_FONT_COLOR) for line in lines]
+    padding = 6
+    line_height = debug_font.get_linesize()
+    panel = pygame.Surface((max(text.get_width() for text in rendered) + padding * 2,
+                            line_height * len(rendered) + padding * 2), pygame.SRCALPHA)
+    panel.fill(PROFILER_OVERLAY_BACKGROUND)
+    for i, text in enumerate(rendered):
+        panel.blit(text, (padding, padding + i * line_height))
+    surface.blit(panel, PROFILER_OVERLAY_POSITION)